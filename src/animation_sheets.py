@@ -0,0 +1,29 @@
+"""
+Feuilles d'animation pré-rendues pour les tuiles animées (portail, power-ups, personnage).
+
+Une feuille contient N images d'une animation cyclique, rendues une seule fois ;
+à l'affichage, l'image est choisie d'après le temps et dessinée en un seul blit.
+"""
+
+
+class AnimationSheet:
+    """
+    Images d'une animation cyclique.
+
+    `render_frame(phase)` dessine l'image pour une phase dans [0, 1) et retourne
+    une surface centrée sur le point d'ancrage de la tuile ; `period` est la durée
+    d'un cycle dans l'unité du temps passé à `blit` (frames, millisecondes...).
+    """
+    def __init__(self, render_frame, frame_count, period=1):
+        self.frames = [render_frame(i / frame_count) for i in range(frame_count)]
+        self.period = period
+        self.half_sizes = [(frame.get_width() // 2, frame.get_height() // 2) for frame in self.frames]
+
+    def frame_index(self, time):
+        return int(time / self.period * len(self.frames)) % len(self.frames)
+
+    def blit(self, surface, center, time=0):
+        """Dessiner l'image correspondant à `time`, centrée sur `center`."""
+        index = self.frame_index(time)
+        half_width, half_height = self.half_sizes[index]
+        return surface.blit(self.frames[index], (center[0] - half_width, center[1] - half_height))
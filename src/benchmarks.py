@@ -0,0 +1,672 @@
+"""
+Micro-benchmarks des optimisations du jeu.
+
+Usage : python benchmarks.py [nom ...]   (sans argument : tous les benchmarks)
+"""
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+SCREEN_WIDTH = 1280
+SCREEN_HEIGHT = 720
+
+
+def _best_time_ms(func, repeat=5):
+    """Meilleur temps d'exécution de `func` sur `repeat` essais, en millisecondes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _report(name, legacy_ms, new_ms):
+    speedup = legacy_ms / new_ms if new_ms > 0 else float("inf")
+    print(f"  {name:<32} avant: {legacy_ms:8.2f} ms   après: {new_ms:8.2f} ms   x{speedup:.1f}")
+
+
+# --- Textures procédurales -------------------------------------------------
+
+def _legacy_gradient(width, height, color1, color2):
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    for y in range(height):
+        ratio = y / height
+        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
+        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
+        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
+        pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+    return surface
+
+
+def _legacy_dots(surface, count, color, alpha_range):
+    width, height = surface.get_size()
+    for _ in range(count):
+        x = random.randint(0, width)
+        y = random.randint(0, height)
+        radius = random.randint(1, 3)
+        alpha = random.randint(*alpha_range)
+        pygame.draw.circle(surface, (*color, alpha), (x, y), radius)
+    return surface
+
+
+def _legacy_vignette(width, height):
+    vignette = pygame.Surface((width, height), pygame.SRCALPHA)
+    for i in range(100):
+        pygame.draw.rect(vignette, (0, 0, 0, int(i * 1.5)), (i, i, width - 2 * i, height - 2 * i), 1)
+    return vignette
+
+
+def bench_textures():
+    """Dégradés, motifs et vignettes : boucles Python contre surfarray, et temps jusqu'à la première frame."""
+    import procedural_textures
+    from modern_background_optimized import EnhancedParallaxBackground
+
+    dark_blue, medium_blue, light_blue = (18, 30, 49), (32, 60, 86), (96, 165, 250)
+    print("Textures procédurales (%dx%d)" % (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    _report("dégradé vertical",
+            _best_time_ms(lambda: _legacy_gradient(SCREEN_WIDTH, SCREEN_HEIGHT, dark_blue, medium_blue)),
+            _best_time_ms(lambda: procedural_textures.linear_gradient(SCREEN_WIDTH, SCREEN_HEIGHT, dark_blue, medium_blue)))
+
+    target = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    _report("motif de 300 points",
+            _best_time_ms(lambda: _legacy_dots(target, 300, light_blue, (5, 20))),
+            _best_time_ms(lambda: procedural_textures.scatter_dots(target, 300, light_blue, alpha_range=(5, 20))))
+
+    _report("vignette",
+            _best_time_ms(lambda: _legacy_vignette(SCREEN_WIDTH, SCREEN_HEIGHT)),
+            _best_time_ms(lambda: procedural_textures.vignette(SCREEN_WIDTH, SCREEN_HEIGHT)))
+
+    def legacy_startup():
+        base = _legacy_dots(_legacy_gradient(SCREEN_WIDTH, SCREEN_HEIGHT, dark_blue, medium_blue), 200, light_blue, (5, 20))
+        vignette = _legacy_vignette(SCREEN_WIDTH, SCREEN_HEIGHT)
+        menu_background = _legacy_dots(_legacy_gradient(SCREEN_WIDTH, SCREEN_HEIGHT, (20, 40, 80), (90, 120, 200)),
+                                       300, (236, 240, 241), (10, 40))
+        return base, vignette, menu_background
+
+    def new_startup():
+        base = procedural_textures.scatter_dots(
+            procedural_textures.linear_gradient(SCREEN_WIDTH, SCREEN_HEIGHT, dark_blue, medium_blue),
+            200, light_blue, alpha_range=(5, 20))
+        vignette = procedural_textures.vignette(SCREEN_WIDTH, SCREEN_HEIGHT)
+        menu_background = procedural_textures.scatter_dots(
+            procedural_textures.linear_gradient(SCREEN_WIDTH, SCREEN_HEIGHT, (20, 40, 80), (90, 120, 200), srcalpha=False),
+            300, (236, 240, 241), alpha_range=(10, 40))
+        return base, vignette, menu_background
+
+    _report("textures de démarrage", _best_time_ms(legacy_startup, 3), _best_time_ms(new_startup, 3))
+
+    from ui_enhancements import UIEffects
+    ui_effects = UIEffects(SCREEN_WIDTH, SCREEN_HEIGHT)
+    _report("fond animé du menu (par frame)",
+            _best_time_ms(lambda: _legacy_gradient(SCREEN_WIDTH, SCREEN_HEIGHT, (41, 128, 185), (52, 152, 219))),
+            _best_time_ms(lambda: ui_effects.create_animated_background(SCREEN_WIDTH, SCREEN_HEIGHT, "blue")))
+
+    screen = pygame.display.get_surface()
+
+    def first_frame():
+        background = EnhancedParallaxBackground(SCREEN_WIDTH, SCREEN_HEIGHT)
+        background.draw(screen)
+
+    print(f"  {'première frame (fond complet)':<32} {_best_time_ms(first_frame, 3):8.2f} ms")
+
+
+# --- Texte du HUD -----------------------------------------------------------
+
+def bench_hud_text():
+    """Texte néon du HUD dont la valeur change à chaque frame : rendu complet contre atlas de glyphes."""
+    from main_fixed import UIEffects
+    from glyph_atlas import GlyphAtlas
+
+    font = pygame.font.SysFont("Arial", 24)
+    screen = pygame.display.get_surface()
+    ui_effects = UIEffects(SCREEN_WIDTH, SCREEN_HEIGHT)
+    atlas = GlyphAtlas(font, (255, 255, 255), (0, 100, 255), 3)
+    print("Texte du HUD (4 valeurs qui changent)")
+
+    frame = [0]
+
+    def legacy_frame():
+        frame[0] += 1
+        for label in ("Niveau", "Score", "Temps", "Pas"):
+            text = ui_effects.create_neon_text(f"{label}: {frame[0]}", font, (255, 255, 255), (0, 100, 255), 3)
+            screen.blit(text, (20, 20))
+
+    def atlas_frame():
+        frame[0] += 1
+        for label in ("Niveau", "Score", "Temps", "Pas"):
+            atlas.draw(screen, f"{label}: {frame[0]}", (20, 20))
+
+    atlas_frame()  # Pré-rendre les glyphes
+    _report("HUD par frame", _best_time_ms(legacy_frame, 20), _best_time_ms(atlas_frame, 20))
+
+
+# --- Minimap ----------------------------------------------------------------
+
+def _legacy_minimap_grid(surface, grid, width, height):
+    cell_width = (width - 10) / len(grid[0])
+    cell_height = (height - 10) / len(grid)
+    for y, row in enumerate(grid):
+        for x, cell in enumerate(row):
+            if cell == 1:
+                pygame.draw.rect(surface, (100, 100, 100), (5 + x * cell_width, 5 + y * cell_height, cell_width, cell_height))
+
+
+def bench_minimap():
+    """Minimap par frame : grille redessinée case par case contre grille cuite une fois par niveau."""
+    from main_fixed import UIEffects
+
+    rng = random.Random(1)
+    ui_effects = UIEffects(SCREEN_WIDTH, SCREEN_HEIGHT)
+    screen = pygame.display.get_surface()
+    print("Minimap (200x150)")
+    for cols, rows in ((21, 15), (101, 81), (301, 201)):
+        grid = [[1 if rng.random() < 0.4 else 0 for _ in range(cols)] for _ in range(rows)]
+
+        def legacy_frame():
+            minimap = pygame.Surface((200, 150), pygame.SRCALPHA)
+            _legacy_minimap_grid(minimap, grid, 200, 150)
+            screen.blit(minimap, (10, 10))
+
+        def baked_frame():
+            ui_effects.draw_minimap(screen, (10, 10), 200, 150, (1, 1), grid, (0, 0, 10, 10))
+
+        baked_frame()  # Cuisson du niveau
+        _report(f"grille {cols}x{rows}", _best_time_ms(legacy_frame, 3), _best_time_ms(baked_frame, 20))
+
+
+# --- Bloom -------------------------------------------------------------------
+
+def _legacy_object_glow(surface, x, y, size, color):
+    glow_size = size * 2
+    glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+    for radius in range(size, glow_size):
+        alpha = 150 - (radius - size) * (150 / (glow_size - size))
+        pygame.draw.circle(glow_surface, (*color, int(alpha)), (glow_size, glow_size), radius)
+    surface.blit(glow_surface, (x - glow_size, y - glow_size))
+
+
+def bench_bloom():
+    """Lueur par frame : boucle de cercles par objet contre une passe de bloom plein écran."""
+    from bloom import BloomPass
+
+    rng = random.Random(1)
+    screen = pygame.display.get_surface()
+    bloom = BloomPass(SCREEN_WIDTH, SCREEN_HEIGHT)
+    print("Bloom (%dx%d)" % (SCREEN_WIDTH, SCREEN_HEIGHT))
+    for count in (10, 50, 200):
+        objects = [(rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT)) for _ in range(count)]
+
+        def legacy_frame():
+            for x, y in objects:
+                _legacy_object_glow(screen, x, y, 10, (0, 255, 0))
+
+        def bloom_frame():
+            for x, y in objects:
+                pygame.draw.circle(screen, (0, 255, 0), (x, y), 10)
+            bloom.apply(screen)
+
+        screen.fill((0, 0, 0))
+        _report(f"{count} objets lumineux", _best_time_ms(legacy_frame, 5), _best_time_ms(bloom_frame, 5))
+
+
+# --- Météo -------------------------------------------------------------------
+
+def bench_weather():
+    """Pluie par frame : mise à jour et blit goutte par goutte contre tableaux numpy et tampons."""
+    from weather import WeatherSystem, MAX_PARTICLES
+
+    rng = random.Random(1)
+    screen = pygame.display.get_surface()
+    weather = WeatherSystem(SCREEN_WIDTH, SCREEN_HEIGHT, seed=1)
+    streaks = weather.stamp_sets["rain"].surfaces
+    print("Pluie (%dx%d, mise à jour + dessin)" % (SCREEN_WIDTH, SCREEN_HEIGHT))
+    for count in (1500, MAX_PARTICLES):
+        drops = [[rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), rng.uniform(9, 15), rng.randrange(4)]
+                 for _ in range(count)]
+
+        def legacy_frame():
+            for drop in drops:
+                drop[0] = (drop[0] - 1.5) % SCREEN_WIDTH
+                drop[1] += drop[2]
+                if drop[1] > SCREEN_HEIGHT:
+                    drop[1] -= SCREEN_HEIGHT + 20
+                screen.blit(streaks[drop[3]], (int(drop[0]), int(drop[1])))
+
+        def vectorized_frame():
+            weather.update()
+            weather.draw_particles(screen)
+
+        weather.set_weather("rain", count)
+        screen.fill((0, 0, 0))
+        _report(f"{count} gouttes", _best_time_ms(legacy_frame, 10), _best_time_ms(vectorized_frame, 50))
+
+    # Voile : tuile répétée à chaque frame contre voile pré-tuilé en un seul blit défilant
+    tile = weather._render_tile("rain")
+
+    def legacy_overlay():
+        for tile_x in range(0, SCREEN_WIDTH, tile.get_width()):
+            for tile_y in range(0, SCREEN_HEIGHT, tile.get_height()):
+                screen.blit(tile, (tile_x, tile_y))
+
+    area = pygame.Rect(17, 33, SCREEN_WIDTH, SCREEN_HEIGHT)
+    _report("voile", _best_time_ms(legacy_overlay, 10), _best_time_ms(lambda: screen.blit(weather.overlay, (0, 0), area), 10))
+
+
+# --- Dangers mobiles -----------------------------------------------------------
+
+def _legacy_chaser_step(grid, start, goal):
+    """Premier pas du plus court chemin de `start` vers `goal` (un BFS par poursuivant)."""
+    from collections import deque
+
+    rows, cols = len(grid), len(grid[0])
+    came_from = {start: None}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        if cell == goal:
+            break
+        x, y = cell
+        for neighbor in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            nx, ny = neighbor
+            if 0 <= nx < cols and 0 <= ny < rows and grid[ny][nx] == 0 and neighbor not in came_from:
+                came_from[neighbor] = cell
+                queue.append(neighbor)
+    if goal not in came_from:
+        return start
+    cell = goal
+    while came_from[cell] not in (start, None):
+        cell = came_from[cell]
+    return cell
+
+
+def bench_hazards():
+    """Poursuivants par tick : un BFS par poursuivant contre un champ de flux partagé (numpy)."""
+    from hazards import HazardSwarm
+
+    rng = random.Random(1)
+    cols, rows = 40, 30
+    grid = [[1 if rng.random() < 0.25 else 0 for _ in range(cols)] for _ in range(rows)]
+    player = (cols // 2, rows // 2)
+    grid[player[1]][player[0]] = 0
+    print("Poursuivants (grille %dx%d)" % (cols, rows))
+    for count in (100, 500):
+        swarm = HazardSwarm(32, 30, speed=1.0)
+        swarm.reset(grid, count, player)
+        chasers = [(int(cell) % cols, int(cell) // cols) for cell in swarm.cells]
+
+        def legacy_tick():
+            for i, chaser in enumerate(chasers):
+                chasers[i] = _legacy_chaser_step(grid, chaser, player)
+
+        legacy_ms = _best_time_ms(legacy_tick, 2)
+        _report(f"{count} poursuivants", legacy_ms, _best_time_ms(lambda: swarm.update(grid, player, count), 20))
+
+    # Joueur qui change de case à chaque tick : le champ de flux est recalculé à chaque fois
+    road = [(x, y) for y in range(rows) for x in range(cols) if grid[y][x] == 0]
+    targets = iter(road * 100)
+    _report("500, joueur en mouvement", legacy_ms, _best_time_ms(lambda: swarm.update(grid, next(targets), 500), 20))
+
+
+# --- Murs destructibles ----------------------------------------------------------
+
+def bench_walls():
+    """Mur posé puis détruit : champ de distances recalculé en entier contre réparé localement."""
+    from flow_field import FlowField
+
+    rng = random.Random(1)
+    print("Murs destructibles (par changement de case)")
+    for cols, rows in ((40, 30), (80, 60), (160, 120)):
+        grid = [[1 if rng.random() < 0.25 else 0 for _ in range(cols)] for _ in range(rows)]
+        target = (cols // 2, rows // 2)
+        for x, y in (target, (target[0] - 1, target[1]), (target[0] + 1, target[1])):
+            grid[y][x] = 0
+        road = [(x, y) for y in range(rows) for x in range(cols) if grid[y][x] == 0 and (x, y) != target]
+        cells = rng.sample(road, 50)
+        flips = 2 * len(cells)
+
+        full_field = FlowField(grid)
+        full_field.set_target(target)
+
+        def full_recompute():
+            for cell in cells:
+                for passable in (False, True):
+                    full_field.passable[full_field.cell_index(cell)] = passable
+                    full_field._passable_list[full_field.cell_index(cell)] = passable
+                    full_field.target = None
+                    full_field.set_target(target)
+
+        field = FlowField(grid)
+        field.set_target(target)
+
+        def repair():
+            for cell in cells:
+                field.set_passable(cell, False)
+                field.set_passable(cell, True)
+
+        legacy_ms = _best_time_ms(full_recompute, 3) / flips
+        new_ms = _best_time_ms(repair, 3) / flips
+        repaired = field.repaired_cells / (3 * flips)
+        _report(f"{cols}x{rows} (~{repaired:.0f} cases réparées)", legacy_ms, new_ms)
+
+
+# --- Scores ----------------------------------------------------------------------
+
+def _legacy_save_and_best(scores_file, score):
+    """Ancien ScoreManager : relire et réécrire tout le JSON, puis parcourir l'historique."""
+    import json
+    with open(scores_file) as f:
+        data = json.load(f)
+    data["scores"].append({"score": score, "timestamp": time.time(), "difficulty": "Normal", "time_played": 60})
+    data["statistics"]["games_played"] += 1
+    with open(scores_file, "w") as f:
+        json.dump(data, f)
+    month_ago = time.time() - 30 * 86400
+    return max((s["score"] for s in data["scores"] if s["timestamp"] >= month_ago), default=0)
+
+
+def bench_scores():
+    """Partie sauvegardée puis meilleurs scores : JSON complet réécrit contre journal et index."""
+    import json
+    import tempfile
+    from score_manager import ScoreManager
+
+    print("Scores (sauvegarde + meilleurs scores)")
+    for count in (1000, 10000, 100000):
+        with tempfile.TemporaryDirectory() as directory:
+            now = time.time()
+            history = [{"score": random.randint(0, 5000), "timestamp": now - random.uniform(0, 90 * 86400),
+                        "difficulty": "Normal", "time_played": 60} for _ in range(count)]
+            scores_file = os.path.join(directory, "scores.json")
+            with open(scores_file, "w") as f:
+                json.dump({"scores": history, "statistics": {"games_played": count, "total_time": 60 * count}}, f)
+            manager = ScoreManager(directory)
+
+            def indexed():
+                manager.save_score(random.randint(0, 5000), "Normal", 60)
+                manager.get_best_scores()
+                manager.get_statistics()
+
+            def indexed_and_written():
+                indexed()
+                manager.flush()
+
+            legacy_ms = _best_time_ms(lambda: _legacy_save_and_best(scores_file, random.randint(0, 5000)), 3)
+            _report(f"{count} parties, écriture incluse", legacy_ms, _best_time_ms(indexed_and_written, 5))
+            # Ce que voit la frame : l'écriture part dans le thread de persistance
+            _report(f"{count} parties, thread de jeu", legacy_ms, _best_time_ms(indexed, 5))
+            manager.close()
+
+
+def _legacy_save(scores_file, score):
+    """Ancien ScoreManager.save_score : relire et réécrire tout le JSON."""
+    import json
+    with open(scores_file) as f:
+        data = json.load(f)
+    data["scores"].append({"score": score, "timestamp": time.time(), "difficulty": "Normal", "time_played": 60})
+    data["statistics"]["games_played"] += 1
+    data["statistics"]["total_time"] += 60
+    with open(scores_file, "w") as f:
+        json.dump(data, f)
+
+
+def _legacy_best_and_statistics(scores_file):
+    """Anciens get_best_scores + get_statistics : deux lectures du JSON et un parcours de l'historique."""
+    import json
+    from datetime import datetime, timedelta
+    with open(scores_file) as f:
+        data = json.load(f)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    limits = {"today": today, "week": today - timedelta(days=7), "month": today - timedelta(days=30)}
+    best = {period: 0 for period in limits}
+    best["all_time"] = 0
+    for entry in data["scores"]:
+        score_time = datetime.fromtimestamp(entry["timestamp"])
+        best["all_time"] = max(best["all_time"], entry["score"])
+        for period, limit in limits.items():
+            if score_time >= limit:
+                best[period] = max(best[period], entry["score"])
+    with open(scores_file) as f:
+        return best, json.load(f)["statistics"]
+
+
+def bench_score_backends():
+    """Écriture d'un score et requêtes get_best_scores/get_statistics : ancien JSON unique contre journal et SQLite."""
+    import json
+    import tempfile
+    from score_manager import ScoreManager, SQLiteScoreManager
+
+    print("Stockage des scores (ancien JSON contre journal + index et SQLite)")
+    for count in (10000, 100000, 1000000):
+        repeat = 1 if count >= 1000000 else 3
+        with tempfile.TemporaryDirectory() as directory:
+            now = time.time()
+            history = [{"score": random.randint(0, 5000), "timestamp": now - random.uniform(0, 365 * 86400),
+                        "difficulty": random.choice(("Easy", "Normal", "Hard")), "time_played": 60}
+                       for _ in range(count)]
+            with open(os.path.join(directory, "scores.log"), "w") as f:
+                for entry in history:
+                    f.write(json.dumps(entry) + "\n")
+            legacy_dir = os.path.join(directory, "legacy")
+            os.makedirs(legacy_dir)
+            scores_file = os.path.join(legacy_dir, "scores.json")
+            with open(scores_file, "w") as f:
+                json.dump({"scores": history, "statistics": {"games_played": count, "total_time": 60 * count}}, f)
+            del history
+            log_manager = ScoreManager(directory)
+            sqlite_manager = SQLiteScoreManager(directory)
+
+            # Travail du thread de persistance, mesuré directement
+            def insert(manager):
+                return lambda: manager.write_entries([{"score": random.randint(0, 5000), "timestamp": time.time(),
+                                                       "difficulty": "Normal", "time_played": 60}])
+
+            def query(manager):
+                def run():
+                    manager.get_best_scores()
+                    manager.get_best_scores("Hard")
+                    manager.get_statistics()
+                return run
+
+            legacy_insert = _best_time_ms(lambda: _legacy_save(scores_file, random.randint(0, 5000)), repeat)
+            _report(f"{count} lignes, insert. journal", legacy_insert, _best_time_ms(insert(log_manager), 5))
+            _report(f"{count} lignes, insert. SQLite", legacy_insert, _best_time_ms(insert(sqlite_manager), 5))
+            legacy_query = _best_time_ms(lambda: _legacy_best_and_statistics(scores_file), repeat)
+            _report(f"{count} lignes, requêtes journal", legacy_query, _best_time_ms(query(log_manager), 20))
+            _report(f"{count} lignes, requêtes SQLite", legacy_query, _best_time_ms(query(sqlite_manager), 20))
+            # Démarrage : construction de l'index en mémoire (l'ancien JSON n'en avait pas)
+            _report(f"{count} lignes, index jnl/SQLite",
+                    _best_time_ms(log_manager.load_index, 5), _best_time_ms(sqlite_manager.load_index, 5))
+            log_manager.close()
+            sqlite_manager.close()
+
+
+def bench_leaderboard():
+    """Top 10 et rang centile : fichier relu et trié à chaque frame contre structures triées incrémentales."""
+    from score_manager import Leaderboard
+
+    print("Classement (top 10 de la semaine + rang centile)")
+    for count in (1000, 10000, 100000):
+        now = time.time()
+        entries = [{"score": random.randint(0, 5000), "timestamp": now - random.uniform(0, 90 * 86400),
+                    "difficulty": random.choice(("Easy", "Normal", "Hard")), "time_played": 60} for _ in range(count)]
+        lines = [f"Joueur,{entry['score']},{entry['timestamp']}" for entry in entries]
+
+        def legacy():
+            # Comme l'ancien écran des scores : relire toutes les lignes et trier
+            scores = []
+            for line in lines:
+                parts = line.split(",")
+                scores.append((int(parts[1]), float(parts[2])))
+            week_ago = now - 8 * 86400
+            recent = sorted((s for s in scores if s[1] >= week_ago), reverse=True)[:10]
+            all_scores = sorted(score for score, _ in scores)
+            return recent, sum(1 for score in all_scores if score < 2500) / len(all_scores)
+
+        leaderboard = Leaderboard(entries)
+
+        def indexed():
+            return leaderboard.top_scores(10, period="week"), leaderboard.percentile_rank(2500)
+
+        _report(f"{count} scores", _best_time_ms(legacy, 3), _best_time_ms(indexed, 5))
+
+
+def bench_sync():
+    """Envoi des scores vers un classement lent : requête bloquante par score contre file et lots en arrière-plan."""
+    import http.client
+    import json
+    import tempfile
+    from leaderboard_sync import LeaderboardSync, StubLeaderboardServer
+
+    print("Classement en ligne (serveur local, 50 ms par requête, 20 scores)")
+    server = StubLeaderboardServer(delay=0.05).start()
+    entries = [{"score": random.randint(0, 5000), "timestamp": time.time(), "difficulty": "Normal", "time_played": 60}
+               for _ in range(20)]
+
+    def legacy():
+        # Une connexion et une requête par score, dans la boucle de jeu
+        for entry in entries:
+            connection = http.client.HTTPConnection("127.0.0.1", server.server.server_address[1], timeout=5)
+            connection.request("POST", "/scores", json.dumps({"scores": [entry]}), {"Content-Type": "application/json"})
+            connection.getresponse().read()
+            connection.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        client = LeaderboardSync(server.url, os.path.join(directory, "outbox.jsonl"))
+
+        def submit():
+            for entry in entries:
+                client.submit(entry)
+
+        legacy_ms = _best_time_ms(legacy, 1)
+        _report("thread de jeu", legacy_ms, _best_time_ms(submit, 1))
+        start = time.perf_counter()
+        client.wait_until_sent(10)
+        _report("jusqu'à réception", legacy_ms, (time.perf_counter() - start) * 1000)
+        print(f"  {client.requests} requêtes sur {server.connections - 20} connexion(s) pour le client")
+        client.close()
+    server.stop()
+
+
+def bench_sound_bank():
+    """Effet joué : fichier décodé à chaque lecture contre banque préchargée à voix limitées."""
+    import tempfile
+    import wave
+    from sound_bank import SoundBank
+
+    pygame.mixer.init()
+    print("Effets sonores (20 lectures d'un effet d'une seconde)")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "effect.wav")
+        with wave.open(path, "wb") as f:
+            f.setnchannels(2)
+            f.setsampwidth(2)
+            f.setframerate(44100)
+            f.writeframes(bytes(44100 * 4))
+
+        def legacy():
+            # Comme l'ancien play_victory : Sound reconstruit depuis le disque à chaque lecture
+            for _ in range(20):
+                pygame.mixer.Channel(1).play(pygame.mixer.Sound(path))
+
+        bank = SoundBank()
+        bank.load("effect", path, "pickup")
+
+        def banked():
+            for _ in range(20):
+                bank.play("effect")
+
+        _report("lecture", _best_time_ms(legacy, 3), _best_time_ms(banked, 3))
+        print(f"  voix volées : {bank.steals} sur {bank.plays} lectures")
+        bank.stop()
+
+
+def bench_synth():
+    """Effets de secours au démarrage : synthèse NumPy complète contre relecture du cache WAV."""
+    import tempfile
+    import sound_synth
+
+    pygame.mixer.init()
+    print(f"Effets synthétisés ({len(sound_synth.RECIPES)} effets)")
+    with tempfile.TemporaryDirectory() as directory:
+        def synthesize():
+            for name in sound_synth.RECIPES:
+                sound_synth.to_sound(sound_synth.synthesize(name, pygame.mixer.get_init()[0]))
+
+        def cached():
+            for name in sound_synth.RECIPES:
+                sound_synth.load_effect(name, directory)
+
+        cached()  # Premier lancement : remplit le cache
+        _report("chargement", _best_time_ms(synthesize, 3), _best_time_ms(cached, 3))
+
+
+def bench_input():
+    """Survol du menu : gestionnaire appelé à chaque MOUSEMOTION contre un seul par frame."""
+    from input_queue import InputQueue
+
+    rects = [pygame.Rect(SCREEN_WIDTH // 2 - 150, 250 + i * 90, 300, 70) for i in range(4)]
+    hover = [False] * len(rects)
+    # Une frame après un geste rapide : souris à 1000 Hz, quelques touches
+    events = [pygame.event.Event(pygame.MOUSEMOTION, pos=(i * 3, 300 + i), rel=(3, 1), buttons=(0, 0, 0)) for i in range(200)]
+    events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP, mod=0, unicode="", scancode=0))
+    print(f"Entrées ({len(events)} événements dans une frame, {len(rects)} boutons)")
+
+    def handle(event):
+        if event.type == pygame.MOUSEMOTION:
+            for i, rect in enumerate(rects):
+                hover[i] = rect.collidepoint(event.pos)
+
+    def legacy():
+        for event in events:
+            handle(event)
+
+    queue = InputQueue()
+
+    def coalesced():
+        for event in queue.poll(events):
+            handle(event)
+        queue.awaiting.clear()
+
+    _report("survols par frame", _best_time_ms(legacy, 20), _best_time_ms(coalesced, 20))
+
+
+BENCHMARKS = {
+    "textures": bench_textures,
+    "hud_text": bench_hud_text,
+    "minimap": bench_minimap,
+    "bloom": bench_bloom,
+    "weather": bench_weather,
+    "hazards": bench_hazards,
+    "walls": bench_walls,
+    "scores": bench_scores,
+    "score_backends": bench_score_backends,
+    "leaderboard": bench_leaderboard,
+    "sync": bench_sync,
+    "sound_bank": bench_sound_bank,
+    "synth": bench_synth,
+    "input": bench_input,
+}
+
+
+def main(names):
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            print(f"Benchmark inconnu : {name} (disponibles : {', '.join(BENCHMARKS)})")
+            continue
+        BENCHMARKS[name]()
+        print()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,116 @@
+"""
+Bloom plein écran en une seule passe (post-traitement optionnel).
+
+Au lieu d'une lueur dessinée objet par objet, la frame est réduite au huitième de
+sa résolution, ses pixels lumineux sont extraits puis floutés par un filtre
+gaussien séparable vectorisé (numpy), et le résultat est agrandi et ajouté à la
+frame. Le coût est constant par frame, quel que soit le nombre d'objets lumineux,
+mais élevé : 5,6 à 6,6 ms en 1280x720, contre 0,3 ms pour 10 lueurs dessinées
+une à une et 1,4 ms pour 50 ; il ne rattrape les lueurs par objet que vers 200.
+Le bloom est donc désactivé par défaut (`settings.BLOOM_ENABLED`, touche B en jeu)
+et les lueurs par objet restent le rendu normal.
+"""
+import pygame
+import numpy
+
+def gaussian_kernel(radius):
+    """Noyau gaussien 1D normalisé de 2 * radius + 1 coefficients."""
+    sigma = max(radius / 2, 0.5)
+    offsets = numpy.arange(-radius, radius + 1, dtype=numpy.float32)
+    kernel = numpy.exp(-(offsets ** 2) / (2 * sigma ** 2))
+    return kernel / kernel.sum()
+
+
+def separable_blur(pixels, kernel):
+    """Flouter un tableau (largeur, hauteur, canaux) par deux passes 1D, horizontale puis verticale."""
+    radius = len(kernel) // 2
+    for axis in (0, 1):
+        length = pixels.shape[axis]
+        padded_shape = list(pixels.shape)
+        padded_shape[axis] += 2 * radius
+        padded = numpy.empty(padded_shape, dtype=pixels.dtype)
+
+        # Copie avec bords étendus (équivalent de numpy.pad en mode "edge")
+        moved = numpy.moveaxis(padded, axis, 0)
+        source = numpy.moveaxis(pixels, axis, 0)
+        moved[radius:radius + length] = source
+        moved[:radius] = source[:1]
+        moved[radius + length:] = source[-1:]
+
+        # Somme pondérée de vues décalées du tableau (aucune boucle par pixel)
+        blurred = moved[:length] * kernel[0]
+        for offset in range(1, len(kernel)):
+            blurred += moved[offset:offset + length] * kernel[offset]
+        pixels = numpy.moveaxis(blurred, 0, axis)
+    return pixels
+
+
+class BloomPass:
+    """
+    Passe de bloom pour une surface de taille fixe (l'écran).
+
+    `threshold` est l'intensité (composante la plus forte) à partir de laquelle un pixel brille,
+    `intensity` le facteur appliqué à la lueur avant de l'ajouter à la frame.
+    Seuil et flou travaillent à 1/`downscale` de la résolution (puissance de 2) :
+    un flou de rayon 1 au huitième s'étale comme un flou de rayon 2 au quart.
+    """
+    def __init__(self, width, height, threshold=180, intensity=1.5, radius=1, downscale=8):
+        self.size = (width, height)
+        # Tailles intermédiaires par moitiés successives, de la mi-résolution à la plus petite
+        self.levels = []
+        factor = 2
+        while factor <= downscale:
+            self.levels.append((max(1, width // factor), max(1, height // factor)))
+            factor *= 2
+        self.small_size = self.levels[-1]
+        self.threshold = threshold
+        self.intensity = intensity
+        self.kernel = gaussian_kernel(radius)
+        # Surfaces de travail, créées au format de la première frame traitée
+        self.down = None
+        self.up = None
+        self.glow = None
+
+    def _create_buffers(self, surface):
+        self.down = [pygame.Surface(size, 0, surface) for size in self.levels]
+        self.up = [pygame.Surface(size, 0, surface) for size in self.levels]
+        self.glow = pygame.Surface(self.size, 0, surface)
+
+    def extract(self, surface):
+        """Pixels lumineux de `surface` à la plus petite résolution, floutés (tableau float32, None si aucun)."""
+        if self.down is None:
+            self._create_buffers(surface)
+        # Réduction rapide (plus proche voisin) à mi-résolution, puis filtrée par moitiés
+        pygame.transform.scale(surface, self.levels[0], self.down[0])
+        for source, target in zip(self.down, self.down[1:]):
+            pygame.transform.smoothscale(source, target.get_size(), target)
+
+        pixels = pygame.surfarray.array3d(self.down[-1])
+
+        # Seuil doux sur la composante la plus forte : les couleurs saturées
+        # (néons verts, jaunes) brillent autant que le blanc
+        brightness = numpy.maximum(numpy.maximum(pixels[..., 0], pixels[..., 1]), pixels[..., 2])
+        if brightness.max() <= self.threshold:
+            return None
+        weight = brightness.astype(numpy.float32)
+        weight -= self.threshold
+        weight *= 1 / (255 - self.threshold)
+        numpy.clip(weight, 0, 1, out=weight)
+        bright = pixels * weight[..., None]
+        return separable_blur(bright, self.kernel)
+
+    def apply(self, surface):
+        """Ajouter le bloom à `surface` (en place)."""
+        bright = self.extract(surface)
+        if bright is None:
+            return
+        bright *= self.intensity
+        numpy.clip(bright, 0, 255, out=bright)
+        pygame.surfarray.blit_array(self.up[-1], bright.astype(numpy.uint8))
+
+        # Agrandissement filtré jusqu'à mi-résolution puis doublement rapide : la lueur
+        # floutée n'a pas de détail qu'un plus proche voisin pourrait abîmer
+        for source, target in zip(self.up[:0:-1], self.up[-2::-1]):
+            pygame.transform.smoothscale(source, target.get_size(), target)
+        pygame.transform.scale(self.up[0], self.size, self.glow)
+        surface.blit(self.glow, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
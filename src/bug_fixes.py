@@ -1,6 +1,7 @@
 import pygame
 import sys
 import os
+from font_registry import get_font
 
 # Classe pour gérer la navigation entre les menus
 class MenuNavigationManager:
@@ -140,19 +141,14 @@ class ResourceManager:
         return self.sounds.get(name)
         
     def load_font(self, name, path, size):
-        """Charger une police et la stocker dans le cache"""
+        """Charger une police (via le registre partagé) et la stocker dans le cache"""
         try:
-            if os.path.exists(path):
-                font = pygame.font.Font(path, size)
-            else:
-                font = pygame.font.SysFont(path, size)
-            self.fonts[(name, size)] = font
-            return font
+            font = get_font(path, size)
         except pygame.error as e:
             print(f"Erreur lors du chargement de la police {path}: {e}")
-            font = pygame.font.SysFont('arial', size)
-            self.fonts[(name, size)] = font
-            return font
+            font = get_font('arial', size)
+        self.fonts[(name, size)] = font
+        return font
             
     def get_font(self, name, size):
         """Récupérer une police du cache"""
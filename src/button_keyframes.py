@@ -0,0 +1,72 @@
+"""
+Images clés pré-rendues pour les animations des AnimatedButton.
+
+L'échelle, la lueur et la pulsation d'un bouton sont quantifiées sur un petit
+nombre de pas ; chaque combinaison (état, échelle, lueur, pulsation) n'est
+rendue qu'une fois par le bouton (`render_frame`) puis réutilisée. Animer un
+bouton revient à choisir une image : aucun flou gaussien, dégradé ni rendu de
+texte pendant les transitions.
+"""
+from surface_cache import create_surface_cache
+
+SCALE_STEP = 0.025
+GLOW_STEP = 5
+PULSE_STEPS = 8
+
+# Images partagées par tous les boutons de même apparence
+_frames = create_surface_cache("button_keyframes", 24 * 1024 * 1024)
+
+
+def _appearance_key(button):
+    """Tout ce qui détermine l'apparence d'un bouton en dehors de son animation."""
+    return (
+        type(button),
+        button.text,
+        button.original_rect.size,
+        tuple(sorted(button.color_scheme.items())),
+        getattr(button, 'icon', None),
+    )
+
+
+def _quantize(value, step):
+    return round(value / step) * step
+
+
+def frame_parameters(button):
+    """Échelle, lueur et phase de pulsation quantifiées pour l'état courant du bouton."""
+    scale = round(_quantize(button.current_scale, SCALE_STEP), 3)
+    glow = int(_quantize(button.glow_radius, GLOW_STEP))
+    pulse_duration = getattr(button, 'pulse_duration', 0)
+    if pulse_duration > 0:
+        pulse = round(button.pulse_time / pulse_duration * PULSE_STEPS) / PULSE_STEPS
+    else:
+        pulse = None
+    return scale, glow, pulse
+
+
+def get_frame(button, state=None):
+    """Obtenir l'image clé du bouton pour son état d'animation courant (rendue à la première demande)."""
+    state = state or button.state
+    scale, glow, pulse = frame_parameters(button)
+    key = (_appearance_key(button), state, scale, glow, pulse)
+
+    frame = _frames.get(key)
+    if frame is None:
+        width = int(button.original_rect.width * scale)
+        height = int(button.original_rect.height * scale)
+        frame = _frames.put(key, button.render_frame(state, width, height, glow, pulse))
+    return frame
+
+
+def prerender(button):
+    """Pré-rendre les images de repos (normal, survol, appui) d'un bouton."""
+    saved = (button.current_scale, button.glow_radius)
+    resting = (
+        ("normal", 1.0, 0),
+        ("hover", button.hover_scale, button.max_glow),
+        ("press", button.press_scale, button.max_glow),
+    )
+    for state, scale, glow in resting:
+        button.current_scale, button.glow_radius = scale, glow
+        get_frame(button, state)
+    button.current_scale, button.glow_radius = saved
@@ -0,0 +1,78 @@
+"""
+Murs destructibles et mouvants.
+
+La grille du niveau est modifiée sur place ; chaque changement de case répare
+localement le champ de distances vers la sortie (voir `FlowField.set_passable`)
+au lieu de relancer un parcours complet. Ce champ sert à refuser tout mur qui
+couperait le joueur de la sortie.
+"""
+import random
+from flow_field import FlowField, UNREACHABLE
+
+WALL = 1
+ROAD = 0
+
+
+class DynamicMaze:
+    """Grille modifiable du niveau courant et distances vers la sortie."""
+    def __init__(self):
+        self.grid = None
+        self.exit_field = None
+
+    def track(self, grid, exit_cell):
+        """Suivre la grille du niveau courant (champ recréé seulement au changement de niveau) ; True si nouvelle."""
+        if grid is self.grid:
+            return False
+        self.grid = grid
+        self.exit_field = FlowField(grid)
+        self.exit_field.set_target(exit_cell)
+        return True
+
+    def set_cell(self, cell, value):
+        """Poser un mur (WALL ou tuile) ou le détruire (ROAD) ; retourne le nombre de distances réparées."""
+        x, y = cell
+        self.grid[y][x] = value
+        return self.exit_field.set_passable(cell, value == ROAD)
+
+    def cell(self, cell):
+        x, y = cell
+        return self.grid[y][x]
+
+    def move_wall(self, removed, added, player_cell, set_cell=None):
+        """
+        Déplacer le mur `removed` sur la case de chemin `added`, tuile comprise.
+
+        `set_cell(cell, value)` applique chaque changement (par défaut
+        `self.set_cell` ; le jeu y ajoute la réparation des autres champs). Si
+        le joueur ne peut plus atteindre la sortie, les deux cases reprennent
+        leur valeur d'origine. Retourne True si le déplacement est gardé.
+        """
+        set_cell = set_cell or self.set_cell
+        wall, road = self.cell(removed), self.cell(added)
+        set_cell(removed, road)
+        set_cell(added, wall)
+        if self.can_reach_exit(player_cell):
+            return True
+        set_cell(added, road)
+        set_cell(removed, wall)
+        return False
+
+    def exit_distance(self, cell):
+        return self.exit_field.distance[self.exit_field.cell_index(cell)]
+
+    def can_reach_exit(self, cell):
+        return self.exit_distance(cell) != UNREACHABLE
+
+    def is_wall(self, cell):
+        x, y = cell
+        return 0 <= y < len(self.grid) and 0 <= x < len(self.grid[0]) and self.grid[y][x] != ROAD
+
+    def random_wall(self, rng=random):
+        walls = [(x, y) for y, row in enumerate(self.grid) for x, block in enumerate(row) if block != ROAD]
+        return rng.choice(walls) if walls else None
+
+    def random_road(self, excluded, rng=random):
+        """Case de chemin tirée au hasard, hors des cases `excluded` (joueur, portes, objets...)."""
+        roads = [(x, y) for y, row in enumerate(self.grid) for x, block in enumerate(row)
+                 if block == ROAD and (x, y) not in excluded]
+        return rng.choice(roads) if roads else None
@@ -0,0 +1,195 @@
+"""
+Champ de flux partagé : distances BFS vers une case cible sur la grille.
+
+Un seul parcours en largeur depuis la cible (le joueur) donne, pour chaque case,
+sa distance et la case voisine qui s'en rapproche. Tous les poursuivants lisent
+ce même champ : le coût de pathfinding ne dépend plus de leur nombre, et le
+champ n'est recalculé que lorsque la cible change de case. Quand un mur
+apparaît ou disparaît, seules les cases dont la distance change sont réparées.
+
+Les cases sont indexées à plat : `index = y * cols + x`.
+"""
+from collections import deque
+import heapq
+import numpy
+
+UNREACHABLE = -1
+
+
+def passable_cells(grid):
+    """Cases praticables (chemins) de la grille, en tableau numpy de booléens (lignes, colonnes)."""
+    return numpy.array([[block == 0 for block in row] for row in grid], dtype=bool)
+
+
+def neighbor_table(rows, cols):
+    """Voisins 4-connexes de chaque case (tableau (cases, 4), -1 hors de la grille)."""
+    index = numpy.arange(rows * cols, dtype=numpy.int32).reshape(rows, cols)
+    table = numpy.full((rows, cols, 4), -1, dtype=numpy.int32)
+    table[1:, :, 0] = index[:-1, :]   # haut
+    table[:-1, :, 1] = index[1:, :]   # bas
+    table[:, 1:, 2] = index[:, :-1]   # gauche
+    table[:, :-1, 3] = index[:, 1:]   # droite
+    return table.reshape(rows * cols, 4)
+
+
+class FlowField:
+    """Distances et pas suivant vers la case cible, pour une grille donnée."""
+    def __init__(self, grid):
+        self.grid = grid
+        self.rows, self.cols = len(grid), len(grid[0])
+        self.passable = passable_cells(grid).ravel()
+        self.neighbors = neighbor_table(self.rows, self.cols)
+        # Copies en listes Python pour le parcours case par case (bien plus rapide que l'indexation numpy)
+        self._neighbor_lists = self.neighbors.tolist()
+        self._passable_list = self.passable.tolist()
+
+        self.target = None
+        self.distance = numpy.full(self.rows * self.cols, UNREACHABLE, dtype=numpy.int32)
+        self._distance_list = self.distance.tolist()
+        self.next_cell = numpy.arange(self.rows * self.cols, dtype=numpy.int32)
+        self.recomputes = 0
+        self.repaired_cells = 0
+
+    def cell_index(self, cell):
+        return cell[1] * self.cols + cell[0]
+
+    def set_target(self, cell):
+        """Viser `cell` ; le champ n'est recalculé que si la cible a changé de case. Retourne True si recalculé."""
+        target = self.cell_index(cell)
+        if target == self.target:
+            return False
+        self.target = target
+        self._distance_list = self._breadth_first(target)
+        self.distance = numpy.array(self._distance_list, dtype=numpy.int32)
+        self._update_next_cells()
+        self.recomputes += 1
+        return True
+
+    def _breadth_first(self, target):
+        distance = [UNREACHABLE] * (self.rows * self.cols)
+        distance[target] = 0
+        neighbors, passable = self._neighbor_lists, self._passable_list
+        queue = deque([target])
+        while queue:
+            cell = queue.popleft()
+            next_distance = distance[cell] + 1
+            for neighbor in neighbors[cell]:
+                if neighbor >= 0 and passable[neighbor] and distance[neighbor] == UNREACHABLE:
+                    distance[neighbor] = next_distance
+                    queue.append(neighbor)
+        return distance
+
+    def set_passable(self, cell, passable):
+        """
+        Ouvrir ou fermer une case (mur détruit ou posé) et réparer le champ.
+
+        Seules les cases dont la distance change sont recalculées ; retourne leur nombre.
+        """
+        index = self.cell_index(cell)
+        if self._passable_list[index] == passable:
+            return 0
+        self.passable[index] = passable
+        self._passable_list[index] = passable
+        if self.target is None:
+            return 0
+
+        if passable:
+            changed = self._repair_opened(index)
+        else:
+            changed = self._repair_closed(index)
+        if changed:
+            changed = numpy.array(changed, dtype=numpy.int32)
+            self.distance[changed] = [self._distance_list[i] for i in changed.tolist()]
+            # Le pas suivant change pour ces cases et pour leurs voisines
+            around = self.neighbors[changed].ravel()
+            self._update_next_cells(numpy.unique(numpy.concatenate((changed, around[around >= 0]))))
+        self.repaired_cells += len(changed)
+        return len(changed)
+
+    def _repair_opened(self, index):
+        """Case ouverte : propager en largeur les distances qui diminuent à partir d'elle."""
+        distance, neighbors, passable = self._distance_list, self._neighbor_lists, self._passable_list
+        reachable = [distance[n] for n in neighbors[index] if n >= 0 and passable[n] and distance[n] != UNREACHABLE]
+        if not reachable:
+            return []
+        distance[index] = min(reachable) + 1
+        changed = [index]
+        queue = deque([index])
+        while queue:
+            cell = queue.popleft()
+            next_distance = distance[cell] + 1
+            for neighbor in neighbors[cell]:
+                if neighbor >= 0 and passable[neighbor] and (
+                        distance[neighbor] == UNREACHABLE or distance[neighbor] > next_distance):
+                    distance[neighbor] = next_distance
+                    changed.append(neighbor)
+                    queue.append(neighbor)
+        return changed
+
+    def _repair_closed(self, index):
+        """
+        Case fermée : trouver les cases qui dépendaient d'elle, puis les recalculer.
+
+        Une case est touchée si plus aucune voisine non touchée n'est à une
+        distance inférieure de un ; les cases touchées sont ensuite reliées au
+        reste du champ par un Dijkstra limité à elles seules.
+        """
+        distance, neighbors, passable = self._distance_list, self._neighbor_lists, self._passable_list
+        old_distance = distance[index]
+        distance[index] = UNREACHABLE
+        if old_distance == UNREACHABLE:
+            return []
+
+        # Cases touchées, découvertes couche par couche (distance croissante)
+        affected = {index}
+        queue = deque(n for n in neighbors[index] if n >= 0 and distance[n] == old_distance + 1)
+        while queue:
+            cell = queue.popleft()
+            if cell in affected:
+                continue
+            cell_distance = distance[cell]
+            supported = any(
+                n >= 0 and passable[n] and n not in affected and distance[n] == cell_distance - 1
+                for n in neighbors[cell]
+            )
+            if supported:
+                continue
+            affected.add(cell)
+            queue.extend(n for n in neighbors[cell] if n >= 0 and distance[n] == cell_distance + 1)
+
+        # Nouvelles distances : depuis le bord non touché, sans sortir de la zone touchée
+        affected.discard(index)
+        heap = []
+        for cell in affected:
+            distance[cell] = UNREACHABLE
+        for cell in affected:
+            border = [distance[n] for n in neighbors[cell]
+                      if n >= 0 and passable[n] and n not in affected and distance[n] != UNREACHABLE]
+            if border:
+                heapq.heappush(heap, (min(border) + 1, cell))
+        while heap:
+            cell_distance, cell = heapq.heappop(heap)
+            if distance[cell] != UNREACHABLE and distance[cell] <= cell_distance:
+                continue
+            distance[cell] = cell_distance
+            for neighbor in neighbors[cell]:
+                if neighbor in affected and (distance[neighbor] == UNREACHABLE or distance[neighbor] > cell_distance + 1):
+                    heapq.heappush(heap, (cell_distance + 1, neighbor))
+        return [index] + list(affected)
+
+    def _update_next_cells(self, cells=None):
+        """Pour chaque case (ou seulement `cells`), le voisin le plus proche de la cible (la case elle-même s'il n'y en a pas)."""
+        far = numpy.iinfo(numpy.int32).max
+        if cells is None:
+            cells = numpy.arange(len(self.distance))
+        neighbors = self.neighbors[cells]
+        # Voisins hors grille (-1) et cases inatteignables : « infiniment loin »
+        neighbor_distance = self.distance[neighbors]
+        neighbor_distance[(neighbors < 0) | (neighbor_distance == UNREACHABLE)] = far
+        own_distance = self.distance[cells]
+        own_distance = numpy.where(own_distance == UNREACHABLE, far, own_distance)
+
+        best = neighbor_distance.argmin(axis=1)
+        rows = numpy.arange(len(cells))
+        closer = neighbor_distance[rows, best] < own_distance
+        self.next_cell[cells] = numpy.where(closer, neighbors[rows, best], cells)
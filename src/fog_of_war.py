@@ -0,0 +1,170 @@
+"""
+Brouillard de guerre : champ de vision par ombres portées récursives.
+
+Le champ de vision n'est recalculé que lorsque le joueur se déplace (ou que le
+rayon change, par exemple sous la neige). Les cases déjà vues sont mémorisées
+dans une carte « explorée ». L'obscurité est un masque de lumière à la taille
+de la carte, mis à jour case par case (seules les cases dont l'état a changé
+sont retamponnées) : une frame sans déplacement ne coûte qu'un blit.
+"""
+import math
+import pygame
+import numpy
+from settings import WEATHER, FOV_RADIUS
+
+# Multiplicateurs (xx, xy, yx, yy) des huit octants autour du joueur
+_OCTANTS = (
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1),
+)
+
+# Opacité du voile : case jamais vue, case explorée hors de vue
+UNEXPLORED_ALPHA = 235
+EXPLORED_ALPHA = 150
+# Opacité des cases visibles, du centre vers la limite du champ de vision
+LIGHT_ALPHAS = (0, 30, 70)
+
+
+def fov_radius(weather):
+    """Rayon du champ de vision pour la météo courante (la neige réduit la visibilité)."""
+    reduction = WEATHER.get(weather, {}).get("visibility_reduction", 0)
+    return max(1, int(round(FOV_RADIUS * (1 - reduction))))
+
+
+def opaque_cells(grid):
+    """Cases qui bloquent la vue (tout ce qui n'est pas un chemin), en listes de booléens."""
+    return [[block != 0 for block in row] for row in grid]
+
+
+def compute_fov(opaque, origin, radius):
+    """
+    Cases visibles depuis `origin` (ombres portées récursives sur les huit octants).
+
+    Retourne un tableau numpy de booléens (lignes, colonnes).
+    """
+    rows, cols = len(opaque), len(opaque[0])
+    visible = [[False] * cols for _ in range(rows)]
+    origin_x, origin_y = origin
+    visible[origin_y][origin_x] = True
+    for octant in _OCTANTS:
+        _cast_light(opaque, visible, origin_x, origin_y, 1, 1.0, 0.0, radius, octant)
+    return numpy.array(visible, dtype=bool)
+
+
+def _cast_light(opaque, visible, origin_x, origin_y, first_row, start, end, radius, octant):
+    """Balayer un octant ligne par ligne entre les pentes `start` et `end`."""
+    if start < end:
+        return
+    xx, xy, yx, yy = octant
+    rows, cols = len(opaque), len(opaque[0])
+    radius_squared = radius * radius
+    new_start = start
+    for distance in range(first_row, int(math.ceil(radius)) + 1):
+        dx, dy = -distance - 1, -distance
+        blocked = False
+        while dx <= 0:
+            dx += 1
+            left_slope = (dx - 0.5) / (dy + 0.5)
+            right_slope = (dx + 0.5) / (dy - 0.5)
+            if start < right_slope:
+                continue
+            if end > left_slope:
+                break
+
+            x = origin_x + dx * xx + dy * xy
+            y = origin_y + dx * yx + dy * yy
+            inside = 0 <= x < cols and 0 <= y < rows
+            if inside and dx * dx + dy * dy <= radius_squared:
+                visible[y][x] = True
+            # Les bords de la carte bloquent la vue comme des murs
+            is_opaque = not inside or opaque[y][x]
+
+            if blocked:
+                if is_opaque:
+                    new_start = right_slope
+                    continue
+                blocked = False
+                start = new_start
+            elif is_opaque and distance < radius:
+                blocked = True
+                _cast_light(opaque, visible, origin_x, origin_y, distance + 1, start, left_slope, radius, octant)
+                new_start = right_slope
+        if blocked:
+            break
+
+
+class FogOfWar:
+    """
+    Champ de vision, cases explorées et masque d'obscurité de la carte courante.
+
+    `cell_step` est l'écart en pixels entre deux cases (taille de bloc plus
+    espacement) : le masque se dessine à l'origine de la carte à l'écran.
+    """
+    def __init__(self, cell_step):
+        self.cell_step = cell_step
+        # Couleurs des tampons, par niveau : 0 = jamais vue, 1 = explorée, 2+ = visible
+        self.stamps = [(0, 0, 0, UNEXPLORED_ALPHA), (0, 0, 0, EXPLORED_ALPHA)]
+        self.stamps += [(0, 0, 0, alpha) for alpha in LIGHT_ALPHAS]
+        self.grid = None
+        self.mask = None
+
+    def reset(self, grid):
+        """Nouvelle carte : tout redevient inexploré."""
+        self.grid = grid
+        self.opaque = opaque_cells(grid)
+        rows, cols = len(grid), len(grid[0])
+        self.explored = numpy.zeros((rows, cols), dtype=bool)
+        self.visible = numpy.zeros((rows, cols), dtype=bool)
+        self.levels = numpy.zeros((rows, cols), dtype=numpy.uint8)
+        self.position = None
+        self.radius = None
+
+        self.mask = pygame.Surface((cols * self.cell_step, rows * self.cell_step), pygame.SRCALPHA)
+        self.mask.fill(self.stamps[0])
+
+    def update(self, grid, position, radius):
+        """
+        Recalculer la vue si le joueur a bougé ou si le rayon a changé ; retourne True si recalculée.
+
+        Une nouvelle grille (changement de niveau) réinitialise les cases explorées.
+        """
+        if grid is not self.grid:
+            self.reset(grid)
+        position = tuple(position)
+        if position == self.position and radius == self.radius:
+            return False
+        self.position = position
+        self.radius = radius
+
+        self.visible = compute_fov(self.opaque, position, radius)
+        self.explored |= self.visible
+
+        # Niveau de lumière de chaque case : dégradé selon la distance au joueur
+        rows, cols = self.levels.shape
+        ys, xs = numpy.ogrid[:rows, :cols]
+        distance = numpy.sqrt((xs - position[0]) ** 2 + (ys - position[1]) ** 2) / max(radius, 1)
+        light = 2 + numpy.minimum(distance * len(LIGHT_ALPHAS), len(LIGHT_ALPHAS) - 1).astype(numpy.uint8)
+        levels = numpy.where(self.visible, light, self.explored.astype(numpy.uint8))
+
+        # Retamponner uniquement les cases dont le niveau a changé
+        step = self.cell_step
+        for y, x in zip(*numpy.nonzero(levels != self.levels)):
+            self.mask.fill(self.stamps[levels[y, x]], (x * step, y * step, step, step))
+        self.levels = levels
+        return True
+
+    def set_opaque(self, cell, opaque):
+        """Un mur est apparu ou a disparu : la vue sera recalculée à la prochaine mise à jour."""
+        if self.grid is None:
+            return
+        x, y = cell
+        self.opaque[y][x] = opaque
+        self.position = None
+
+    def is_visible(self, x, y):
+        return self.grid is not None and bool(self.visible[y, x])
+
+    def draw(self, surface, origin):
+        """Dessiner l'obscurité, la carte commençant en `origin` à l'écran."""
+        if self.mask is not None:
+            surface.blit(self.mask, origin)
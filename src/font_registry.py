@@ -0,0 +1,86 @@
+"""
+Registre de polices partagé par tout le processus.
+
+Les polices sont créées à la première demande puis réutilisées, indexées par
+(nom, taille, gras, italique) : les boutons, notifications et écrans qui
+demandent une police ne déclenchent plus de chargement ni de recherche de
+police système. Un compteur de constructions permet de vérifier en mode debug
+qu'aucune police n'est créée après le démarrage.
+"""
+import os
+import pygame
+
+_fonts = {}
+_constructions = 0
+_constructions_at_startup = None
+
+
+def _create_font(name, size, bold, italic):
+    global _constructions
+    _constructions += 1
+
+    if name is not None and os.path.exists(name):
+        font = pygame.font.Font(name, size)
+    elif name is not None:
+        return pygame.font.SysFont(name, size, bold, italic)
+    else:
+        try:
+            font = pygame.font.Font(None, size)
+        except (pygame.error, OSError):
+            # Repli sur une police système
+            return pygame.font.SysFont('arial', size, bold, italic)
+
+    font.set_bold(bold)
+    font.set_italic(italic)
+    return font
+
+
+def _font_key_name(name):
+    """Les noms de polices système ne tiennent pas compte de la casse, les chemins de fichier si."""
+    if name is None:
+        return None
+    if os.sep in name or (os.altsep and os.altsep in name) or os.path.splitext(name)[1]:
+        return name
+    return name.lower()
+
+
+def get_font(name=None, size=24, bold=False, italic=False):
+    """
+    Obtenir une police partagée.
+
+    `name` est None (police par défaut de pygame), un chemin de fichier ou un
+    nom de police système.
+    """
+    key = (_font_key_name(name), size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = _create_font(name, size, bold, italic)
+        _fonts[key] = font
+    return font
+
+
+def load_custom_fonts():
+    """Jeu de polices standard de l'interface (title, heading, button, info, small)."""
+    return {
+        'title': get_font(None, 92),
+        'heading': get_font(None, 64),
+        'button': get_font(None, 48),
+        'info': get_font(None, 36),
+        'small': get_font(None, 24),
+    }
+
+
+def mark_startup_complete():
+    """Mémoriser le nombre de constructions à la fin du démarrage."""
+    global _constructions_at_startup
+    _constructions_at_startup = _constructions
+
+
+def get_font_stats():
+    """Nombre de polices, de constructions, et de constructions depuis la fin du démarrage."""
+    after_startup = _constructions - _constructions_at_startup if _constructions_at_startup is not None else 0
+    return {
+        'fonts': len(_fonts),
+        'constructions': _constructions,
+        'after_startup': after_startup,
+    }
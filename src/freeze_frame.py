@@ -0,0 +1,58 @@
+"""
+Image de jeu figée pour les écrans superposés (pause, fin de partie, score final).
+
+À l'entrée dans l'écran, la dernière image du jeu est capturée une seule fois,
+floutée (réduction puis agrandissement) et assombrie, puis le décor statique de
+l'écran (panneau, titres, statistiques) y est dessiné. Chaque image suivante ne
+coûte qu'un blit plein écran plus les éléments réellement animés (boutons).
+"""
+import pygame
+
+
+class FreezeFrame:
+    """Instantané flouté et assombri de la dernière image, avec le décor statique de l'écran."""
+    def __init__(self, darken=150, blur_factor=4):
+        self.darken = darken
+        self.blur_factor = blur_factor
+        self.surface = None
+        self.key = None
+
+    def is_frozen(self, key=None):
+        """Une image est-elle figée (pour l'écran `key`, si donné) ?"""
+        return self.surface is not None and (key is None or self.key == key)
+
+    def capture(self, source, key=None, darken=None, decorate=None):
+        """
+        Figer le contenu de `source`.
+
+        `darken` remplace l'assombrissement par défaut (alpha d'un voile noir,
+        0 pour aucun) ; `decorate(surface)` dessine le décor statique de l'écran
+        par-dessus l'image figée.
+        """
+        width, height = source.get_size()
+        if self.blur_factor > 1:
+            small_size = (max(1, width // self.blur_factor), max(1, height // self.blur_factor))
+            frozen = pygame.transform.smoothscale(pygame.transform.smoothscale(source, small_size), (width, height))
+        else:
+            frozen = source.copy()
+
+        alpha = self.darken if darken is None else darken
+        if alpha > 0:
+            # Équivalent d'un voile noir d'opacité alpha, sans surface intermédiaire
+            level = 255 - alpha
+            frozen.fill((level, level, level), special_flags=pygame.BLEND_RGB_MULT)
+
+        if decorate is not None:
+            decorate(frozen)
+
+        self.surface = frozen
+        self.key = key
+        return frozen
+
+    def draw(self, surface):
+        surface.blit(self.surface, (0, 0))
+
+    def release(self):
+        """Libérer l'image figée (le jeu reprend)."""
+        self.surface = None
+        self.key = None
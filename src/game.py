@@ -1,6 +1,10 @@
 import pygame
 from settings import *
-from game_logic import generate_map, draw_map, load_character_skins, load_bonus_image, check_achievements, apply_weather_effects
+from game_logic import generate_map, draw_map, load_character_skins, load_bonus_image, AchievementTracker, apply_weather_effects
+from glyph_atlas import get_glyph_atlas
+from freeze_frame import FreezeFrame
+from score_manager import get_score_manager
+from input_queue import InputQueue
 
 # Initialize Pygame
 pygame.init()
@@ -38,6 +42,13 @@ def start_game():
 
     current_weather = random.choice(list(WEATHER.keys()))
     achievements_unlocked = []
+    achievement_tracker = AchievementTracker()
+    # Key presses made during the move cooldown are buffered instead of lost
+    input_queue = InputQueue()
+
+    # Texte du HUD composé à partir de glyphes pré-rendus
+    hud_text = get_glyph_atlas(font, WHITE)
+    hud_text.preload("Level: Score: Time: Weather: Achievements:")
 
     running = True
     while running:
@@ -50,47 +61,37 @@ def start_game():
 
         draw_map(screen, grid, powerups, camera_x, camera_y, start_pos, end_pos, character_pos, character_image, bonus_image, map_background)
 
-        level_text = font.render(f"Level: {LEVEL}", True, WHITE)
-        screen.blit(level_text, (10, 10))
-        score_text = font.render(f"Score: {SCORE}", True, WHITE)
-        screen.blit(score_text, (10, 50))
+        hud_text.draw(screen, f"Level: {LEVEL}", (10, 10))
+        hud_text.draw(screen, f"Score: {SCORE}", (10, 50))
         time_left = max(0, LEVEL_TIME - (pygame.time.get_ticks() - START_TIME) // 1000)
-        timer_text = font.render(f"Time: {time_left}", True, WHITE)
-        screen.blit(timer_text, (10, 90))
+        hud_text.draw(screen, f"Time: {time_left}", (10, 90))
+
+        hud_text.draw(screen, f"Weather: {current_weather.capitalize()}", (10, 130))
+        hud_text.draw(screen, f"Achievements: {', '.join(achievements_unlocked)}", (10, 170))
 
-        weather_text = font.render(f"Weather: {current_weather.capitalize()}", True, WHITE)
-        screen.blit(weather_text, (10, 130))
-        achievements_text = font.render(f"Achievements: {', '.join(achievements_unlocked)}", True, WHITE)
-        screen.blit(achievements_text, (10, 170))
+        for event in input_queue.poll():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                input_queue.push_move(event)
 
-        keys = pygame.key.get_pressed()
+        # One step per cooldown: the buffered key press first, then a held direction key
         if move_cooldown <= 0:
-            if keys[pygame.K_UP] and character_pos[1] > 0 and grid[character_pos[1] - 1][character_pos[0]] == 0:
-                character_pos[1] -= 1
-                STEPS += 1
-                move_cooldown = SPEED_BOOST_COOLDOWN if speed_boost else DEFAULT_MOVE_COOLDOWN
-            if keys[pygame.K_DOWN] and character_pos[1] < ROWS - 1 and grid[character_pos[1] + 1][character_pos[0]] == 0:
-                character_pos[1] += 1
-                STEPS += 1
-                move_cooldown = SPEED_BOOST_COOLDOWN if speed_boost else DEFAULT_MOVE_COOLDOWN
-            if keys[pygame.K_LEFT] and character_pos[0] > 0 and grid[character_pos[1]][character_pos[0] - 1] == 0:
-                character_pos[0] -= 1
-                STEPS += 1
-                move_cooldown = SPEED_BOOST_COOLDOWN if speed_boost else DEFAULT_MOVE_COOLDOWN
-            if keys[pygame.K_RIGHT] and character_pos[0] < COLS - 1 and grid[character_pos[1]][character_pos[0] + 1] == 0:
-                character_pos[0] += 1
-                STEPS += 1
-                move_cooldown = SPEED_BOOST_COOLDOWN if speed_boost else DEFAULT_MOVE_COOLDOWN
+            move = input_queue.take_move() or input_queue.held_move()
+            if move:
+                dx, dy = move
+                new_x, new_y = character_pos[0] + dx, character_pos[1] + dy
+                if 0 <= new_x < COLS and 0 <= new_y < ROWS and grid[new_y][new_x] == 0:
+                    character_pos = [new_x, new_y]
+                    STEPS += 1
+                    move_cooldown = apply_weather_effects(current_weather, SPEED_BOOST_COOLDOWN if speed_boost else DEFAULT_MOVE_COOLDOWN)
         else:
             move_cooldown -= 1
 
-        move_cooldown = apply_weather_effects(current_weather, move_cooldown)
-
-        new_achievements = check_achievements(LEVEL, time_left, STEPS, COINS_COLLECTED)
-        for achievement in new_achievements:
-            if achievement not in achievements_unlocked:
-                achievements_unlocked.append(achievement)
-                print(f"Achievement Unlocked: {achievement}")
+        # Rules are only evaluated when the coin count actually changed
+        for achievement in achievement_tracker.update(coins_collected=COINS_COLLECTED):
+            achievements_unlocked.append(achievement)
+            print(f"Achievement Unlocked: {achievement}")
 
         for powerup in powerups[:]:
             x, y, type = powerup
@@ -111,6 +112,9 @@ def start_game():
         if character_pos[0] == end_pos[0] and character_pos[1] == end_pos[1]:
             LEVEL += 1
             remaining_time = max(0, LEVEL_TIME - (pygame.time.get_ticks() - START_TIME) // 1000)
+            for achievement in achievement_tracker.update(level=LEVEL, time_left=remaining_time, steps=STEPS):
+                achievements_unlocked.append(achievement)
+                print(f"Achievement Unlocked: {achievement}")
             LEVEL_TIME = remaining_time + 2
             if LEVEL % 2 == 0:
                 COLS += 1
@@ -118,6 +122,7 @@ def start_game():
                 ROWS += 1
             grid, powerups, start_pos, end_pos, map_background = generate_map(ROWS, COLS, LEVEL)
             character_pos = list(start_pos)
+            input_queue.clear()
             SCORE += 1000 // (pygame.time.get_ticks() - START_TIME)
             START_TIME = pygame.time.get_ticks()
 
@@ -133,9 +138,11 @@ def start_game():
             START_TIME = pygame.time.get_ticks()
             grid, powerups, start_pos, end_pos, map_background = generate_map(ROWS, COLS, LEVEL)
             character_pos = list(start_pos)
+            input_queue.clear()
             character_image = random.choice(character_skins) if character_skins else None
 
         pygame.display.flip()
+        input_queue.mark_presented()
         clock.tick(60)
 
     pygame.quit()
@@ -149,13 +156,8 @@ def show_score_popup():
     popup_alpha = 0
 
     final_score = calculate_score()
-    save_top_score(final_score)
-
-    try:
-        with open(SCORES_FILE, "r") as file:
-            top_score = int(file.read())
-    except FileNotFoundError:
-        top_score = 0
+    save_top_score(final_score, (pygame.time.get_ticks() - START_TIME) // 1000)
+    top_score = get_score_manager().get_best_scores()["all_time"]
 
     animated_score = 0
     animation_step = 0
@@ -166,11 +168,18 @@ def show_score_popup():
     reset_button_color = (0, 128, 255)
     reset_text = font.render("Reset Game", True, WHITE)
 
+    # Draw the map once and freeze it; the loop only draws the popup on top
+    screen.fill(BACKGROUND_COLOR)
+    draw_map(screen, grid, powerups, camera_x, camera_y, start_pos, end_pos, character_pos, character_image, bonus_image, map_background)
+    frozen_map = FreezeFrame(darken=0)
+    frozen_map.capture(screen)
+
+    popup_surface = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
+
     while popup_alpha < 255 or animation_step < 3:
-        screen.fill(BACKGROUND_COLOR)
-        draw_map(screen, grid, powerups, camera_x, camera_y, start_pos, end_pos, character_pos, character_image, bonus_image, map_background)
+        frozen_map.draw(screen)
 
-        popup_surface = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
+        popup_surface.fill((0, 0, 0, 0))
         pygame.draw.rect(popup_surface, (0, 0, 0, popup_alpha), (0, 0, popup_width, popup_height), border_radius=20)
         screen.blit(popup_surface, (popup_x, popup_y))
 
@@ -218,13 +227,6 @@ def calculate_score():
     SCORE = (LEVEL * 2000) + (COINS_COLLECTED * 500) - (STEPS * 2)
     return max(SCORE, 100)
 
-# Function to save the top score
-def save_top_score(score):
-    try:
-        with open(SCORES_FILE, "r") as file:
-            top_score = int(file.read())
-    except FileNotFoundError:
-        top_score = 0
-    if score > top_score:
-        with open(SCORES_FILE, "w") as file:
-            file.write(str(score))
\ No newline at end of file
+# Function to save the score (written to disk in the background)
+def save_top_score(score, time_played=0):
+    get_score_manager().save_score(score, "Normal", time_played)
\ No newline at end of file
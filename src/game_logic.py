@@ -1,5 +1,7 @@
 import random
 import heapq
+import operator
+import re
 import pygame
 import os
 from settings import *
@@ -287,27 +289,99 @@ def draw_powerup(screen, type, x, y, bonus_image):
     elif type == BONUS:
         screen.blit(bonus_image, (powerup_x, powerup_y))
 
-def check_achievements(level, time_left, steps, coins_collected):
-    """Check and return newly unlocked achievements"""
-    achievements_unlocked = []
-    for achievement, details in ACHIEVEMENTS.items():
-        condition = details["condition"]
+# Stats an achievement condition may read, and the comparisons it may use
+ACHIEVEMENT_STATS = ("level", "time_left", "steps", "coins_collected")
+_COMPARISONS = {
+    "<": operator.lt, "<=": operator.le,
+    ">": operator.gt, ">=": operator.ge,
+    "==": operator.eq, "!=": operator.ne,
+}
+_CONDITION_PATTERN = re.compile(r"^\s*([a-z_]+)\s*(<=|>=|==|!=|<|>)\s*(-?\d+(?:\.\d+)?)\s*$")
+
+def compile_achievement_condition(condition):
+    """Compile a condition such as "steps < 20" into (stat, predicate) without eval"""
+    match = _CONDITION_PATTERN.match(condition)
+    if match is None or match.group(1) not in ACHIEVEMENT_STATS:
+        raise ValueError(f"invalid achievement condition {condition!r}")
+    stat, comparison, threshold = match.groups()
+    compare = _COMPARISONS[comparison]
+    threshold = float(threshold) if "." in threshold else int(threshold)
+    return stat, lambda value: compare(value, threshold)
+
+def compile_achievements(achievements):
+    """Compile every achievement rule once into (name, stat, predicate) tuples"""
+    rules = []
+    for achievement, details in achievements.items():
         try:
-            condition_func = eval(f"lambda level, time_left, steps, coins_collected: {condition}")
-            if condition_func(level, time_left, steps, coins_collected):
-                achievements_unlocked.append(achievement)
-        except Exception as e:
-            print(f"Error evaluating achievement condition: {e}")
-    return achievements_unlocked
+            stat, predicate = compile_achievement_condition(details["condition"])
+        except ValueError as e:
+            print(f"Error compiling achievement condition: {e}")
+            continue
+        rules.append((achievement, stat, predicate))
+    return rules
+
+# Rules compiled at startup, shared by every game
+ACHIEVEMENT_RULES = compile_achievements(ACHIEVEMENTS)
+
+def check_achievements(level, time_left, steps, coins_collected):
+    """Check and return the achievements whose condition currently holds"""
+    stats = {"level": level, "time_left": time_left, "steps": steps, "coins_collected": coins_collected}
+    return [achievement for achievement, stat, predicate in ACHIEVEMENT_RULES if predicate(stats[stat])]
+
+class AchievementTracker:
+    """Event-driven achievement checks for one game.
+
+    Rules are indexed by the stat they read and only evaluated when that stat
+    changes (coin collected, level finished); an unlocked rule is removed from
+    the active set, so it is never evaluated again. Level, time left and steps
+    are reported when a level is finished, so that "steps < 20" means a level
+    finished in fewer than 20 steps, not the first step of the game.
+    """
+    def __init__(self, rules=None):
+        self.active = {}
+        for rule in (ACHIEVEMENT_RULES if rules is None else rules):
+            self.active.setdefault(rule[1], []).append(rule)
+        self.values = {}
+        self.unlocked = []
+
+    def update(self, **stats):
+        """Report changed stats (e.g. steps=12) and return the newly unlocked achievements"""
+        newly_unlocked = []
+        for stat, value in stats.items():
+            if self.values.get(stat) == value:
+                continue
+            self.values[stat] = value
+
+            rules = self.active.get(stat)
+            if not rules:
+                continue
+            remaining = []
+            for rule in rules:
+                if rule[2](value):
+                    newly_unlocked.append(rule[0])
+                else:
+                    remaining.append(rule)
+            if remaining:
+                self.active[stat] = remaining
+            else:
+                del self.active[stat]
+
+        self.unlocked.extend(newly_unlocked)
+        return newly_unlocked
 
 def apply_weather_effects(weather, movement_cooldown):
-    """Apply weather-based movement modifications"""
+    """
+    Apply weather-based movement modifications.
+
+    Call once per move, on the cooldown being armed: the penalty is a speed
+    factor, so the cooldown is divided by it (slower movement in bad weather).
+    """
     if weather not in WEATHER:
         return movement_cooldown
 
     weather_data = WEATHER[weather]
     if weather == "rain":
-        movement_cooldown *= weather_data.get("movement_penalty", 0.8)
+        movement_cooldown /= weather_data.get("movement_penalty", 0.8)
     elif weather == "snow":
-        movement_cooldown *= weather_data.get("movement_penalty", 0.5)
+        movement_cooldown /= weather_data.get("movement_penalty", 0.5)
     return movement_cooldown
\ No newline at end of file
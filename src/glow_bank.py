@@ -0,0 +1,95 @@
+import math
+import pygame
+from surface_cache import create_surface_cache
+
+try:
+    import numpy
+except ImportError:
+    # pygame.surfarray a besoin de numpy ; sans lui on retombe sur des cercles
+    numpy = None
+
+
+class GlowSpriteBank:
+    """
+    Banque de sprites de lueur pré-rendus.
+
+    Chaque lueur (dégradé radial) est rendue une seule fois pour une
+    combinaison quantifiée rayon/rayon intérieur/couleur, puis réutilisée :
+    dessiner une lueur coûte un seul blit au lieu de dizaines de cercles
+    et d'une allocation de surface par frame.
+
+    L'alpha n'est pas cuit dans le sprite mais appliqué au blit
+    (`set_alpha`, combiné à l'alpha par pixel), et les grands rayons sont
+    quantifiés par pas proportionnels (`radius_ratio`) : les lueurs pulsantes
+    de l'arrière-plan (rayons de 40 à 180) tiennent alors dans une vingtaine
+    de sprites au lieu de plusieurs centaines.
+    """
+    def __init__(self, radius_step=2, radius_ratio=0.06, max_bytes=24 * 1024 * 1024):
+        self.radius_step = radius_step
+        self.radius_ratio = radius_ratio
+        self.sprites = create_surface_cache("glow_bank", max_bytes)
+
+    def _quantize(self, value, step):
+        return max(0, int(round(value / step)) * step)
+
+    def _quantize_radius(self, radius):
+        """Pas fixe pour les petits rayons, puis pas d'environ `radius_ratio` fois le rayon."""
+        if radius <= self.radius_step / self.radius_ratio:
+            return max(self.radius_step, self._quantize(radius, self.radius_step))
+        bucket = round(math.log(radius) / math.log1p(self.radius_ratio))
+        return int(round((1 + self.radius_ratio) ** bucket))
+
+    def get_glow(self, radius, color, alpha=100, inner_radius=0):
+        """Obtenir le sprite de lueur (taille 2R x 2R) correspondant aux paramètres, alpha appliqué."""
+        radius = self._quantize_radius(radius)
+        inner_radius = min(self._quantize(inner_radius, self.radius_step), radius - 1)
+        key = (radius, inner_radius, tuple(color[:3]))
+
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.sprites.put(key, self._render(radius, inner_radius, color[:3], 255))
+        sprite.set_alpha(max(0, min(255, int(alpha))))
+        return sprite
+
+    def blit_glow(self, surface, center, radius, color, alpha=100, inner_radius=0):
+        """Dessiner une lueur centrée sur `center` en un seul blit."""
+        sprite = self.get_glow(radius, color, alpha, inner_radius)
+        half = sprite.get_width() // 2
+        return surface.blit(sprite, (int(center[0]) - half, int(center[1]) - half))
+
+    def _render(self, radius, inner_radius, color, alpha):
+        """Pré-rendre le dégradé radial : opaque jusqu'au rayon intérieur, puis décroissance linéaire."""
+        size = radius * 2
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        sprite.fill((*color, 0))
+
+        if numpy is not None:
+            coords = numpy.arange(size, dtype=numpy.float32) + 0.5 - radius
+            distance = numpy.sqrt(coords[:, None] ** 2 + coords[None, :] ** 2)
+            falloff = numpy.clip((radius - distance) / (radius - inner_radius), 0.0, 1.0)
+            alpha_pixels = pygame.surfarray.pixels_alpha(sprite)
+            alpha_pixels[:] = (falloff * alpha).astype(numpy.uint8)
+            del alpha_pixels  # Libérer le verrou de la surface
+        else:
+            # Du plus grand au plus petit cercle pour que l'alpha augmente vers le centre
+            for r in range(radius, inner_radius, -1):
+                alpha_r = int(alpha * (radius - r) / (radius - inner_radius))
+                pygame.draw.circle(sprite, (*color, alpha_r), (radius, radius), r)
+            if inner_radius > 0:
+                pygame.draw.circle(sprite, (*color, alpha), (radius, radius), inner_radius)
+
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+
+
+# Banque partagée par l'arrière-plan et le rendu du jeu
+_shared_bank = None
+
+def get_glow_bank():
+    """Obtenir la banque de lueurs partagée (créée à la première utilisation)."""
+    global _shared_bank
+    if _shared_bank is None:
+        _shared_bank = GlowSpriteBank()
+    return _shared_bank
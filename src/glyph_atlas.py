@@ -0,0 +1,96 @@
+"""
+Atlas de glyphes pour le texte du HUD qui change souvent (score, temps, pas).
+
+Chaque caractère est rendu une seule fois par police/couleur (avec sa lueur
+néon éventuelle) ; une chaîne est ensuite composée en un seul Surface.blits,
+si bien qu'une mise à jour du score ou du chronomètre ne coûte que quelques
+petits blits au lieu d'un font.render et d'un rendu de lueur complets.
+"""
+import pygame
+
+DIGITS = "0123456789"
+
+
+class GlyphAtlas:
+    """Glyphes pré-rendus d'une police dans une couleur (et une lueur optionnelle)."""
+    def __init__(self, font, color, glow_color=None, glow_radius=0, preload=DIGITS):
+        self.font = font
+        self.color = color
+        self.glow_color = glow_color
+        self.glow_radius = glow_radius if glow_color is not None else 0
+        self.height = font.get_height()
+        # caractère -> (surface du glyphe, surface de lueur ou None, avance en pixels)
+        self.glyphs = {}
+        self.preload(preload)
+
+    def preload(self, characters):
+        """Pré-rendre une série de caractères (chiffres, libellés fixes du HUD)."""
+        for char in characters:
+            self._glyph(char)
+
+    def _glyph(self, char):
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            surface = self.font.render(char, True, self.color)
+            glow = self._render_glow(char) if self.glow_radius > 0 else None
+            glyph = (surface, glow, self.font.size(char)[0])
+            self.glyphs[char] = glyph
+        return glyph
+
+    def _render_glow(self, char):
+        """Lueur néon d'un caractère (même passes que UIEffects.create_neon_text)."""
+        radius = self.glow_radius
+        width, height = self.font.size(char)
+        glow_surface = pygame.Surface((width + radius * 2, height + radius * 2), pygame.SRCALPHA)
+        for i in range(1, radius + 1):
+            alpha = max(0, 200 - (i * 20))
+            glow = self.font.render(char, True, (*self.glow_color, alpha))
+            for offset_x in range(-i, i + 1, max(1, i // 2)):
+                for offset_y in range(-i, i + 1, max(1, i // 2)):
+                    glow_surface.blit(glow, (radius + offset_x, radius + offset_y))
+        return glow_surface
+
+    def size(self, text):
+        """Taille de la chaîne composée, lueur comprise."""
+        width = sum(self._glyph(char)[2] for char in text)
+        return width + self.glow_radius * 2, self.height + self.glow_radius * 2
+
+    def draw(self, surface, text, position):
+        """
+        Dessiner `text` à `position` (coin supérieur gauche, lueur comprise).
+
+        Les lueurs sont posées avant les glyphes pour qu'une lueur ne
+        recouvre jamais le caractère voisin. Retourne le rectangle touché.
+        """
+        x, y = position
+        glows = []
+        glyphs = []
+        cursor = x + self.glow_radius
+        for char in text:
+            glyph_surface, glow_surface, advance = self._glyph(char)
+            if glow_surface is not None:
+                glows.append((glow_surface, (cursor - self.glow_radius, y)))
+            glyphs.append((glyph_surface, (cursor, y + self.glow_radius)))
+            cursor += advance
+
+        surface.blits(glows + glyphs, doreturn=False)
+        return pygame.Rect(x, y, cursor - x + self.glow_radius, self.height + self.glow_radius * 2)
+
+    def render(self, text):
+        """Composer `text` sur une nouvelle surface (pour les appelants qui attendent une surface)."""
+        result = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        self.draw(result, text, (0, 0))
+        return result
+
+
+# Atlas partagés, un par police/couleur/lueur
+_atlases = {}
+
+def get_glyph_atlas(font, color, glow_color=None, glow_radius=0):
+    """Obtenir l'atlas partagé pour une police et un style (créé à la première utilisation)."""
+    key = (font, tuple(color), tuple(glow_color) if glow_color is not None else None, glow_radius)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color, glow_color, glow_radius)
+        _atlases[key] = atlas
+    return atlas
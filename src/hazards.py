@@ -0,0 +1,123 @@
+"""
+Dangers mobiles : des poursuivants qui se dirigent vers le joueur.
+
+Les positions des poursuivants sont des tableaux numpy (case courante, case
+précédente, progression entre les deux) ; chaque tick les fait avancer en une
+opération vectorisée en lisant le champ de flux partagé. Les collisions passent
+par une grille d'occupation indexée par case, reconstruite une fois par tick.
+"""
+import random
+import pygame
+import numpy
+from settings import HAZARDS
+from flow_field import FlowField
+
+
+def hazard_count(level):
+    """Nombre de poursuivants pour un niveau."""
+    return min(HAZARDS["max"], HAZARDS["per_level"] * level)
+
+
+def render_hazard_sprite(size):
+    """Sprite d'un poursuivant : noyau rouge hérissé de pointes."""
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = size // 2
+    spikes = []
+    for i in range(16):
+        radius = center - 1 if i % 2 == 0 else center * 0.6
+        angle = i * numpy.pi / 8
+        spikes.append((center + radius * numpy.cos(angle), center + radius * numpy.sin(angle)))
+    pygame.draw.polygon(sprite, (200, 40, 40), spikes)
+    pygame.draw.circle(sprite, (255, 110, 90), (center, center), size // 4)
+    pygame.draw.circle(sprite, (40, 0, 0), (center, center), size // 8)
+    return sprite
+
+
+class HazardSwarm:
+    """
+    Poursuivants d'un niveau.
+
+    `cell_step` est l'écart en pixels entre deux cases ; `speed` la fraction
+    de case parcourue par tick.
+    """
+    def __init__(self, cell_step, sprite_size, speed=None):
+        self.cell_step = cell_step
+        self.speed = HAZARDS["speed"] if speed is None else speed
+        self.sprite = render_hazard_sprite(sprite_size)
+        self.sprite_offset = (cell_step - sprite_size) // 2
+        self.grid = None
+        self.flow = None
+        self._set_count(0)
+
+    def _set_count(self, count):
+        self.cells = numpy.zeros(count, dtype=numpy.int32)
+        self.previous = numpy.zeros(count, dtype=numpy.int32)
+        self.progress = numpy.zeros(count, dtype=numpy.float32)
+        self.occupancy = None
+
+    def reset(self, grid, count, player_cell):
+        """Nouvelle carte : recréer le champ de flux et placer `count` poursuivants loin du joueur."""
+        self.grid = grid
+        self.flow = FlowField(grid)
+        self.flow.set_target(player_cell)
+        self._set_count(count)
+        self.respawn(numpy.arange(count))
+
+    def respawn(self, indices):
+        """Replacer les poursuivants `indices` sur des cases atteignables, loin du joueur."""
+        distance = self.flow.distance
+        candidates = numpy.flatnonzero(distance >= HAZARDS["spawn_distance"])
+        if not len(candidates):
+            # Petite carte : les cases atteignables les plus éloignées
+            candidates = numpy.flatnonzero((distance == distance.max()) & (distance > 0))
+            if not len(candidates):
+                return
+        cells = numpy.array([random.choice(candidates) for _ in indices], dtype=numpy.int32)
+        self.cells[indices] = cells
+        self.previous[indices] = cells
+        self.progress[indices] = 0
+
+    def update(self, grid, player_cell, count):
+        """Faire avancer les poursuivants d'un tick (recréés si la grille a changé)."""
+        if grid is not self.grid:
+            self.reset(grid, count, player_cell)
+        if not len(self.cells):
+            return
+        # Un seul BFS, refait uniquement quand le joueur change de case
+        self.flow.set_target(player_cell)
+
+        self.progress += self.speed
+        moving = self.progress >= 1
+        if moving.any():
+            self.previous[moving] = self.cells[moving]
+            self.cells[moving] = self.flow.next_cell[self.cells[moving]]
+            self.progress[moving] -= 1
+        self.occupancy = numpy.bincount(self.cells, minlength=len(self.flow.distance))
+
+    def collide(self, player_cell):
+        """Poursuivants sur la case du joueur (indices), renvoyés loin de lui."""
+        if self.occupancy is None or not self.occupancy[self.flow.cell_index(player_cell)]:
+            return []
+        hits = numpy.flatnonzero(self.cells == self.flow.cell_index(player_cell))
+        self.respawn(hits)
+        self.occupancy = numpy.bincount(self.cells, minlength=len(self.flow.distance))
+        return hits.tolist()
+
+    def screen_positions(self, origin):
+        """Positions à l'écran, interpolées entre la case précédente et la case courante."""
+        cols = self.flow.cols
+        previous_y, previous_x = numpy.divmod(self.previous, cols)
+        current_y, current_x = numpy.divmod(self.cells, cols)
+        x = previous_x + (current_x - previous_x) * self.progress
+        y = previous_y + (current_y - previous_y) * self.progress
+        offset_x = origin[0] + self.sprite_offset
+        offset_y = origin[1] + self.sprite_offset
+        return (x * self.cell_step + offset_x).astype(numpy.int32), (y * self.cell_step + offset_y).astype(numpy.int32)
+
+    def draw(self, surface, origin):
+        """Dessiner les poursuivants, la carte commençant en `origin` à l'écran."""
+        if self.flow is None or not len(self.cells):
+            return
+        xs, ys = self.screen_positions(origin)
+        sprite = self.sprite
+        surface.blits([(sprite, position) for position in zip(xs.tolist(), ys.tolist())], doreturn=False)
@@ -0,0 +1,129 @@
+"""
+Couche d'entrée : événements horodatés, déplacements mis en attente.
+
+Chaque frame lit la file d'événements de pygame une seule fois par `poll()` :
+les mouvements de souris sont fusionnés (seul le dernier de la frame est
+gardé, les survols ne sont donc évalués qu'une fois) et chaque entrée reçoit
+l'heure de sa lecture. Une touche de direction pressée pendant le délai entre
+deux pas n'est plus perdue : elle occupe l'unique case de déplacement en
+attente et s'applique dès la fin du délai. Un seul pas par délai, une seule
+direction par pas : plus de double déplacement en diagonale.
+
+Après `pygame.display.flip()`, `mark_presented()` mesure le temps écoulé
+entre la lecture de chaque entrée traitée et l'affichage de son résultat.
+pygame n'expose pas l'heure d'arrivée des événements du système : la mesure
+part de leur lecture, au plus une frame après.
+"""
+import time
+from collections import deque
+import pygame
+
+# Touches de direction : touche -> (dx, dy)
+MOVE_KEYS = {
+    pygame.K_UP: (0, -1), pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1),
+    pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+}
+
+# Entrées dont le résultat est attendu à l'écran dès la frame de leur lecture
+INSTANT_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+class InputQueue:
+    """
+    Entrées de la frame et déplacement en attente.
+
+    Les latences (en ms) des `history` dernières entrées affichées sont
+    gardées pour les percentiles du mode débogage.
+    """
+    def __init__(self, history=240):
+        self.pending_move = None  # (dx, dy, heure de lecture)
+        self.mouse_pos = None  # Dernière position de souris de la frame, ou None si elle n'a pas bougé
+        self.awaiting = []  # Heures de lecture des entrées traitées, pas encore affichées
+        self.latencies = deque(maxlen=history)
+        self.frame_time = time.perf_counter()
+
+        # Compteurs pour le débogage
+        self.coalesced = 0
+        self.replaced = 0
+
+    def poll(self, events=None):
+        """Lire les événements de la frame (un seul MOUSEMOTION, le dernier, à sa place dans l'ordre d'arrivée)."""
+        if events is None:
+            events = pygame.event.get()
+        now = time.perf_counter()
+        frame = []
+        motion = None
+        motion_index = 0
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                if motion is not None:
+                    self.coalesced += 1
+                motion = event
+                motion_index = len(frame)  # Reprend la place du dernier mouvement parmi les autres entrées
+                continue
+            if event.type in INSTANT_EVENTS and not (event.type == pygame.KEYDOWN and event.key in MOVE_KEYS):
+                self.awaiting.append(now)
+            frame.append(event)
+        self.mouse_pos = None
+        if motion is not None:
+            self.mouse_pos = motion.pos
+            frame.insert(motion_index, motion)
+        self.frame_time = now
+        return frame
+
+    def push_move(self, event):
+        """Mettre en attente le déplacement d'un KEYDOWN ; retourne False si ce n'est pas une touche de direction."""
+        direction = MOVE_KEYS.get(getattr(event, "key", None))
+        if direction is None:
+            return False
+        if self.pending_move is not None:
+            self.replaced += 1  # La touche la plus récente l'emporte
+        self.pending_move = (direction[0], direction[1], self.frame_time)
+        return True
+
+    def take_move(self):
+        """Retirer le déplacement en attente ; retourne (dx, dy) ou None."""
+        if self.pending_move is None:
+            return None
+        dx, dy, read_at = self.pending_move
+        self.pending_move = None
+        self.awaiting.append(read_at)
+        return dx, dy
+
+    @staticmethod
+    def held_move():
+        """Direction d'une seule touche maintenue (la première trouvée), pour répéter le pas ; ou None."""
+        keys = pygame.key.get_pressed()
+        for key, direction in MOVE_KEYS.items():
+            if keys[key]:
+                return direction
+        return None
+
+    def clear(self):
+        """Oublier le déplacement en attente (changement d'écran, pause, nouveau niveau)."""
+        self.pending_move = None
+
+    def mark_presented(self):
+        """À appeler juste après `pygame.display.flip()` : enregistre la latence des entrées traitées."""
+        if not self.awaiting:
+            return
+        now = time.perf_counter()
+        self.latencies.extend((now - read_at) * 1000 for read_at in self.awaiting)
+        self.awaiting.clear()
+
+    def percentiles(self, *ranks):
+        """Percentiles des latences (ms), ou None tant qu'aucune entrée n'a été affichée."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        last = len(ordered) - 1
+        return tuple(ordered[min(last, int(rank / 100 * len(ordered)))] for rank in ranks)
+
+    def summary(self):
+        values = self.percentiles(50, 95, 99)
+        if values is None:
+            return "Input p50/95/99: -"
+        p50, p95, p99 = values
+        return f"Input p50/95/99: {p50:.0f}/{p95:.0f}/{p99:.0f} ms"
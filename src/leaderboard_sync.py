@@ -0,0 +1,268 @@
+"""
+Synchronisation optionnelle des scores avec un classement en ligne.
+
+Le jeu ne fait qu'ajouter le score à une file en mémoire ; un thread dédié
+l'envoie par lots sur une connexion HTTP persistante (keep-alive), réessaie
+avec un délai exponentiel quand le réseau ou le serveur est indisponible, et
+garde les scores non envoyés dans une boîte d'envoi sur disque qui est
+reprise au lancement suivant. Chaque score porte un identifiant unique : un
+lot renvoyé après une réponse perdue n'est pas compté deux fois.
+
+`StubLeaderboardServer` est un serveur local minimal pour les essais
+(`python leaderboard_sync.py [port]` le lance seul).
+"""
+import atexit
+import http.client
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# Réponses qui valent la peine d'être réessayées (les autres 4xx rejettent le lot)
+RETRY_STATUSES = {408, 429}
+
+
+class LeaderboardSync:
+    """
+    Client d'envoi des scores vers `url` (POST JSON `{"scores": [...]}`).
+
+    `submit` rend la main immédiatement ; les envois, les attentes entre deux
+    essais et l'écriture de la boîte d'envoi `outbox_file` se font dans le
+    thread du client.
+    """
+    def __init__(self, url, outbox_file, batch_size=50, timeout=5.0, base_backoff=1.0, max_backoff=60.0):
+        parts = urlsplit(url)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path or "/"
+        self.outbox_file = outbox_file
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.lock = threading.Lock()
+        self.pending = deque(self._load_outbox())
+        self.outbox_dirty = False
+        self.connection = None
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+
+        # Compteurs pour le débogage et les benchmarks
+        self.uploaded = 0
+        self.rejected = 0
+        self.requests = 0
+        self.failures = 0
+        self.errors = 0  # Écritures de la boîte d'envoi échouées
+
+        self.thread = threading.Thread(target=self._run, name="leaderboard-sync", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def submit(self, entry):
+        """Ajouter un score à envoyer (copie de `entry` avec un identifiant unique)."""
+        with self.lock:
+            self.pending.append(dict(entry, id=uuid.uuid4().hex))
+            self.outbox_dirty = True
+        self.wakeup.set()
+
+    def wait_until_sent(self, timeout=None):
+        """Attendre que la file soit vide (essais et benchmarks) ; retourne True si tout est parti."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                if not self.pending:
+                    return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+
+    def close(self, timeout=1.0):
+        """Arrêter le thread sans attendre le réseau ; ce qui n'est pas parti reste dans la boîte d'envoi."""
+        if self.stopping.is_set():
+            return
+        self.stopping.set()
+        self.wakeup.set()
+        self.thread.join(timeout)
+        self._try_save_outbox()
+        atexit.unregister(self.close)
+
+    def _run(self):
+        while not self.stopping.is_set():
+            with self.lock:
+                batch = list(itertools.islice(self.pending, self.batch_size))
+            if not batch:
+                self.wakeup.wait()
+                self.wakeup.clear()
+                continue
+
+            # Les scores survivent à une coupure avant même le premier essai
+            self._try_save_outbox()
+            status = self._post(batch)
+            if status is not None and (200 <= status < 300 or (400 <= status < 500 and status not in RETRY_STATUSES)):
+                with self.lock:
+                    for _ in batch:
+                        self.pending.popleft()
+                    self.outbox_dirty = True
+                    if status < 300:
+                        self.uploaded += len(batch)
+                    else:
+                        self.rejected += len(batch)
+                self.failures = 0
+                self._try_save_outbox()
+            else:
+                self.failures += 1
+                delay = min(self.max_backoff, self.base_backoff * 2 ** (self.failures - 1))
+                self.stopping.wait(delay * random.uniform(0.5, 1.0))
+
+    def _post(self, batch):
+        """Envoyer un lot ; retourne le statut HTTP, ou None si le réseau a échoué."""
+        body = json.dumps({"scores": batch}).encode()
+        self.requests += 1
+        try:
+            if self.connection is None:
+                self.connection = self.connection_class(self.host, self.port, timeout=self.timeout)
+            self.connection.request("POST", self.path, body, {"Content-Type": "application/json"})
+            response = self.connection.getresponse()
+            response.read()
+            if response.will_close:
+                self._drop_connection()
+            return response.status
+        except (OSError, http.client.HTTPException):
+            self._drop_connection()
+            return None
+
+    def _drop_connection(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def _load_outbox(self):
+        entries = []
+        try:
+            with open(self.outbox_file, "r") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _save_outbox(self):
+        """Réécrire la boîte d'envoi (fichier temporaire puis renommage) si la file a changé."""
+        with self.lock:
+            if not self.outbox_dirty:
+                return
+            data = "".join(json.dumps(entry) + "\n" for entry in self.pending)
+            temp_file = self.outbox_file + ".tmp"
+            with open(temp_file, "w") as f:
+                f.write(data)
+            os.replace(temp_file, self.outbox_file)
+            self.outbox_dirty = False
+
+    def _try_save_outbox(self):
+        """`_save_outbox` sans interrompre l'envoi : un disque en erreur est compté, la file reste en mémoire."""
+        try:
+            self._save_outbox()
+        except OSError as e:
+            self.errors += 1
+            print(f"Erreur d'écriture de la boîte d'envoi : {e}")
+
+
+class StubLeaderboardServer:
+    """
+    Serveur de classement local : enregistre les scores reçus, dédoublonnés par identifiant.
+
+    `delay` simule un réseau lent (secondes par requête) ; les `fail_next`
+    prochaines requêtes reçoivent une erreur 503.
+    """
+    def __init__(self, port=0, delay=0.0, fail_next=0):
+        self.scores = {}
+        self.requests = 0
+        self.connections = 0
+        self.delay = delay
+        self.fail_next = fail_next
+        self.lock = threading.Lock()
+        self.thread = None
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with stub.lock:
+                    stub.connections += 1
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if stub.delay:
+                    time.sleep(stub.delay)
+                with stub.lock:
+                    stub.requests += 1
+                    failing = stub.fail_next > 0
+                    if failing:
+                        stub.fail_next -= 1
+                if failing:
+                    self._reply(503, {"error": "unavailable"})
+                    return
+                try:
+                    scores = json.loads(body)["scores"]
+                except (ValueError, KeyError, TypeError):
+                    self._reply(400, {"error": "bad request"})
+                    return
+                with stub.lock:
+                    for entry in scores:
+                        stub.scores[entry.get("id") or uuid.uuid4().hex] = entry
+                self._reply(200, {"accepted": len(scores)})
+
+            def do_GET(self):
+                with stub.lock:
+                    best = sorted(stub.scores.values(), key=lambda entry: entry["score"], reverse=True)[:10]
+                self._reply(200, {"scores": best})
+
+            def _reply(self, status, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}/scores"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name="leaderboard-stub", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+if __name__ == "__main__":
+    server = StubLeaderboardServer(int(sys.argv[1]) if len(sys.argv) > 1 else 8765)
+    print(f"Serveur de classement local sur {server.url}")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        server.server.server_close()
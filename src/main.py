@@ -6,37 +6,22 @@ import math
 import sys
 from settings import *
 from game_logic import generate_map, draw_map, load_character_skins, load_bonus_image, check_achievements, apply_weather_effects
-from score_manager import ScoreManager
+from score_manager import ScoreManager, get_score_manager
 from sound_manager import SoundManager
 from modern_background import ModernBackground, EnhancedParallaxBackground
+from font_registry import get_font, load_custom_fonts
+from freeze_frame import FreezeFrame
+import button_keyframes
+import procedural_textures
 import menu
 
 # Initialize managers
-score_manager = ScoreManager()
+score_manager = get_score_manager()
 sound_manager = SoundManager()
 
 # Global variables
 debug_mode = False  # Added debug_mode as a global variable
 
-# Load custom fonts
-def load_custom_fonts():
-    fonts = {}
-    try:
-        # Try to load custom fonts if available
-        fonts['title'] = pygame.font.Font(None, 92)
-        fonts['heading'] = pygame.font.Font(None, 64)
-        fonts['button'] = pygame.font.Font(None, 48)
-        fonts['info'] = pygame.font.Font(None, 36)
-        fonts['small'] = pygame.font.Font(None, 24)
-    except:
-        # Fallback to system fonts
-        fonts['title'] = pygame.font.SysFont('arial', 92)
-        fonts['heading'] = pygame.font.SysFont('arial', 64)
-        fonts['button'] = pygame.font.SysFont('arial', 48)
-        fonts['info'] = pygame.font.SysFont('arial', 36)
-        fonts['small'] = pygame.font.SysFont('arial', 24)
-    return fonts
-
 # Add compatibility methods to SoundManager
 def play_sound(self, sound_name):
     """Compatibility method to map generic sound names to specific methods"""
@@ -159,6 +144,9 @@ class AnimatedButton:
         self.pulse_time = 0
         self.pulse_duration = 0
         self.pulse_max = 30
+        
+        # Pre-render the resting keyframes
+        button_keyframes.prerender(self)
 
     def update(self):
         # Update scale with smooth animation
@@ -187,41 +175,44 @@ class AnimatedButton:
     def draw(self, surface):
         self.update()
         
+        # Choose the pre-rendered keyframe matching the animation
+        frame = button_keyframes.get_frame(self)
+        surface.blit(frame, frame.get_rect(center=self.rect.center))
+    
+    def render_frame(self, state, width, height, glow_radius, pulse_phase):
+        padding = self.max_glow
+        button_surface = pygame.Surface((width + padding*2, height + padding*2), pygame.SRCALPHA)
+        rect = pygame.Rect(padding, padding, width, height)
+        
         # Draw glow effect when hovered
-        if self.glow_radius > 0:
-            glow_surf = pygame.Surface((self.rect.width + self.max_glow*2, self.rect.height + self.max_glow*2), pygame.SRCALPHA)
+        if glow_radius > 0:
+            glow_surf = pygame.Surface((width + self.max_glow*2, height + self.max_glow*2), pygame.SRCALPHA)
             pygame.draw.rect(
                 glow_surf, 
                 self.color_scheme["glow"], 
-                (self.max_glow, self.max_glow, self.rect.width, self.rect.height),
+                (self.max_glow, self.max_glow, width, height),
                 border_radius=15
             )
             # Use try/except for gaussian_blur as it might not be available in all pygame versions
             try:
-                glow_surf = pygame.transform.gaussian_blur(glow_surf, self.glow_radius)
+                glow_surf = pygame.transform.gaussian_blur(glow_surf, glow_radius)
             except AttributeError:
                 # Fallback if gaussian_blur is not available
                 pass
-            surface.blit(glow_surf, (self.rect.x - self.max_glow, self.rect.y - self.max_glow))
+            button_surface.blit(glow_surf, (rect.x - self.max_glow, rect.y - self.max_glow))
         
         # Draw shadow
-        shadow_rect = pygame.Rect(
-            self.rect.x + self.shadow_offset,
-            self.rect.y + self.shadow_offset,
-            self.rect.width,
-            self.rect.height
-        )
         pygame.draw.rect(
-            surface, 
+            button_surface, 
             self.color_scheme["shadow"], 
-            shadow_rect,
+            rect.move(self.shadow_offset, self.shadow_offset),
             border_radius=15
         )
         
         # Calculate button color with pulse effect
-        button_color = self.color_scheme[self.state]
-        if self.pulse_duration > 0:
-            pulse_factor = math.sin(math.pi * self.pulse_time / self.pulse_duration)
+        button_color = self.color_scheme[state]
+        if pulse_phase is not None:
+            pulse_factor = math.sin(math.pi * pulse_phase)
             button_color = tuple(
                 min(255, int(c + (255 - c) * pulse_factor * 0.3))
                 for c in button_color
@@ -229,44 +220,39 @@ class AnimatedButton:
         
         # Draw button
         pygame.draw.rect(
-            surface, 
+            button_surface, 
             button_color, 
-            self.rect,
+            rect,
             border_radius=15
         )
         
         # Add subtle gradient effect
-        gradient = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        for i in range(self.rect.height // 2):
-            alpha = 100 - (i * 2)
-            if alpha > 0:
-                pygame.draw.rect(
-                    gradient, 
-                    (255, 255, 255, alpha), 
-                    (0, i, self.rect.width, 2),
-                    border_radius=15
-                )
-        surface.blit(gradient, self.rect.topleft)
+        gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+        gradient.blit(procedural_textures.alpha_ramp(width, height // 2, (255, 255, 255), 100, 100 - (height // 2) * 2), (0, 0))
+        procedural_textures.apply_rounded_mask(gradient, 15)
+        button_surface.blit(gradient, rect.topleft)
         
         # Draw icon if provided
         if self.icon:
-            icon_size = min(self.rect.height - 20, 32)
+            icon_size = min(height - 20, 32)
             icon_rect = pygame.Rect(0, 0, icon_size, icon_size)
-            icon_rect.centery = self.rect.centery
-            icon_rect.x = self.rect.x + 15
-            surface.blit(pygame.transform.scale(self.icon, (icon_size, icon_size)), icon_rect)
+            icon_rect.centery = rect.centery
+            icon_rect.x = rect.x + 15
+            button_surface.blit(pygame.transform.scale(self.icon, (icon_size, icon_size)), icon_rect)
             text_x_offset = icon_size + 10
         else:
             text_x_offset = 0
         
         # Draw text with slight shadow for depth - ensure text is on top of button
         text_surface = self.fonts['button'].render(self.text, True, (0, 0, 0, 128))
-        text_rect = text_surface.get_rect(center=(self.rect.center[0] + text_x_offset//2 + 2, self.rect.center[1] + 2))
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=(rect.centerx + text_x_offset//2 + 2, rect.centery + 2))
+        button_surface.blit(text_surface, text_rect)
         
         text_surface = self.fonts['button'].render(self.text, True, self.color_scheme["text"])
-        text_rect = text_surface.get_rect(center=(self.rect.center[0] + text_x_offset//2, self.rect.center[1]))
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=(rect.centerx + text_x_offset//2, rect.centery))
+        button_surface.blit(text_surface, text_rect)
+        
+        return button_surface
 
     def is_hovered(self):
         mouse_pos = pygame.mouse.get_pos()
@@ -535,6 +521,9 @@ class Game:
         # Notification system
         self.notifications = []
         
+        # Frozen frame behind the pause and game over screens
+        self.freeze_frame = FreezeFrame()
+        
         # Create HUD panels
         self.create_hud_panels()
         
@@ -563,7 +552,7 @@ class Game:
         pygame.draw.circle(icon, color, (16, 16), 16)
         
         if letter:
-            font = pygame.font.SysFont('arial', 20, bold=True)
+            font = get_font('arial', 20, bold=True)
             text = font.render(letter, True, WHITE)
             text_rect = text.get_rect(center=(16, 16))
             icon.blit(text, text_rect)
@@ -916,14 +905,18 @@ class Game:
         self.screen.blit(copyright_text, copyright_rect)
 
     def draw_pause_menu(self):
-        # First draw the game in the background
-        self.draw_game()
-        
-        # Add a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        # Freeze the darkened game and the pause panel once, when the pause starts
+        if not self.freeze_frame.is_frozen(GameState.PAUSED):
+            self.draw_game()
+            self.freeze_frame.capture(self.screen, GameState.PAUSED, 180, self.draw_pause_panel)
+        self.freeze_frame.draw(self.screen)
         
+        # Draw buttons
+        for button in self.pause_buttons:
+            button.is_hovered()  # Update hover state
+            button.draw(self.screen)
+
+    def draw_pause_panel(self, surface):
         # Draw pause menu panel
         pause_panel = UIPanel(
             SCREEN_WIDTH // 2 - 200, 
@@ -934,26 +927,21 @@ class Game:
             border_color=(41, 128, 185),
             border_width=3
         )
-        pause_panel.draw(self.screen)
+        pause_panel.draw(surface)
         
         # Draw pause title
         pause_title = self.fonts['heading'].render("PAUSED", True, WHITE)
         pause_title_rect = pause_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 180))
-        self.screen.blit(pause_title, pause_title_rect)
+        surface.blit(pause_title, pause_title_rect)
         
         # Draw decorative line
         pygame.draw.line(
-            self.screen, 
+            surface, 
             (41, 128, 185), 
             (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 140),
             (SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2 - 140),
             3
         )
-        
-        # Draw buttons
-        for button in self.pause_buttons:
-            button.is_hovered()  # Update hover state
-            button.draw(self.screen)
 
     def update_game(self):
         # Handle player movement
@@ -1024,6 +1012,9 @@ class Game:
         self.enhanced_parallax.update(self.camera_x)
 
     def draw_game(self):
+        # The game is live again: drop the frozen frame
+        self.freeze_frame.release()
+        
         # Update camera
         target_camera_x = self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_WIDTH // 2
         target_camera_y = self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_HEIGHT // 2
@@ -1180,32 +1171,12 @@ class Game:
         score_manager.save_score(final_score, "Normal", time_played)
         best_scores = score_manager.get_best_scores()
         
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        
-        # Create a panel for the game over screen
-        panel_width = 700
-        panel_height = 500
-        panel = UIPanel(
-            SCREEN_WIDTH // 2 - panel_width // 2,
-            SCREEN_HEIGHT // 2 - panel_height // 2,
-            panel_width, panel_height,
-            color=(30, 30, 30, 230),
-            border_radius=20,
-            border_color=(192, 57, 43),
-            border_width=3
+        # Freeze the last game frame with the panel and statistics drawn on it once
+        self.freeze_frame.capture(
+            self.screen, GameState.GAME_OVER, 180,
+            lambda surface: self.draw_score_summary(surface, final_score, time_played, best_scores)
         )
         
-        # Add decorative header
-        header = pygame.Surface((panel_width, 80), pygame.SRCALPHA)
-        header.fill((192, 57, 43))
-        
-        # Draw game over title
-        game_over_text = self.fonts['heading'].render("Game Over!", True, WHITE)
-        game_over_rect = game_over_text.get_rect(center=(panel_width // 2, 40))
-        header.blit(game_over_text, game_over_rect)
-        
         # Create buttons
         play_again_btn = AnimatedButton(
             SCREEN_WIDTH // 2 - 220, 
@@ -1245,75 +1216,8 @@ class Game:
                     self.state = GameState.MENU
                     return True
             
-            # Draw modern background
-            self.modern_background.update()
-            self.modern_background.draw(self.screen)
-            
-            # Update and draw particles
-            for particle in self.particles:
-                particle.update()
-                particle.draw(self.screen)
-            
-            # Draw overlay
-            self.screen.blit(overlay, (0, 0))
-            
-            # Draw panel
-            panel.draw(self.screen)
-            
-            # Draw header
-            self.screen.blit(header, (SCREEN_WIDTH // 2 - panel_width // 2, SCREEN_HEIGHT // 2 - panel_height // 2))
-            
-            # Draw score with decorative elements
-            y_offset = SCREEN_HEIGHT // 2 - 120
-            final_score_text = self.fonts['heading'].render(f"Final Score: {final_score}", True, WHITE)
-            final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            self.screen.blit(final_score_text, final_score_rect)
-            
-            # Add decorative line
-            pygame.draw.line(
-                self.screen, 
-                (192, 57, 43), 
-                (SCREEN_WIDTH // 2 - 150, y_offset + 50), 
-                (SCREEN_WIDTH // 2 + 150, y_offset + 50), 
-                3
-            )
-            
-            # Draw statistics
-            y_offset += 80
-            stats = [
-                (f"Level Reached: {self.level}", WHITE),
-                (f"Steps Taken: {self.steps}", WHITE),
-                (f"Coins Collected: {self.coins_collected}", WHITE),
-                (f"Time Played: {time_played // 60}m {time_played % 60}s", WHITE)
-            ]
-            
-            for stat, color in stats:
-                stat_text = self.fonts['info'].render(stat, True, color)
-                stat_rect = stat_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-                self.screen.blit(stat_text, stat_rect)
-                y_offset += 40
-            
-            # Add decorative line
-            pygame.draw.line(
-                self.screen, 
-                (192, 57, 43), 
-                (SCREEN_WIDTH // 2 - 150, y_offset), 
-                (SCREEN_WIDTH // 2 + 150, y_offset), 
-                3
-            )
-            
-            # Draw high scores
-            y_offset += 30
-            high_score_title = self.fonts['info'].render("High Scores", True, WHITE)
-            high_score_rect = high_score_title.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            self.screen.blit(high_score_title, high_score_rect)
-            
-            y_offset += 30
-            for period, score in list(best_scores.items())[:2]:  # Show only top 2 scores
-                score_text = self.fonts['small'].render(f"{period.replace('_', ' ').title()}: {score}", True, WHITE)
-                score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-                self.screen.blit(score_text, score_rect)
-                y_offset += 25
+            # Draw the frozen game over screen
+            self.freeze_frame.draw(self.screen)
             
             # Update button hover states
             play_again_btn.is_hovered()
@@ -1328,6 +1232,87 @@ class Game:
         
         return True
 
+    def draw_score_summary(self, surface, final_score, time_played, best_scores):
+        # Create a panel for the game over screen
+        panel_width = 700
+        panel_height = 500
+        panel = UIPanel(
+            SCREEN_WIDTH // 2 - panel_width // 2,
+            SCREEN_HEIGHT // 2 - panel_height // 2,
+            panel_width, panel_height,
+            color=(30, 30, 30, 230),
+            border_radius=20,
+            border_color=(192, 57, 43),
+            border_width=3
+        )
+        
+        # Add decorative header
+        header = pygame.Surface((panel_width, 80), pygame.SRCALPHA)
+        header.fill((192, 57, 43))
+        
+        # Draw game over title
+        game_over_text = self.fonts['heading'].render("Game Over!", True, WHITE)
+        game_over_rect = game_over_text.get_rect(center=(panel_width // 2, 40))
+        header.blit(game_over_text, game_over_rect)
+        
+        # Draw panel
+        panel.draw(surface)
+        
+        # Draw header
+        surface.blit(header, (SCREEN_WIDTH // 2 - panel_width // 2, SCREEN_HEIGHT // 2 - panel_height // 2))
+        
+        # Draw score with decorative elements
+        y_offset = SCREEN_HEIGHT // 2 - 120
+        final_score_text = self.fonts['heading'].render(f"Final Score: {final_score}", True, WHITE)
+        final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
+        surface.blit(final_score_text, final_score_rect)
+        
+        # Add decorative line
+        pygame.draw.line(
+            surface, 
+            (192, 57, 43), 
+            (SCREEN_WIDTH // 2 - 150, y_offset + 50), 
+            (SCREEN_WIDTH // 2 + 150, y_offset + 50), 
+            3
+        )
+        
+        # Draw statistics
+        y_offset += 80
+        stats = [
+            (f"Level Reached: {self.level}", WHITE),
+            (f"Steps Taken: {self.steps}", WHITE),
+            (f"Coins Collected: {self.coins_collected}", WHITE),
+            (f"Time Played: {time_played // 60}m {time_played % 60}s", WHITE)
+        ]
+        
+        for stat, color in stats:
+            stat_text = self.fonts['info'].render(stat, True, color)
+            stat_rect = stat_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
+            surface.blit(stat_text, stat_rect)
+            y_offset += 40
+        
+        # Add decorative line
+        pygame.draw.line(
+            surface, 
+            (192, 57, 43), 
+            (SCREEN_WIDTH // 2 - 150, y_offset), 
+            (SCREEN_WIDTH // 2 + 150, y_offset), 
+            3
+        )
+        
+        # Draw high scores
+        y_offset += 30
+        high_score_title = self.fonts['info'].render("High Scores", True, WHITE)
+        high_score_rect = high_score_title.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
+        surface.blit(high_score_title, high_score_rect)
+        
+        y_offset += 30
+        for period, score in list(best_scores.items())[:2]:  # Show only top 2 scores
+            score_text = self.fonts['small'].render(f"{period.replace('_', ' ').title()}: {score}", True, WHITE)
+            score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
+            surface.blit(score_text, score_rect)
+            y_offset += 25
+
 if __name__ == "__main__":
     game = Game()
     game.run()
@@ -5,11 +5,16 @@ import time
 import math
 import sys
 from settings import *
-from game_logic import generate_map, draw_map, load_character_skins, load_bonus_image, check_achievements, apply_weather_effects
-from score_manager import ScoreManager
+from game_logic import generate_map, draw_map, load_character_skins, load_bonus_image, AchievementTracker, apply_weather_effects
+from score_manager import ScoreManager, get_score_manager
 from sound_manager import SoundManager
 from modern_background import ModernBackground, EnhancedParallaxBackground
 from particle_system import ParticleSystem
+from font_registry import load_custom_fonts
+from freeze_frame import FreezeFrame
+from weather import WeatherSystem
+import button_keyframes
+import procedural_textures
 import menu
 
 # Initialize Pygame
@@ -20,31 +25,12 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Random Blocks Game")
 
 # Initialize managers
-score_manager = ScoreManager()
+score_manager = get_score_manager()
 sound_manager = SoundManager()
 
 # Global variables
 debug_mode = False  # Added debug_mode as a global variable
 
-# Load custom fonts
-def load_custom_fonts():
-    fonts = {}
-    try:
-        # Try to load custom fonts if available
-        fonts['title'] = pygame.font.Font(None, 92)
-        fonts['heading'] = pygame.font.Font(None, 64)
-        fonts['button'] = pygame.font.Font(None, 48)
-        fonts['info'] = pygame.font.Font(None, 36)
-        fonts['small'] = pygame.font.Font(None, 24)
-    except:
-        # Fallback to system fonts
-        fonts['title'] = pygame.font.SysFont('arial', 92)
-        fonts['heading'] = pygame.font.SysFont('arial', 64)
-        fonts['button'] = pygame.font.SysFont('arial', 48)
-        fonts['info'] = pygame.font.SysFont('arial', 36)
-        fonts['small'] = pygame.font.SysFont('arial', 24)
-    return fonts
-
 # Add compatibility methods to SoundManager
 def play_sound(self, sound_name):
     """Compatibility method to map generic sound names to specific methods"""
@@ -167,6 +153,9 @@ class AnimatedButton:
         self.pulse_time = 0
         self.pulse_duration = 0
         self.pulse_max = 30
+        
+        # Pre-render the resting keyframes
+        button_keyframes.prerender(self)
 
     def update(self):
         # Update scale with smooth animation
@@ -195,82 +184,81 @@ class AnimatedButton:
     def draw(self, surface):
         self.update()
         
-        # Draw glow effect if hovered
-        if self.glow_radius > 0:
-            glow_surf = pygame.Surface((self.rect.width + self.max_glow*2, self.rect.height + self.max_glow*2), pygame.SRCALPHA)
+        # Choose the pre-rendered keyframe matching the animation
+        frame = button_keyframes.get_frame(self)
+        surface.blit(frame, frame.get_rect(center=self.rect.center))
+    
+    def render_frame(self, state, width, height, glow_radius, pulse_phase):
+        padding = self.pulse_max if pulse_phase is not None else self.max_glow
+        button_surface = pygame.Surface((width + padding*2, height + padding*2), pygame.SRCALPHA)
+        rect = pygame.Rect(padding, padding, width, height)
+        
+        # Draw glow effect when hovered
+        if glow_radius > 0:
+            glow_surf = pygame.Surface((width + self.max_glow*2, height + self.max_glow*2), pygame.SRCALPHA)
             pygame.draw.rect(
                 glow_surf, 
                 self.color_scheme["glow"], 
-                (self.max_glow, self.max_glow, self.rect.width, self.rect.height),
+                (self.max_glow, self.max_glow, width, height),
                 border_radius=15
             )
+            # Use try/except for gaussian_blur as it might not be available in all pygame versions
             try:
-                glow_surf = pygame.transform.gaussian_blur(glow_surf, self.glow_radius)
-            except:
+                glow_surf = pygame.transform.gaussian_blur(glow_surf, glow_radius)
+            except AttributeError:
                 # Fallback if gaussian_blur is not available
                 pass
-            surface.blit(glow_surf, (self.rect.x - self.max_glow, self.rect.y - self.max_glow))
+            button_surface.blit(glow_surf, (rect.x - self.max_glow, rect.y - self.max_glow))
         
         # Draw shadow
-        shadow_rect = pygame.Rect(
-            self.rect.x + self.shadow_offset,
-            self.rect.y + self.shadow_offset,
-            self.rect.width,
-            self.rect.height
-        )
         pygame.draw.rect(
-            surface, 
+            button_surface, 
             self.color_scheme["shadow"], 
-            shadow_rect,
+            rect.move(self.shadow_offset, self.shadow_offset),
             border_radius=15
         )
         
         # Draw button
         pygame.draw.rect(
-            surface, 
-            self.color_scheme[self.state], 
-            self.rect,
+            button_surface, 
+            self.color_scheme[state], 
+            rect,
             border_radius=15
         )
         
         # Add subtle gradient effect
-        gradient = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        for i in range(self.rect.height // 2):
-            alpha = 100 - (i * 2)
-            if alpha > 0:
-                pygame.draw.rect(
-                    gradient, 
-                    (255, 255, 255, alpha), 
-                    (0, i, self.rect.width, 2),
-                    border_radius=15
-                )
-        surface.blit(gradient, self.rect.topleft)
+        gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+        gradient.blit(procedural_textures.alpha_ramp(width, height // 2, (255, 255, 255), 100, 100 - (height // 2) * 2), (0, 0))
+        procedural_textures.apply_rounded_mask(gradient, 15)
+        button_surface.blit(gradient, rect.topleft)
         
-        # Draw text with shadow for depth
+        # Draw text with slight shadow for depth
         text_surface = self.fonts['button'].render(self.text, True, (0, 0, 0, 128))
-        text_rect = text_surface.get_rect(center=(self.rect.center[0] + 2, self.rect.center[1] + 2))
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=(rect.centerx + 2, rect.centery + 2))
+        button_surface.blit(text_surface, text_rect)
         
         text_surface = self.fonts['button'].render(self.text, True, self.color_scheme["text"])
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=rect.center)
+        button_surface.blit(text_surface, text_rect)
         
         # Draw icon if provided
         if self.icon:
-            icon_rect = self.icon.get_rect(midleft=(self.rect.x + 20, self.rect.centery))
-            surface.blit(self.icon, icon_rect)
+            icon_rect = self.icon.get_rect(midleft=(rect.x + 20, rect.centery))
+            button_surface.blit(self.icon, icon_rect)
         
         # Draw pulse effect if active
-        if self.pulse_duration > 0:
-            pulse_alpha = int(255 * (1 - abs(self.pulse_time / self.pulse_duration - 0.5) * 2))
-            pulse_surf = pygame.Surface((self.rect.width + self.pulse_max*2, self.rect.height + self.pulse_max*2), pygame.SRCALPHA)
+        if pulse_phase is not None:
+            pulse_alpha = int(255 * (1 - abs(pulse_phase - 0.5) * 2))
+            pulse_surf = pygame.Surface((width + self.pulse_max*2, height + self.pulse_max*2), pygame.SRCALPHA)
             pygame.draw.rect(
                 pulse_surf, 
                 (*self.color_scheme["hover"], pulse_alpha), 
-                (0, 0, self.rect.width + self.pulse_max*2, self.rect.height + self.pulse_max*2),
+                (0, 0, width + self.pulse_max*2, height + self.pulse_max*2),
                 border_radius=20
             )
-            surface.blit(pulse_surf, (self.rect.x - self.pulse_max, self.rect.y - self.pulse_max))
+            button_surface.blit(pulse_surf, (0, 0))
+        
+        return button_surface
 
     def is_hovered(self):
         mouse_pos = pygame.mouse.get_pos()
@@ -576,6 +564,7 @@ class Game:
         # Initialize weather
         self.current_weather = random.choice(list(WEATHER.keys()))
         self.achievements_unlocked = []
+        self.achievement_tracker = AchievementTracker()
         
         # Initialize notifications
         self.notifications = []
@@ -590,6 +579,9 @@ class Game:
         # Initialize particle system for visual effects
         self.particle_system = ParticleSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
         
+        # Vectorized weather system (rain, snow)
+        self.weather = WeatherSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
+        
         # Use menu module for particles
         self.particles = menu.particles
         self.overlay = menu.overlay
@@ -600,6 +592,10 @@ class Game:
         # Initialize pause menu buttons
         self.setup_pause_buttons()
         
+        # Frozen frame behind the pause and game over screens
+        self.freeze_frame = FreezeFrame()
+        self.game_over_buttons = None
+        
         # Initialize game
         self.setup_game()
         
@@ -771,7 +767,7 @@ class Game:
                                 
                                 self.character_pos = new_pos
                                 self.steps += 1
-                                self.move_cooldown = self.default_move_cooldown
+                                self.move_cooldown = apply_weather_effects(self.current_weather, self.default_move_cooldown)
                                 
                                 # Add movement particles
                                 self.particle_system.add_movement_particles(
@@ -864,6 +860,7 @@ class Game:
         # Reset weather
         self.current_weather = random.choice(list(WEATHER.keys()))
         self.achievements_unlocked = []
+        self.achievement_tracker = AchievementTracker()
         
         # Play start sound
         sound_manager.play_sound("level_start")
@@ -897,6 +894,7 @@ class Game:
                     
                 elif type == BONUS:
                     self.coins_collected += 1
+                    self.report_achievement_stats(coins_collected=self.coins_collected)
                     self.score += 500
                     self.add_notification("+500 points!", 2000, "purple")
                     
@@ -910,6 +908,12 @@ class Game:
                 self.powerups.remove(powerup)
                 sound_manager.play_powerup()
     
+    def report_achievement_stats(self, **stats):
+        # Only evaluate the achievements that depend on the changed stats
+        for achievement in self.achievement_tracker.update(**stats):
+            self.achievements_unlocked.append(achievement)
+            self.add_notification(f"Achievement Unlocked: {achievement}", 3000, "purple")
+    
     def level_complete(self):
         # Update level
         self.level += 1
@@ -919,6 +923,9 @@ class Game:
         time_bonus = remaining_time * 100
         self.score += time_bonus
         
+        # End-of-level achievements
+        self.report_achievement_stats(level=self.level, time_left=remaining_time, steps=self.steps)
+        
         # Add level completion bonus
         level_bonus = self.level * 1000
         self.score += level_bonus
@@ -986,23 +993,17 @@ class Game:
         if self.move_cooldown > 0:
             self.move_cooldown -= 1
         
+        # Update the current weather's precipitation
+        self.weather.set_weather(self.current_weather)
+        self.weather.update()
+        
         # Update speed boost
         if self.speed_boost and pygame.time.get_ticks() > self.speed_boost_timer:
             self.speed_boost = False
             self.add_notification("Speed Boost ended", 2000, "blue")
         
-        # Apply weather effects
-        self.move_cooldown = apply_weather_effects(self.current_weather, self.move_cooldown)
-        
-        # Check for new achievements
-        time_left = max(0, self.level_time - (pygame.time.get_ticks() - self.start_time) // 1000)
-        new_achievements = check_achievements(self.level, time_left, self.steps, self.coins_collected)
-        for achievement in new_achievements:
-            if achievement not in self.achievements_unlocked:
-                self.achievements_unlocked.append(achievement)
-                self.add_notification(f"Achievement Unlocked: {achievement}", 3000, "purple")
-        
         # Check for game over
+        time_left = max(0, self.level_time - (pygame.time.get_ticks() - self.start_time) // 1000)
         if time_left <= 0:
             self.state = GameState.GAME_OVER
             sound_manager.play_sound("game_over")
@@ -1020,6 +1021,9 @@ class Game:
         self.enhanced_parallax.update(self.camera_x)
 
     def draw_game(self):
+        # The game is live again: drop the frozen frame
+        self.freeze_frame.release()
+        
         # Update camera
         target_camera_x = self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_WIDTH // 2
         target_camera_y = self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_HEIGHT // 2
@@ -1039,6 +1043,9 @@ class Game:
         # Draw particle effects
         self.particle_system.draw(self.screen)
         
+        # Draw weather over the map
+        self.weather.draw(self.screen)
+        
         # Draw UI panel
         ui_panel = Panel(10, 10, 250, 180, (0, 0, 0, 150), border_radius=10, border_color=(255, 255, 255, 50), border_width=2)
         ui_panel.draw(self.screen)
@@ -1118,89 +1125,77 @@ class Game:
         self.screen.blit(version_text, (SCREEN_WIDTH - version_text.get_width() - 20, SCREEN_HEIGHT - version_text.get_height() - 20))
     
     def draw_pause_menu(self):
-        # First draw the game in the background
-        self.draw_game()
-        
-        # Draw overlay
-        overlay_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay_surface.fill((0, 0, 0, 150))
-        self.screen.blit(overlay_surface, (0, 0))
-        
-        # Draw pause title
-        pause_text = self.fonts['heading'].render("Game Paused", True, WHITE)
-        self.screen.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, 150))
+        # Freeze the darkened game and the title once, when the pause starts
+        if not self.freeze_frame.is_frozen(GameState.PAUSED):
+            self.draw_game()
+            self.freeze_frame.capture(self.screen, GameState.PAUSED, 150, self.draw_pause_title)
+        self.freeze_frame.draw(self.screen)
         
         # Draw buttons
         for button in self.pause_buttons:
             button.draw(self.screen)
     
+    def draw_pause_title(self, surface):
+        # Draw pause title
+        pause_text = self.fonts['heading'].render("Game Paused", True, WHITE)
+        surface.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, 150))
+    
     def draw_game_over(self):
-        # Draw background with alpha
-        overlay_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay_surface.fill((0, 0, 0, 200))
-        self.screen.blit(overlay_surface, (0, 0))
+        # Freeze the game and the end-of-game summary once, when the screen is entered
+        if not self.freeze_frame.is_frozen(GameState.GAME_OVER):
+            self.draw_game()
+            self.freeze_frame.capture(self.screen, GameState.GAME_OVER, 200, self.draw_game_over_summary)
+            self.game_over_buttons = (
+                AnimatedButton(SCREEN_WIDTH // 2 - 150, 500, 300, 70, "Play Again", None, "green"),
+                AnimatedButton(SCREEN_WIDTH // 2 - 150, 590, 300, 70, "Main Menu", None, "blue"),
+            )
+        self.freeze_frame.draw(self.screen)
         
+        # Draw buttons
+        restart_btn, menu_btn = self.game_over_buttons
+        restart_btn.draw(self.screen)
+        menu_btn.draw(self.screen)
+        
+        # Handle button clicks
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            
+            if restart_btn.is_pressed(event):
+                self.setup_game()
+                self.state = GameState.PLAYING
+                sound_manager.play_game_theme()
+            
+            if menu_btn.is_pressed(event):
+                self.state = GameState.MENU
+                sound_manager.play_menu_theme()
+    
+    def draw_game_over_summary(self, surface):
         # Draw game over title
         game_over_text = self.fonts['title'].render("Game Over", True, (255, 50, 50))
-        self.screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 150))
+        surface.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 150))
         
         # Draw score
         score_text = self.fonts['heading'].render(f"Final Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 250))
+        surface.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 250))
         
         # Draw level reached
         level_text = self.fonts['info'].render(f"Level Reached: {self.level}", True, WHITE)
-        self.screen.blit(level_text, (SCREEN_WIDTH // 2 - level_text.get_width() // 2, 320))
+        surface.blit(level_text, (SCREEN_WIDTH // 2 - level_text.get_width() // 2, 320))
         
         # Draw coins collected
         coins_text = self.fonts['info'].render(f"Coins Collected: {self.coins_collected}", True, WHITE)
-        self.screen.blit(coins_text, (SCREEN_WIDTH // 2 - coins_text.get_width() // 2, 360))
+        surface.blit(coins_text, (SCREEN_WIDTH // 2 - coins_text.get_width() // 2, 360))
         
         # Draw steps taken
         steps_text = self.fonts['info'].render(f"Steps Taken: {self.steps}", True, WHITE)
-        self.screen.blit(steps_text, (SCREEN_WIDTH // 2 - steps_text.get_width() // 2, 400))
+        surface.blit(steps_text, (SCREEN_WIDTH // 2 - steps_text.get_width() // 2, 400))
         
         # Draw achievements
         if self.achievements_unlocked:
             achievements_text = self.fonts['info'].render(f"Achievements: {', '.join(self.achievements_unlocked)}", True, (255, 215, 0))
-            self.screen.blit(achievements_text, (SCREEN_WIDTH // 2 - achievements_text.get_width() // 2, 440))
-        
-        # Draw restart button
-        restart_btn = AnimatedButton(
-            SCREEN_WIDTH // 2 - 150,
-            500,
-            300, 70,
-            "Play Again",
-            None,
-            "green"
-        )
-        restart_btn.draw(self.screen)
-        
-        # Draw menu button
-        menu_btn = AnimatedButton(
-            SCREEN_WIDTH // 2 - 150,
-            590,
-            300, 70,
-            "Main Menu",
-            None,
-            "blue"
-        )
-        menu_btn.draw(self.screen)
-        
-        # Handle button clicks
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            
-            if restart_btn.is_pressed(event):
-                self.setup_game()
-                self.state = GameState.PLAYING
-                sound_manager.play_game_theme()
-            
-            if menu_btn.is_pressed(event):
-                self.state = GameState.MENU
-                sound_manager.play_menu_theme()
+            surface.blit(achievements_text, (SCREEN_WIDTH // 2 - achievements_text.get_width() // 2, 440))
     
     def draw_notifications(self):
         # Draw all active notifications
@@ -5,10 +5,18 @@ import sys
 from ui_enhancements import UIEffects
 from modern_background_optimized import EnhancedParallaxBackground
 from particle_system_optimized import ParticleSystem
+from surface_cache import get_cache_manager
 from settings import *
-from game_logic import generate_map, draw_map, load_character_skins, load_bonus_image, check_achievements, apply_weather_effects
-from score_manager import ScoreManager
+from game_logic import MAP_PADDING, generate_map, draw_map, load_character_skins, load_bonus_image, AchievementTracker, apply_weather_effects
+from score_manager import ScoreManager, get_score_manager
 from sound_manager import SoundManager
+from font_registry import load_custom_fonts, mark_startup_complete, get_font_stats
+from freeze_frame import FreezeFrame
+from input_queue import InputQueue
+from weather import WeatherSystem
+from fog_of_war import FogOfWar, fov_radius
+from hazards import HazardSwarm, hazard_count
+from dynamic_maze import DynamicMaze, ROAD
 import menu
 
 # Initialize Pygame
@@ -19,32 +27,13 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Random Blocks Game")
 
 # Initialize managers
-score_manager = ScoreManager()
+score_manager = get_score_manager()
 sound_manager = SoundManager()
 ui_effects = UIEffects(SCREEN_WIDTH, SCREEN_HEIGHT)
 
 # Global variables
 debug_mode = False  # Added debug_mode as a global variable
 
-# Load custom fonts
-def load_custom_fonts():
-    fonts = {}
-    try:
-        # Try to load custom fonts if available
-        fonts['title'] = pygame.font.Font(None, 92)
-        fonts['heading'] = pygame.font.Font(None, 64)
-        fonts['button'] = pygame.font.Font(None, 48)
-        fonts['info'] = pygame.font.Font(None, 36)
-        fonts['small'] = pygame.font.Font(None, 24)
-    except:
-        # Fallback to system fonts
-        fonts['title'] = pygame.font.SysFont('arial', 92)
-        fonts['heading'] = pygame.font.SysFont('arial', 64)
-        fonts['button'] = pygame.font.SysFont('arial', 48)
-        fonts['info'] = pygame.font.SysFont('arial', 36)
-        fonts['small'] = pygame.font.SysFont('arial', 24)
-    return fonts
-
 # Add compatibility methods to SoundManager
 def play_sound(self, sound_name):
     """Compatibility method to map generic sound names to specific methods"""
@@ -59,9 +48,11 @@ def play_sound(self, sound_name):
     elif sound_name == "unpause":
         self.unpause_music()
     elif sound_name == "powerup":
-        # Ajout d'un son pour les power-ups
-        self.play_victory()
-    # Other sounds are ignored silently
+        # Son préchargé dans la banque de sons (plus de décodage à chaque ramassage)
+        self.play_powerup()
+    else:
+        # Other preloaded effects (unknown names are ignored silently)
+        self.play_effect(sound_name)
 
 # Add compatibility methods to ScoreManager
 def get_score(self):
@@ -130,12 +121,15 @@ class Game:
         # Initialize movement
         self.move_cooldown = 0
         self.default_move_cooldown = DEFAULT_MOVE_COOLDOWN
+        # Entrées horodatées : un déplacement pressé pendant le cooldown attend sa fin au lieu d'être perdu
+        self.input_queue = InputQueue()
         self.speed_boost = False
         self.speed_boost_timer = 0
         
         # Initialize weather
         self.current_weather = random.choice(list(WEATHER.keys()))
         self.achievements_unlocked = []
+        self.achievement_tracker = AchievementTracker()
         
         # Initialize notifications
         self.notifications = []
@@ -151,6 +145,21 @@ class Game:
         # Initialize particle system for visual effects
         self.particle_system = ParticleSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
         
+        # Vectorized weather system (rain, snow)
+        self.weather = WeatherSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
+        
+        # Fog of war (toggled with F), recomputed only when the player moves
+        self.fog_enabled = False
+        self.fog_of_war = FogOfWar(BLOCK_SIZE + BLOCK_GAP)
+        
+        # Moving hazards chasing the player through one shared flow field
+        self.hazards = HazardSwarm(BLOCK_SIZE + BLOCK_GAP, BLOCK_SIZE)
+        
+        # Destructible and shifting walls; pathfinding state is repaired per changed cell
+        self.maze = DynamicMaze()
+        self.facing = (1, 0)
+        self.last_wall_shift = 0
+        
         # Use menu module for particles
         self.particles = menu.particles
         self.overlay = menu.overlay
@@ -161,6 +170,9 @@ class Game:
         # Initialize pause menu buttons
         self.setup_pause_buttons()
         
+        # Frozen frame behind the pause and game over screens
+        self.freeze_frame = FreezeFrame()
+        
         # Initialize game
         self.setup_game()
         
@@ -185,6 +197,9 @@ class Game:
         # UI animations
         self.ui_animation_time = 0
         
+        # Toutes les polices sont chargées : plus aucune construction attendue
+        mark_startup_complete()
+        
     def setup_menu_buttons(self):
         # Create menu buttons with enhanced UI
         button_width = 300
@@ -357,8 +372,8 @@ class Game:
             ui_effects.update()
             self.ui_animation_time += 1
             
-            # Traiter les événements
-            for event in pygame.event.get():
+            # Traiter les événements (un seul mouvement de souris par frame)
+            for event in self.input_queue.poll():
                 if event.type == pygame.QUIT:
                     pygame.event.clear()  # Effacer les événements en attente
                     pygame.quit()
@@ -367,6 +382,7 @@ class Game:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE and self.state == GameState.PLAYING:
                         self.state = GameState.PAUSED
+                        self.input_queue.clear()
                         sound_manager.play_sound("pause")
                     elif event.key == pygame.K_ESCAPE and self.state == GameState.PAUSED:
                         self.state = GameState.PLAYING
@@ -376,6 +392,13 @@ class Game:
                         global debug_mode
                         debug_mode = not debug_mode
                         self.add_notification(f"Debug mode: {'ON' if debug_mode else 'OFF'}", 2000, "purple")
+                    # Brouillard de guerre
+                    elif event.key == pygame.K_f and self.state == GameState.PLAYING:
+                        self.fog_enabled = not self.fog_enabled
+                        self.add_notification(f"Fog of war: {'ON' if self.fog_enabled else 'OFF'}", 2000, "blue")
+                    # Détruire le mur devant le joueur
+                    elif event.key == pygame.K_SPACE and self.state == GameState.PLAYING:
+                        self.break_wall()
                     # Toggle minimap
                     elif event.key == pygame.K_m and self.state == GameState.PLAYING:
                         if pygame.time.get_ticks() - self.minimap_toggle_time > 500:  # Éviter les doubles clics
@@ -421,6 +444,7 @@ class Game:
             
             # Mettre à jour l'affichage
             pygame.display.flip()
+            self.input_queue.mark_presented()
             
             # Limiter la fréquence d'images
             self.clock.tick(60)
@@ -449,42 +473,36 @@ class Game:
         self.check_tooltips(mouse_pos)
     
     def handle_game_events(self, event):
-        # Gérer les entrées du jeu
+        # Mettre en attente les déplacements : ils sont appliqués par update_game à la fin du cooldown
         if event.type == pygame.KEYDOWN:
-            if self.move_cooldown <= 0:
-                new_pos = list(self.character_pos)
-                
-                if event.key == pygame.K_UP or event.key == pygame.K_w:
-                    new_pos[1] -= 1
-                elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                    new_pos[1] += 1
-                elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                    new_pos[0] -= 1
-                elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                    new_pos[0] += 1
-                
-                # Vérifier si le mouvement est valide - s'assurer qu'on ne peut pas traverser les rochers (valeur 1)
-                if (0 <= new_pos[0] < self.cols and 
-                    0 <= new_pos[1] < self.rows and 
-                    self.grid[new_pos[1]][new_pos[0]] == 0):  # Autoriser le mouvement uniquement sur les espaces vides (0)
-                    
-                    self.character_pos = new_pos
-                    self.steps += 1
-                    self.move_cooldown = self.default_move_cooldown
-                    
-                    # Ajouter des particules de mouvement
-                    self.particle_system.add_movement_particles(
-                        self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_x + MAP_PADDING,
-                        self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_y + MAP_PADDING,
-                        5  # Réduire le nombre de particules
-                    )
-                    
-                    # Vérifier les power-ups
-                    self.check_powerups()
-                    
-                    # Vérifier si on a atteint la fin
-                    if self.character_pos[0] == self.end_pos[0] and self.character_pos[1] == self.end_pos[1]:
-                        self.level_complete()
+            self.input_queue.push_move(event)
+    
+    def move_player(self, dx, dy):
+        new_pos = [self.character_pos[0] + dx, self.character_pos[1] + dy]
+        self.facing = (dx, dy)
+        
+        # Vérifier si le mouvement est valide - s'assurer qu'on ne peut pas traverser les rochers (valeur 1)
+        if (0 <= new_pos[0] < self.cols and 
+            0 <= new_pos[1] < self.rows and 
+            self.grid[new_pos[1]][new_pos[0]] == 0):  # Autoriser le mouvement uniquement sur les espaces vides (0)
+            
+            self.character_pos = new_pos
+            self.steps += 1
+            self.move_cooldown = apply_weather_effects(self.current_weather, self.default_move_cooldown)
+            
+            # Ajouter des particules de mouvement
+            self.particle_system.add_movement_particles(
+                self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_x + MAP_PADDING,
+                self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_y + MAP_PADDING,
+                5  # Réduire le nombre de particules
+            )
+            
+            # Vérifier les power-ups
+            self.check_powerups()
+            
+            # Vérifier si on a atteint la fin
+            if self.character_pos[0] == self.end_pos[0] and self.character_pos[1] == self.end_pos[1]:
+                self.level_complete()
     
     def handle_pause_events(self, event):
         # Gérer les événements du menu de pause
@@ -575,12 +593,14 @@ class Game:
         
         # Réinitialiser le mouvement
         self.move_cooldown = 0
+        self.input_queue.clear()
         self.speed_boost = False
         self.speed_boost_timer = 0
         
         # Réinitialiser la météo
         self.current_weather = random.choice(list(WEATHER.keys()))
         self.achievements_unlocked = []
+        self.achievement_tracker = AchievementTracker()
         
         # Jouer le son de démarrage
         sound_manager.play_sound("level_start")
@@ -588,6 +608,50 @@ class Game:
         # Réinitialiser les caches
         self.ui_elements_cache = {}
     
+    def set_wall(self, cell, value):
+        """Poser ou détruire un mur et réparer localement tout ce qui dépend de la grille"""
+        self.maze.set_cell(cell, value)
+        passable = value == ROAD  # Les murs sont des tuiles (Surface) ou WALL
+        if self.hazards.grid is self.grid:
+            self.hazards.flow.set_passable(cell, passable)
+        if self.fog_of_war.grid is self.grid:
+            self.fog_of_war.set_opaque(cell, not passable)
+        ui_effects.invalidate_minimap()
+    
+    def break_wall(self):
+        """Détruire le mur devant le joueur, contre des points"""
+        self.maze.track(self.grid, self.end_pos)
+        target = (self.character_pos[0] + self.facing[0], self.character_pos[1] + self.facing[1])
+        if not self.maze.is_wall(target):
+            return
+        cost = DESTRUCTIBLE_WALLS["break_cost"]
+        if self.score < cost:
+            self.add_notification(f"Need {cost} points to break a wall", 2000, "red")
+            return
+        
+        self.score -= cost
+        self.set_wall(target, ROAD)
+        self.add_notification(f"Wall destroyed! -{cost} points", 2000, "purple")
+        self.particle_system.add_effect_particles(
+            target[0] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_x + MAP_PADDING + BLOCK_SIZE // 2,
+            target[1] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_y + MAP_PADDING + BLOCK_SIZE // 2,
+            10, (150, 150, 150)
+        )
+    
+    def shift_walls(self):
+        """Déplacer un mur au hasard, sans jamais couper le joueur de la sortie"""
+        excluded = {tuple(self.character_pos), tuple(self.start_pos), tuple(self.end_pos)}
+        excluded.update((x, y) for x, y, _ in self.powerups)
+        if self.hazards.grid is self.grid:
+            excluded.update((cell % self.cols, cell // self.cols) for cell in self.hazards.cells.tolist())
+        
+        removed = self.maze.random_wall()
+        added = self.maze.random_road(excluded)
+        if removed is None or added is None:
+            return
+        # Le mur garde sa tuile ; refusé en entier si le joueur perd la sortie
+        self.maze.move_wall(removed, added, self.character_pos, self.set_wall)
+    
     def check_powerups(self):
         for powerup in self.powerups[:]:
             x, y, type = powerup
@@ -617,6 +681,7 @@ class Game:
                     
                 elif type == BONUS:
                     self.coins_collected += 1
+                    self.report_achievement_stats(coins_collected=self.coins_collected)
                     self.score += 500
                     self.add_notification("+500 points!", 2000, "purple")
                     
@@ -630,6 +695,13 @@ class Game:
                 self.powerups.remove(powerup)
                 sound_manager.play_sound("powerup")
     
+    def report_achievement_stats(self, **stats):
+        # Évaluer seulement les succès qui dépendent des statistiques modifiées
+        for achievement in self.achievement_tracker.update(**stats):
+            self.achievements_unlocked.append(achievement)
+            self.add_notification(f"Achievement Unlocked: {achievement}", 3000, "purple")
+            self.show_achievement_popup("Achievement Unlocked!", achievement)
+    
     def level_complete(self):
         # Mettre à jour le niveau
         self.level += 1
@@ -639,6 +711,9 @@ class Game:
         time_bonus = remaining_time * 100
         self.score += time_bonus
         
+        # Succès de fin de niveau
+        self.report_achievement_stats(level=self.level, time_left=remaining_time, steps=self.steps)
+        
         # Ajouter un bonus de complétion de niveau
         level_bonus = self.level * 1000
         self.score += level_bonus
@@ -663,6 +738,7 @@ class Game:
         
         # Réinitialiser le mouvement
         self.move_cooldown = 0
+        self.input_queue.clear()
         self.speed_boost = False
         self.speed_boost_timer = 0
         
@@ -703,28 +779,44 @@ class Game:
         self.update_notifications()
     
     def update_game(self):
+        # Appliquer le déplacement en attente dès que le cooldown est écoulé
+        if self.move_cooldown <= 0:
+            move = self.input_queue.take_move()
+            if move:
+                self.move_player(*move)
+        
         # Mettre à jour le cooldown de mouvement
         if self.move_cooldown > 0:
             self.move_cooldown -= 1
         
+        # Mettre à jour les précipitations de la météo courante
+        self.weather.set_weather(self.current_weather)
+        self.weather.update()
+        
+        # Champ de vision : recalculé seulement si le joueur a bougé
+        if self.fog_enabled:
+            self.fog_of_war.update(self.grid, self.character_pos, fov_radius(self.current_weather))
+        
+        # Murs mouvants : un mur change de place à intervalle régulier
+        if self.maze.track(self.grid, self.end_pos):
+            self.last_wall_shift = pygame.time.get_ticks()
+        elif pygame.time.get_ticks() - self.last_wall_shift > DESTRUCTIBLE_WALLS["shift_interval"]:
+            self.last_wall_shift = pygame.time.get_ticks()
+            self.shift_walls()
+        
+        # Faire avancer les dangers (champ de flux recalculé seulement si le joueur change de case)
+        self.hazards.update(self.grid, self.character_pos, hazard_count(self.level))
+        if self.hazards.collide(self.character_pos):
+            self.start_time -= HAZARDS["time_penalty"] * 1000
+            self.add_notification(f"Hazard hit! -{HAZARDS['time_penalty']} seconds", 2000, "red")
+        
         # Mettre à jour le boost de vitesse
         if self.speed_boost and pygame.time.get_ticks() > self.speed_boost_timer:
             self.speed_boost = False
             self.add_notification("Speed Boost ended", 2000, "blue")
         
-        # Appliquer les effets météo
-        self.move_cooldown = apply_weather_effects(self.current_weather, self.move_cooldown)
-        
-        # Vérifier les nouveaux succès
-        time_left = max(0, self.level_time - (pygame.time.get_ticks() - self.start_time) // 1000)
-        new_achievements = check_achievements(self.level, time_left, self.steps, self.coins_collected)
-        for achievement in new_achievements:
-            if achievement not in self.achievements_unlocked:
-                self.achievements_unlocked.append(achievement)
-                self.add_notification(f"Achievement Unlocked: {achievement}", 3000, "purple")
-                self.show_achievement_popup("Achievement Unlocked!", achievement)
-        
         # Vérifier la fin de partie
+        time_left = max(0, self.level_time - (pygame.time.get_ticks() - self.start_time) // 1000)
         if time_left <= 0:
             self.state = GameState.GAME_OVER
             sound_manager.play_sound("game_over")
@@ -844,6 +936,9 @@ class Game:
         self.screen.blit(version_text, (SCREEN_WIDTH - 160, SCREEN_HEIGHT - 50))
     
     def draw_game(self):
+        # Le jeu est de nouveau affiché en direct : libérer l'image figée
+        self.freeze_frame.release()
+        
         # Mettre à jour la caméra
         target_camera_x = self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_WIDTH // 2
         target_camera_y = self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_HEIGHT // 2
@@ -860,9 +955,18 @@ class Game:
             self.character_image, self.bonus_image, self.map_background
         )
         
+        # Dessiner les dangers puis le brouillard de guerre (masque de lumière en cache)
+        map_origin = (-self.camera_x + MAP_PADDING, -self.camera_y + MAP_PADDING)
+        self.hazards.draw(self.screen, map_origin)
+        if self.fog_enabled:
+            self.fog_of_war.draw(self.screen, map_origin)
+        
         # Dessiner les effets de particules
         self.particle_system.draw(self.screen)
         
+        # Dessiner la météo par-dessus la carte
+        self.weather.draw(self.screen)
+        
         # Dessiner l'interface utilisateur
         self.draw_game_ui()
         
@@ -948,7 +1052,8 @@ class Game:
     def draw_minimap(self):
         # Dessiner la mini-carte
         minimap_size = 150
-        minimap = ui_effects.create_minimap(
+        ui_effects.draw_minimap(
+            self.screen, (SCREEN_WIDTH - minimap_size - 20, 20),
             minimap_size, minimap_size,
             self.character_pos,
             self.grid,
@@ -956,36 +1061,13 @@ class Game:
             self.end_pos,
             "blue"
         )
-        self.screen.blit(minimap, (SCREEN_WIDTH - minimap_size - 20, 20))
     
     def draw_pause_menu(self):
-        # D'abord dessiner le jeu en arrière-plan
-        self.draw_game()
-        
-        # Dessiner la superposition
-        overlay_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay_surface.fill((0, 0, 0, 150))
-        self.screen.blit(overlay_surface, (0, 0))
-        
-        # Dessiner le panneau de pause
-        pause_panel = ui_effects.create_glass_panel(
-            400, 450, 
-            (0, 0, 0, 200), 
-            (255, 255, 255, 100), 
-            2,
-            20
-        )
-        self.screen.blit(pause_panel, (SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 - 225))
-        
-        # Dessiner le titre de pause avec effet néon
-        pause_text = ui_effects.create_neon_text(
-            "Game Paused",
-            self.fonts['heading'],
-            (255, 255, 255),
-            (100, 100, 255),
-            8
-        )
-        self.screen.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, 150))
+        # Figer le jeu assombri et le panneau une seule fois, à l'entrée dans la pause
+        if not self.freeze_frame.is_frozen(GameState.PAUSED):
+            self.draw_game()
+            self.freeze_frame.capture(self.screen, GameState.PAUSED, 150, self.draw_pause_panel)
+        self.freeze_frame.draw(self.screen)
         
         # Dessiner les boutons
         for button in self.pause_buttons:
@@ -1016,12 +1098,44 @@ class Game:
             
             self.screen.blit(button_surface, button["rect"].topleft)
     
+    def draw_pause_panel(self, surface):
+        # Dessiner le panneau de pause
+        pause_panel = ui_effects.create_glass_panel(
+            400, 450, 
+            (0, 0, 0, 200), 
+            (255, 255, 255, 100), 
+            2,
+            20
+        )
+        surface.blit(pause_panel, (SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 - 225))
+        
+        # Dessiner le titre de pause avec effet néon
+        pause_text = ui_effects.create_neon_text(
+            "Game Paused",
+            self.fonts['heading'],
+            (255, 255, 255),
+            (100, 100, 255),
+            8
+        )
+        surface.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, 150))
+    
     def draw_game_over(self):
-        # Dessiner l'arrière-plan avec alpha
-        overlay_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay_surface.fill((0, 0, 0, 200))
-        self.screen.blit(overlay_surface, (0, 0))
+        # Figer le jeu et l'écran de fin de partie une seule fois, à l'entrée dans l'écran
+        if not self.freeze_frame.is_frozen(GameState.GAME_OVER):
+            self.draw_game()
+            self.freeze_frame.capture(self.screen, GameState.GAME_OVER, 200, self.draw_game_over_screen)
+        self.freeze_frame.draw(self.screen)
         
+        # Ajouter des effets de particules
+        for _ in range(5):
+            x = random.randint(0, SCREEN_WIDTH)
+            y = random.randint(0, SCREEN_HEIGHT)
+            self.particle_system.add_effect_particles(
+                x, y, 10, 
+                (random.randint(200, 255), random.randint(0, 100), random.randint(0, 100))
+            )
+    
+    def draw_game_over_screen(self, surface):
         # Dessiner le panneau de fin de partie
         game_over_panel = ui_effects.create_glass_panel(
             500, 500, 
@@ -1030,7 +1144,7 @@ class Game:
             2,
             20
         )
-        self.screen.blit(game_over_panel, (SCREEN_WIDTH // 2 - 250, 100))
+        surface.blit(game_over_panel, (SCREEN_WIDTH // 2 - 250, 100))
         
         # Dessiner le titre de fin de partie avec effet néon
         game_over_text = ui_effects.create_neon_text(
@@ -1040,7 +1154,7 @@ class Game:
             (255, 0, 0),
             10
         )
-        self.screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 150))
+        surface.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 150))
         
         # Dessiner le score avec effet néon
         score_text = ui_effects.create_neon_text(
@@ -1050,7 +1164,7 @@ class Game:
             (255, 215, 0),
             5
         )
-        self.screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 250))
+        surface.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 250))
         
         # Dessiner les statistiques
         stats_y = 320
@@ -1058,20 +1172,20 @@ class Game:
         
         # Niveau atteint
         level_text = self.fonts['info'].render(f"Level Reached: {self.level}", True, (255, 255, 255))
-        self.screen.blit(level_text, (SCREEN_WIDTH // 2 - level_text.get_width() // 2, stats_y))
+        surface.blit(level_text, (SCREEN_WIDTH // 2 - level_text.get_width() // 2, stats_y))
         
         # Pièces collectées
         coins_text = self.fonts['info'].render(f"Coins Collected: {self.coins_collected}", True, (255, 255, 255))
-        self.screen.blit(coins_text, (SCREEN_WIDTH // 2 - coins_text.get_width() // 2, stats_y + stats_spacing))
+        surface.blit(coins_text, (SCREEN_WIDTH // 2 - coins_text.get_width() // 2, stats_y + stats_spacing))
         
         # Pas effectués
         steps_text = self.fonts['info'].render(f"Steps Taken: {self.steps}", True, (255, 255, 255))
-        self.screen.blit(steps_text, (SCREEN_WIDTH // 2 - steps_text.get_width() // 2, stats_y + 2 * stats_spacing))
+        surface.blit(steps_text, (SCREEN_WIDTH // 2 - steps_text.get_width() // 2, stats_y + 2 * stats_spacing))
         
         # Dessiner les succès
         if self.achievements_unlocked:
             achievements_text = self.fonts['info'].render(f"Achievements: {', '.join(self.achievements_unlocked)}", True, (255, 215, 0))
-            self.screen.blit(achievements_text, (SCREEN_WIDTH // 2 - achievements_text.get_width() // 2, stats_y + 3 * stats_spacing))
+            surface.blit(achievements_text, (SCREEN_WIDTH // 2 - achievements_text.get_width() // 2, stats_y + 3 * stats_spacing))
         
         # Dessiner les boutons
         restart_btn_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, 500, 300, 70)
@@ -1086,7 +1200,7 @@ class Game:
         restart_text = self.fonts['button'].render("Play Again", True, (255, 255, 255))
         restart_text_rect = restart_text.get_rect(center=(150, 35))
         restart_btn_surface.blit(restart_text, restart_text_rect)
-        self.screen.blit(restart_btn_surface, restart_btn_rect.topleft)
+        surface.blit(restart_btn_surface, restart_btn_rect.topleft)
         
         # Bouton de menu
         menu_btn_surface = ui_effects.create_gradient_button(
@@ -1097,16 +1211,7 @@ class Game:
         menu_text = self.fonts['button'].render("Main Menu", True, (255, 255, 255))
         menu_text_rect = menu_text.get_rect(center=(150, 35))
         menu_btn_surface.blit(menu_text, menu_text_rect)
-        self.screen.blit(menu_btn_surface, menu_btn_rect.topleft)
-        
-        # Ajouter des effets de particules
-        for _ in range(5):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            self.particle_system.add_effect_particles(
-                x, y, 10, 
-                (random.randint(200, 255), random.randint(0, 100), random.randint(0, 100))
-            )
+        surface.blit(menu_btn_surface, menu_btn_rect.topleft)
     
     def draw_notifications(self):
         # Dessiner toutes les notifications actives
@@ -1180,7 +1285,7 @@ class Game:
     
     def draw_debug_info(self):
         # Créer le panneau de débogage
-        debug_panel = ui_effects.create_glass_panel(210, 120, (0, 0, 0, 180), (255, 255, 255, 50), 1, 5)
+        debug_panel = ui_effects.create_glass_panel(210, 270, (0, 0, 0, 180), (255, 255, 255, 50), 1, 5)
         self.screen.blit(debug_panel, (SCREEN_WIDTH - 220, 10))
         
         # Dessiner le FPS (utiliser la valeur mise en cache)
@@ -1198,6 +1303,26 @@ class Game:
         # Dessiner la position de la caméra
         camera_text = self.fonts['small'].render(f"Camera: {int(self.camera_x)},{int(self.camera_y)}", True, (255, 255, 255))
         self.screen.blit(camera_text, (SCREEN_WIDTH - 200, 110))
+        
+        # Dessiner l'état des caches de surfaces
+        cache_text = self.fonts['small'].render(get_cache_manager().summary(), True, (255, 255, 255))
+        self.screen.blit(cache_text, (SCREEN_WIDTH - 200, 140))
+        
+        # Dessiner le nombre de polices créées depuis le démarrage (doit rester à 0)
+        font_text = self.fonts['small'].render(f"Fonts after startup: {get_font_stats()['after_startup']}", True, (255, 255, 255))
+        self.screen.blit(font_text, (SCREEN_WIDTH - 200, 170))
+        
+        # Dessiner le temps passé dans les appels audio sur le thread de jeu (dernier appel et pire cas)
+        audio_text = self.fonts['small'].render(sound_manager.timer.summary(), True, (255, 255, 255))
+        self.screen.blit(audio_text, (SCREEN_WIDTH - 200, 200))
+        
+        # Dessiner la latence entre la lecture d'une entrée et l'affichage de son résultat
+        input_text = self.fonts['small'].render(self.input_queue.summary(), True, (255, 255, 255))
+        self.screen.blit(input_text, (SCREEN_WIDTH - 200, 230))
+        
+        # Dessiner le nombre d'écritures de scores échouées (thread d'écriture différée)
+        writes_text = self.fonts['small'].render(f"Score writes failed: {score_manager.writer.errors}", True, (255, 255, 255))
+        self.screen.blit(writes_text, (SCREEN_WIDTH - 200, 260))
 
 # Fonction principale
 def main():
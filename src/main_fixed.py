@@ -2,7 +2,21 @@ import pygame
 import random
 import math
 import os
+from datetime import datetime
 from particle_system_fixed import ParticleSystem
+from glow_bank import get_glow_bank
+from surface_cache import create_surface_cache
+from glyph_atlas import get_glyph_atlas
+from font_registry import get_font
+from animation_sheets import AnimationSheet
+from freeze_frame import FreezeFrame
+from bloom import BloomPass
+from settings import BLOOM_ENABLED
+from score_manager import get_score_manager
+from sound_bank import SoundBank
+from sound_synth import add_fallback_effects
+from input_queue import InputQueue
+import procedural_textures
 
 # Couleurs
 WHITE = (255, 255, 255)
@@ -40,50 +54,28 @@ class EnhancedParallaxBackground:
     def initialize_layers(self):
         # Couche 1 (la plus éloignée) - Étoiles lointaines
         layer1 = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        for _ in range(100):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            size = random.randint(1, 2)
-            alpha = random.randint(100, 200)
-            color = (255, 255, 255, alpha)
-            pygame.draw.circle(layer1, color, (x, y), size)
+        procedural_textures.scatter_dots(layer1, 100, WHITE, radius_range=(1, 2), alpha_range=(100, 200))
         self.layers.append({"surface": layer1, "speed": 0.1, "position": 0})
         
         # Couche 2 - Étoiles moyennes
         layer2 = pygame.Surface((self.width * 2, self.height), pygame.SRCALPHA)
-        for _ in range(150):
-            x = random.randint(0, self.width * 2)
-            y = random.randint(0, self.height)
-            size = random.randint(1, 3)
-            alpha = random.randint(150, 250)
-            color = (255, 255, 255, alpha)
-            pygame.draw.circle(layer2, color, (x, y), size)
+        procedural_textures.scatter_dots(layer2, 150, WHITE, radius_range=(1, 3), alpha_range=(150, 250))
         self.layers.append({"surface": layer2, "speed": 0.3, "position": 0})
         
-        # Couche 3 - Nébuleuses colorées
+        # Couche 3 - Nébuleuses colorées (bruit procédural)
         layer3 = pygame.Surface((self.width * 2, self.height), pygame.SRCALPHA)
-        for _ in range(5):
-            x = random.randint(0, self.width * 2)
-            y = random.randint(0, self.height)
-            size = random.randint(50, 150)
-            alpha = random.randint(20, 40)
-            color_choices = [
-                (255, 100, 100, alpha),  # Rouge
-                (100, 100, 255, alpha),  # Bleu
-                (255, 100, 255, alpha),  # Violet
-                (100, 255, 255, alpha),  # Cyan
-            ]
-            color = random.choice(color_choices)
-            
-            # Créer une surface pour la nébuleuse
-            nebula = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            for i in range(20):
-                offset_x = random.randint(-size//2, size//2)
-                offset_y = random.randint(-size//2, size//2)
-                radius = random.randint(size//4, size//2)
-                pygame.draw.circle(nebula, color, (size + offset_x, size + offset_y), radius)
-            
-            layer3.blit(nebula, (x - size, y - size))
+        color_choices = [
+            (255, 100, 100),  # Rouge
+            (100, 100, 255),  # Bleu
+            (255, 100, 255),  # Violet
+            (100, 255, 255),  # Cyan
+        ]
+        for color in random.sample(color_choices, 2):
+            nebula = procedural_textures.noise_texture(
+                self.width * 2, self.height, color,
+                max_alpha=random.randint(20, 40), cell_size=128, threshold=0.6
+            )
+            layer3.blit(nebula, (0, 0))
         self.layers.append({"surface": layer3, "speed": 0.5, "position": 0})
         
         # Couche 4 - Étoiles proches
@@ -96,13 +88,7 @@ class EnhancedParallaxBackground:
             pygame.draw.circle(layer4, color, (x, y), size)
             
             # Ajouter un effet de lueur
-            glow_size = size * 2
-            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            for radius in range(size, glow_size, 1):
-                alpha = 150 - (radius - size) * (150 / (glow_size - size))
-                pygame.draw.circle(glow_surface, (255, 255, 255, int(alpha)), (glow_size, glow_size), radius)
-            
-            layer4.blit(glow_surface, (x - glow_size, y - glow_size))
+            get_glow_bank().blit_glow(layer4, (x, y), size * 2, WHITE, 150, size)
         self.layers.append({"surface": layer4, "speed": 0.8, "position": 0})
     
     def update(self, direction):
@@ -126,7 +112,14 @@ class UIEffects:
         self.width = width
         self.height = height
         self.animation_time = 0
-        self.cached_surfaces = {}
+        # Cache LRU borné : le texte néon du HUD change à chaque seconde et à chaque point
+        self.cached_surfaces = create_surface_cache("main_fixed.ui_effects", 8 * 1024 * 1024)
+        self.glow_bank = get_glow_bank()
+        
+        # Minimap cuite pour la grille du niveau en cours
+        self.minimap_base = None
+        self.minimap_grid = None
+        self.minimap_powerups = []
         
     def update(self):
         self.animation_time += 1
@@ -136,28 +129,15 @@ class UIEffects:
     def create_gradient_button(self, width, height, color1, color2, border_radius=10):
         key = f"gradient_button_{width}_{height}_{color1}_{color2}_{border_radius}"
         
-        if key in self.cached_surfaces:
-            return self.cached_surfaces[key]
+        cached = self.cached_surfaces.get(key)
+        if cached is not None:
+            return cached
             
-        button = pygame.Surface((width, height), pygame.SRCALPHA)
         rect = pygame.Rect(0, 0, width, height)
         
-        # Créer le dégradé
-        for y in range(height):
-            ratio = y / height
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            pygame.draw.line(button, (r, g, b), (0, y), (width, y))
-            
-        # Appliquer le masque arrondi
-        mask = pygame.Surface((width, height), pygame.SRCALPHA)
-        pygame.draw.rect(mask, (255, 255, 255), rect, border_radius=border_radius)
-        
-        # Combiner le dégradé et le masque
-        result = pygame.Surface((width, height), pygame.SRCALPHA)
-        result.blit(button, (0, 0))
-        result.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        # Créer le dégradé et appliquer le masque arrondi
+        result = procedural_textures.linear_gradient(width, height, color1, color2)
+        procedural_textures.apply_rounded_mask(result, border_radius)
         
         # Ajouter une bordure
         pygame.draw.rect(result, (255, 255, 255, 100), rect, width=2, border_radius=border_radius)
@@ -168,8 +148,9 @@ class UIEffects:
     def create_glass_panel(self, width, height, bg_color=(0, 0, 0, 150), border_color=(255, 255, 255, 50), border_width=1):
         key = f"glass_panel_{width}_{height}_{bg_color}_{border_color}_{border_width}"
         
-        if key in self.cached_surfaces:
-            return self.cached_surfaces[key]
+        cached = self.cached_surfaces.get(key)
+        if cached is not None:
+            return cached
             
         panel = pygame.Surface((width, height), pygame.SRCALPHA)
         rect = pygame.Rect(0, 0, width, height)
@@ -194,8 +175,9 @@ class UIEffects:
     def create_neon_text(self, text, font, text_color, glow_color, glow_radius=5):
         key = f"neon_text_{text}_{font.get_height()}_{text_color}_{glow_color}_{glow_radius}"
         
-        if key in self.cached_surfaces:
-            return self.cached_surfaces[key]
+        cached = self.cached_surfaces.get(key)
+        if cached is not None:
+            return cached
             
         # Rendu du texte
         text_surface = font.render(text, True, text_color)
@@ -226,8 +208,9 @@ class UIEffects:
         animation_frame = (self.animation_time // 5) % 8
         key = f"animated_icon_{icon_type}_{size}_{color}_{animation_frame}"
         
-        if key in self.cached_surfaces:
-            return self.cached_surfaces[key]
+        cached = self.cached_surfaces.get(key)
+        if cached is not None:
+            return cached
             
         icon = pygame.Surface((size, size), pygame.SRCALPHA)
         
@@ -305,8 +288,9 @@ class UIEffects:
     def create_progress_bar(self, width, height, progress, color_scheme="blue"):
         key = f"progress_bar_{width}_{height}_{progress}_{color_scheme}"
         
-        if key in self.cached_surfaces:
-            return self.cached_surfaces[key]
+        cached = self.cached_surfaces.get(key)
+        if cached is not None:
+            return cached
             
         bar = pygame.Surface((width, height), pygame.SRCALPHA)
         
@@ -340,13 +324,13 @@ class UIEffects:
             fill_width = int(width * progress)
             fill_rect = pygame.Rect(0, 0, fill_width, height)
             
-            # Créer un dégradé pour le remplissage
-            for x in range(fill_width):
-                ratio = x / width
-                r = int(fill_color1[0] * (1 - ratio) + fill_color2[0] * ratio)
-                g = int(fill_color1[1] * (1 - ratio) + fill_color2[1] * ratio)
-                b = int(fill_color1[2] * (1 - ratio) + fill_color2[2] * ratio)
-                pygame.draw.line(bar, (r, g, b), (x, 0), (x, height))
+            # Créer un dégradé pour le remplissage (pleine largeur, recadré à la progression)
+            gradient_key = f"progress_gradient_{width}_{height}_{color_scheme}"
+            gradient = self.cached_surfaces.get(gradient_key)
+            if gradient is None:
+                gradient = self.cached_surfaces.put(gradient_key, procedural_textures.linear_gradient(
+                    width, height, fill_color1, fill_color2, vertical=False))
+            bar.blit(gradient, (0, 0), (0, 0, fill_width, height))
                 
             # Appliquer le masque arrondi
             mask = pygame.Surface((fill_width, height), pygame.SRCALPHA)
@@ -372,8 +356,9 @@ class UIEffects:
             
         key = f"tooltip_{text}_{width}_{height}"
         
-        if key in self.cached_surfaces:
-            return self.cached_surfaces[key]
+        cached = self.cached_surfaces.get(key)
+        if cached is not None:
+            return cached
             
         tooltip = pygame.Surface((width, height), pygame.SRCALPHA)
         
@@ -428,17 +413,11 @@ class UIEffects:
             
         return lines
         
-    def create_minimap(self, width, height, player_pos, grid, visible_area=None):
-        key = f"minimap_{width}_{height}_{player_pos}_{visible_area}"
-        
-        # Ne pas mettre en cache la minimap car elle change constamment
-        minimap = pygame.Surface((width, height), pygame.SRCALPHA)
-        
-        # Fond semi-transparent
-        pygame.draw.rect(minimap, (0, 0, 0, 150), (0, 0, width, height), border_radius=5)
-        
-        # Bordure
-        pygame.draw.rect(minimap, (100, 100, 255, 200), (0, 0, width, height), width=1, border_radius=5)
+    def draw_minimap(self, target, position, width, height, player_pos, grid, visible_area=None):
+        # La grille est cuite une fois par niveau et blittée telle quelle ; les éléments dynamiques
+        # sont dessinés directement sur la cible, sans copie de la minimap
+        left, top = position
+        target.blit(self.get_minimap_base(width, height, grid), position)
         
         # Calculer l'échelle
         grid_width = len(grid[0]) if grid and grid[0] else 0
@@ -447,56 +426,75 @@ class UIEffects:
         if grid_width > 0 and grid_height > 0:
             cell_width = (width - 10) / grid_width
             cell_height = (height - 10) / grid_height
-            
-            # Dessiner la grille
-            for y in range(grid_height):
-                for x in range(grid_width):
-                    cell_x = 5 + x * cell_width
-                    cell_y = 5 + y * cell_height
-                    
-                    if grid[y][x] == 1:  # Mur
-                        pygame.draw.rect(minimap, (100, 100, 100), 
-                                        (cell_x, cell_y, cell_width, cell_height))
-                    elif grid[y][x] == 2:  # Fin
-                        pygame.draw.rect(minimap, (0, 255, 0), 
-                                        (cell_x, cell_y, cell_width, cell_height))
-                    elif grid[y][x] == 3:  # Power-up
-                        pygame.draw.rect(minimap, (255, 255, 0), 
-                                        (cell_x, cell_y, cell_width, cell_height))
-            
-            # Dessiner la zone visible si spécifiée
+            origin_x = left + 5
+            origin_y = top + 5
+            previous_clip = target.get_clip()
+            target.set_clip(pygame.Rect(left, top, width, height).clip(previous_clip))
+            
+            # Dessiner les power-ups pas encore ramassés
+            for x, y in self.minimap_powerups:
+                if grid[y][x] == 3:
+                    pygame.draw.rect(target, (255, 255, 0), 
+                                    (origin_x + x * cell_width, origin_y + y * cell_height, cell_width, cell_height))
+            
+            # Dessiner la zone visible si spécifiée (cadre semi-transparent pré-rendu)
             if visible_area:
                 x, y, w, h = visible_area
-                vis_x = 5 + x * cell_width
-                vis_y = 5 + y * cell_height
-                vis_w = w * cell_width
-                vis_h = h * cell_height
-                pygame.draw.rect(minimap, (255, 255, 255, 50), 
-                                (vis_x, vis_y, vis_w, vis_h), width=1)
+                frame = self.get_minimap_frame(int(round(w * cell_width)), int(round(h * cell_height)))
+                target.blit(frame, (origin_x + x * cell_width, origin_y + y * cell_height))
             
             # Dessiner la position du joueur
             if player_pos:
-                player_x = 5 + player_pos[0] * cell_width + cell_width / 2
-                player_y = 5 + player_pos[1] * cell_height + cell_height / 2
+                player_x = origin_x + player_pos[0] * cell_width + cell_width / 2
+                player_y = origin_y + player_pos[1] * cell_height + cell_height / 2
                 
                 # Effet de pulsation
                 pulse = math.sin(self.animation_time * 0.1) * 0.2 + 0.8
                 player_radius = max(3, min(cell_width, cell_height) / 2 * pulse)
                 
                 # Dessiner un cercle avec une lueur
-                glow_radius = player_radius * 1.5
-                glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                for r in range(int(player_radius), int(glow_radius), 1):
-                    alpha = 150 - (r - player_radius) * (150 / (glow_radius - player_radius))
-                    pygame.draw.circle(glow_surface, (255, 100, 100, int(alpha)), 
-                                    (glow_radius, glow_radius), r)
-                
-                minimap.blit(glow_surface, 
-                            (player_x - glow_radius, player_y - glow_radius))
-                pygame.draw.circle(minimap, (255, 0, 0), 
+                self.glow_bank.blit_glow(target, (player_x, player_y), player_radius * 1.5,
+                                         (255, 100, 100), 150, player_radius)
+                pygame.draw.circle(target, (255, 0, 0), 
                                 (player_x, player_y), player_radius)
+            
+            target.set_clip(previous_clip)
+    
+    def get_minimap_frame(self, width, height):
+        """Cadre semi-transparent de la zone visible, rendu une fois par taille."""
+        key = ("minimap_frame", width, height)
+        frame = self.cached_surfaces.get(key)
+        if frame is None:
+            frame = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+            pygame.draw.rect(frame, (255, 255, 255, 50), frame.get_rect(), width=1)
+            self.cached_surfaces[key] = frame
+        return frame
+    
+    def get_minimap_base(self, width, height, grid):
+        """Fond, bordure, murs et sortie de la minimap, recalculés seulement quand la grille change."""
+        if grid is self.minimap_grid and self.minimap_base.get_size() == (width, height):
+            return self.minimap_base
+        
+        base = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # Fond semi-transparent
+        pygame.draw.rect(base, (0, 0, 0, 150), (0, 0, width, height), border_radius=5)
+        
+        # Bordure
+        pygame.draw.rect(base, (100, 100, 255, 200), (0, 0, width, height), width=1, border_radius=5)
+        
+        self.minimap_powerups = []
+        if grid and grid[0]:
+            # Murs et sortie à 1 pixel par case, mis à l'échelle
+            palette = {1: (100, 100, 100), 2: (0, 255, 0)}
+            base.blit(procedural_textures.grid_texture(grid, palette, width - 10, height - 10), (5, 5))
+            
+            # Les power-ups disparaissent en cours de niveau : ils sont dessinés à part
+            self.minimap_powerups = [(x, y) for y, row in enumerate(grid) for x, cell in enumerate(row) if cell == 3]
         
-        return minimap
+        self.minimap_base = base
+        self.minimap_grid = grid
+        return base
 
 # Classe principale du jeu
 class Game:
@@ -505,8 +503,24 @@ class Game:
         pygame.display.set_caption("Labyrinthe Amélioré")
         
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("Arial", 24)
-        self.small_font = pygame.font.SysFont("Arial", 16)
+        # Polices partagées, créées une fois au démarrage
+        self.font = get_font("Arial", 24)
+        self.small_font = get_font("Arial", 16)
+        self.title_font = get_font("Arial", 48)
+        self.heading_font = get_font("Arial", 36)
+        self.description_font = get_font("Arial", 18)
+        
+        # Bloom plein écran sur demande (BLOOM_ENABLED ou touche B) ; par défaut, lueurs par objet
+        self.bloom = BloomPass(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.bloom_enabled = BLOOM_ENABLED
+        
+        # Texte néon du HUD composé à partir de glyphes pré-rendus
+        self.hud_text = self.create_hud_text()
+        
+        # Tableau des scores : panneau rendu en cache, refait seulement quand un nouveau score arrive
+        self.score_manager = get_score_manager()
+        self.high_scores_panel = None
+        self.high_scores_revision = None
         
         self.state = "menu"
         self.level = 1
@@ -529,6 +543,8 @@ class Game:
         
         self.move_cooldown = 0
         self.default_move_cooldown = 10
+        # Entrées horodatées : un déplacement pressé pendant le cooldown attend sa fin au lieu d'être perdu
+        self.input_queue = InputQueue()
         
         self.menu_buttons = []
         self.pause_buttons = []
@@ -556,6 +572,9 @@ class Game:
         self.particle_system = ParticleSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.parallax_background = EnhancedParallaxBackground(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.ui_effects = UIEffects(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.glow_bank = get_glow_bank()
+        self.animation_sheets = None
+        self.freeze_frame = FreezeFrame()
         
         # Charger les sons
         self.load_sounds()
@@ -564,21 +583,20 @@ class Game:
         self.setup_game()
         
     def load_sounds(self):
-        self.sounds = {}
-        try:
-            self.sounds["move"] = pygame.mixer.Sound("move.wav")
-            self.sounds["win"] = pygame.mixer.Sound("win.wav")
-            self.sounds["menu"] = pygame.mixer.Sound("menu.wav")
-            self.sounds["button"] = pygame.mixer.Sound("button.wav")
-            self.sounds["powerup"] = pygame.mixer.Sound("powerup.wav")
-            self.sounds["pause"] = pygame.mixer.Sound("pause.wav")
-            self.sounds["unpause"] = pygame.mixer.Sound("unpause.wav")
-        except:
-            print("Certains sons n'ont pas pu être chargés.")
+        # Sons décodés une fois, chacun chargé séparément : un fichier manquant n'empêche pas les autres
+        self.sound_bank = SoundBank()
+        categories = {"move": "move", "win": "jingle", "menu": "ui", "button": "ui",
+                      "powerup": "pickup", "pause": "ui", "unpause": "ui"}
+        for name, category in categories.items():
+            if os.path.exists(f"{name}.wav"):
+                self.sound_bank.load(name, f"{name}.wav", category)
+            else:
+                self.sound_bank.missing.append(name)
+        # Les sons absents sont remplacés par des effets synthétisés (mis en cache sur disque)
+        add_fallback_effects(self.sound_bank, categories)
             
     def play_sound(self, sound_name):
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        self.sound_bank.play(sound_name)
             
     def setup_game(self):
         self.create_menu_buttons()
@@ -651,6 +669,10 @@ class Game:
         ]
         
     def generate_level(self):
+        # Les tuiles animées sont rendues une fois, au premier chargement de niveau
+        if self.animation_sheets is None:
+            self.create_animation_sheets()
+        
         self.rows = 10 + self.level
         self.cols = 10 + self.level
         
@@ -793,8 +815,9 @@ class Game:
         self.target_camera_x = self.camera_x
         self.target_camera_y = self.camera_y
         
-        # Réinitialiser les compteurs
+        # Réinitialiser les compteurs (et oublier un pas mis en attente sur l'ancien niveau)
         self.steps = 0
+        self.input_queue.clear()
         self.time_start = pygame.time.get_ticks()
         self.time_elapsed = 0
         
@@ -807,18 +830,22 @@ class Game:
         
     def resume_game(self):
         self.state = "playing"
+        self.input_queue.clear()
         self.play_sound("unpause")
         
     def show_high_scores(self):
         self.state = "high_scores"
+        self.input_queue.clear()
         self.play_sound("menu")
         
     def show_settings(self):
         self.state = "settings"
+        self.input_queue.clear()
         self.play_sound("menu")
         
     def return_to_menu(self):
         self.state = "menu"
+        self.input_queue.clear()
         self.play_sound("menu")
         
     def quit_game(self):
@@ -895,7 +922,8 @@ class Game:
         self.active_tooltip = None
         
     def handle_events(self):
-        for event in pygame.event.get():
+        # Un seul mouvement de souris par frame : les survols ne sont évalués qu'une fois
+        for event in self.input_queue.poll():
             if event.type == pygame.QUIT:
                 self.quit_game()
                 
@@ -905,11 +933,13 @@ class Game:
                 elif self.state == "paused":
                     if event.key == pygame.K_ESCAPE:
                         self.state = "playing"
+                        self.input_queue.clear()
                         self.play_sound("unpause")
                 elif self.state == "menu" or self.state == "high_scores" or self.state == "settings":
                     if event.key == pygame.K_ESCAPE:
                         if self.state == "high_scores" or self.state == "settings":
                             self.state = "menu"
+                            self.input_queue.clear()
                             self.play_sound("menu")
                             
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -923,6 +953,7 @@ class Game:
                         back_button_rect = pygame.Rect(20, 20, 100, 40)
                         if back_button_rect.collidepoint(event.pos):
                             self.state = "menu"
+                            self.input_queue.clear()
                             self.play_sound("menu")
                             
             elif event.type == pygame.MOUSEMOTION:
@@ -934,52 +965,51 @@ class Game:
     def handle_game_events(self, event):
         if event.key == pygame.K_ESCAPE:
             self.state = "paused"
+            self.input_queue.clear()
             self.play_sound("pause")
         elif event.key == pygame.K_m:
             if pygame.time.get_ticks() - self.minimap_toggle_time > 500:
                 self.show_minimap = not self.show_minimap
                 self.minimap_toggle_time = pygame.time.get_ticks()
                 self.add_notification(f"Minimap: {'ON' if self.show_minimap else 'OFF'}", 2000, "blue")
+        elif event.key == pygame.K_b:
+            self.set_bloom(not self.bloom_enabled)
+            self.add_notification(f"Bloom: {'ON' if self.bloom_enabled else 'OFF'}", 2000, "blue")
                 
-        if self.move_cooldown <= 0:
-            new_pos = list(self.character_pos)
-            
-            if event.key == pygame.K_UP or event.key == pygame.K_w:
-                new_pos[1] -= 1
-            elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                new_pos[1] += 1
-            elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                new_pos[0] -= 1
-            elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                new_pos[0] += 1
-                
-            # Vérifier si la nouvelle position est valide
-            if (0 <= new_pos[0] < self.cols and 
-                0 <= new_pos[1] < self.rows and 
-                self.grid[new_pos[1]][new_pos[0]] != 1):  # Pas un mur
-                
-                self.character_pos = new_pos
-                self.steps += 1
-                self.move_cooldown = self.default_move_cooldown
-                self.play_sound("move")
-                
-                # Mettre à jour la caméra
-                self.target_camera_x = self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_WIDTH // 2 + BLOCK_SIZE // 2
-                self.target_camera_y = self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_HEIGHT // 2 + BLOCK_SIZE // 2
-                
-                # Ajouter des particules de mouvement
-                self.particle_system.add_movement_particles(
-                    self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_x + MAP_PADDING + BLOCK_SIZE // 2,
-                    self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_y + MAP_PADDING + BLOCK_SIZE // 2,
-                    5
-                )
-                
-                # Vérifier les power-ups
-                self.check_powerups()
-                
-                # Vérifier si on a atteint la fin
-                if self.character_pos[0] == self.end_pos[0] and self.character_pos[1] == self.end_pos[1]:
-                    self.level_complete()
+        else:
+            # Appliqué par update_game à la fin du cooldown
+            self.input_queue.push_move(event)
+            
+    def move_player(self, dx, dy):
+        new_pos = [self.character_pos[0] + dx, self.character_pos[1] + dy]
+        
+        # Vérifier si la nouvelle position est valide
+        if (0 <= new_pos[0] < self.cols and 
+            0 <= new_pos[1] < self.rows and 
+            self.grid[new_pos[1]][new_pos[0]] != 1):  # Pas un mur
+            
+            self.character_pos = new_pos
+            self.steps += 1
+            self.move_cooldown = self.default_move_cooldown
+            self.play_sound("move")
+            
+            # Mettre à jour la caméra
+            self.target_camera_x = self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_WIDTH // 2 + BLOCK_SIZE // 2
+            self.target_camera_y = self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_HEIGHT // 2 + BLOCK_SIZE // 2
+            
+            # Ajouter des particules de mouvement
+            self.particle_system.add_movement_particles(
+                self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_x + MAP_PADDING + BLOCK_SIZE // 2,
+                self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_y + MAP_PADDING + BLOCK_SIZE // 2,
+                5
+            )
+            
+            # Vérifier les power-ups
+            self.check_powerups()
+            
+            # Vérifier si on a atteint la fin
+            if self.character_pos[0] == self.end_pos[0] and self.character_pos[1] == self.end_pos[1]:
+                self.level_complete()
                     
     def handle_menu_click(self, pos):
         for button in self.menu_buttons:
@@ -1027,6 +1057,12 @@ class Game:
         # Mettre à jour le temps écoulé
         self.time_elapsed = pygame.time.get_ticks() - self.time_start
         
+        # Appliquer le déplacement en attente dès que le cooldown est écoulé
+        if self.move_cooldown <= 0:
+            move = self.input_queue.take_move()
+            if move:
+                self.move_player(*move)
+                
         # Mettre à jour le cooldown de mouvement
         if self.move_cooldown > 0:
             self.move_cooldown -= 1
@@ -1055,8 +1091,7 @@ class Game:
         self.particle_system.draw(self.screen)
         
         # Dessiner le titre
-        title_font = pygame.font.SysFont("Arial", 48)
-        title_text = self.ui_effects.create_neon_text("Labyrinthe Amélioré", title_font, WHITE, (0, 100, 255), 10)
+        title_text = self.ui_effects.create_neon_text("Labyrinthe Amélioré", self.title_font, WHITE, (0, 100, 255), 10)
         self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 100))
         
         # Dessiner les boutons
@@ -1085,6 +1120,9 @@ class Game:
         self.screen.blit(version_text, (SCREEN_WIDTH - version_text.get_width() - 10, SCREEN_HEIGHT - version_text.get_height() - 10))
         
     def draw_game(self):
+        # Le jeu est de nouveau affiché en direct : libérer l'image figée
+        self.freeze_frame.release()
+        
         # Dessiner le fond
         self.screen.fill(BLACK)
         self.parallax_background.draw(self.screen)
@@ -1102,6 +1140,10 @@ class Game:
         if self.show_minimap:
             self.draw_minimap()
             
+        # Lueur de toute la scène en une seule passe
+        if self.bloom_enabled:
+            self.bloom.apply(self.screen)
+            
     def draw_map(self):
         # Calculer les limites visibles de la grille
         min_col = max(0, int(self.camera_x / (BLOCK_SIZE + BLOCK_GAP)) - 1)
@@ -1110,133 +1152,156 @@ class Game:
         max_row = min(self.rows, min_row + SCREEN_HEIGHT // (BLOCK_SIZE + BLOCK_GAP) + 2)
         
         # Dessiner seulement les cellules visibles
+        wall_blits = []
+        animated_tiles = []
         for y in range(min_row, max_row):
             for x in range(min_col, max_col):
                 cell_x = x * (BLOCK_SIZE + BLOCK_GAP) - int(self.camera_x) + MAP_PADDING
                 cell_y = y * (BLOCK_SIZE + BLOCK_GAP) - int(self.camera_y) + MAP_PADDING
                 
                 if self.grid[y][x] == 1:  # Mur
-                    wall_color = (100, 100, 100)
-                    
-                    # Créer un effet de profondeur
-                    pygame.draw.rect(self.screen, (50, 50, 50), 
-                                    (cell_x + 2, cell_y + 2, BLOCK_SIZE, BLOCK_SIZE))
-                    pygame.draw.rect(self.screen, wall_color, 
-                                    (cell_x, cell_y, BLOCK_SIZE, BLOCK_SIZE))
-                    
-                    # Ajouter un effet de bord
-                    pygame.draw.line(self.screen, (150, 150, 150), 
-                                    (cell_x, cell_y), (cell_x + BLOCK_SIZE, cell_y))
-                    pygame.draw.line(self.screen, (150, 150, 150), 
-                                    (cell_x, cell_y), (cell_x, cell_y + BLOCK_SIZE))
-                    pygame.draw.line(self.screen, (50, 50, 50), 
-                                    (cell_x + BLOCK_SIZE, cell_y), (cell_x + BLOCK_SIZE, cell_y + BLOCK_SIZE))
-                    pygame.draw.line(self.screen, (50, 50, 50), 
-                                    (cell_x, cell_y + BLOCK_SIZE), (cell_x + BLOCK_SIZE, cell_y + BLOCK_SIZE))
-                    
-                elif self.grid[y][x] == 2:  # Fin
-                    # Dessiner un portail animé
-                    center_x = cell_x + BLOCK_SIZE // 2
-                    center_y = cell_y + BLOCK_SIZE // 2
+                    wall_blits.append((self.wall_tile, (cell_x, cell_y)))
                     
-                    # Animation de pulsation
-                    pulse = math.sin(self.ui_animation_time * 0.1) * 0.2 + 0.8
-                    radius = int(BLOCK_SIZE // 2 * pulse)
-                    
-                    # Dessiner plusieurs cercles concentriques
-                    for i in range(3):
-                        r = radius - i * 3
-                        if r > 0:
-                            color = (0, 255 - i * 50, 0)
-                            pygame.draw.circle(self.screen, color, (center_x, center_y), r)
-                            
-                    # Ajouter un effet de lueur
-                    glow_surface = pygame.Surface((BLOCK_SIZE * 2, BLOCK_SIZE * 2), pygame.SRCALPHA)
-                    for r in range(radius, radius + 10):
-                        alpha = 100 - (r - radius) * 10
-                        if alpha > 0:
-                            pygame.draw.circle(glow_surface, (0, 255, 0, alpha), 
-                                            (BLOCK_SIZE, BLOCK_SIZE), r)
-                    
-                    self.screen.blit(glow_surface, 
-                                    (center_x - BLOCK_SIZE, center_y - BLOCK_SIZE))
-                    
-                elif self.grid[y][x] == 3:  # Power-up
-                    # Dessiner un power-up animé
-                    center_x = cell_x + BLOCK_SIZE // 2
-                    center_y = cell_y + BLOCK_SIZE // 2
-                    
-                    # Animation de rotation
-                    angle = self.ui_animation_time * 5
-                    size = BLOCK_SIZE // 3
-                    
-                    # Dessiner une étoile
-                    points = []
-                    for i in range(5):
-                        # Point extérieur
-                        a = math.radians(angle + i * 72)
-                        x = center_x + math.cos(a) * size
-                        y = center_y + math.sin(a) * size
-                        points.append((x, y))
-                        
-                        # Point intérieur
-                        a = math.radians(angle + i * 72 + 36)
-                        x = center_x + math.cos(a) * (size // 2)
-                        y = center_y + math.sin(a) * (size // 2)
-                        points.append((x, y))
-                        
-                    pygame.draw.polygon(self.screen, YELLOW, points)
+                elif self.grid[y][x] == 2:  # Fin (portail animé)
+                    animated_tiles.append((self.animation_sheets["portal"], (cell_x + BLOCK_SIZE // 2, cell_y + BLOCK_SIZE // 2)))
                     
-                    # Ajouter un effet de lueur
-                    glow_surface = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE), pygame.SRCALPHA)
-                    for r in range(size, size + 5):
-                        alpha = 100 - (r - size) * 20
-                        if alpha > 0:
-                            pygame.draw.circle(glow_surface, (255, 255, 0, alpha), 
-                                            (BLOCK_SIZE // 2, BLOCK_SIZE // 2), r)
-                    
-                    self.screen.blit(glow_surface, 
-                                    (center_x - BLOCK_SIZE // 2, center_y - BLOCK_SIZE // 2))
+                elif self.grid[y][x] == 3:  # Power-up animé
+                    animated_tiles.append((self.animation_sheets["powerup"], (cell_x + BLOCK_SIZE // 2, cell_y + BLOCK_SIZE // 2)))
                     
+        # Les murs sont posés en un seul appel (dans l'ordre des cases, pour les ombres)
+        self.screen.blits(wall_blits, doreturn=False)
+        
+        # Puis les tuiles animées, pour que leur lueur passe au-dessus des murs
+        for sheet, center in animated_tiles:
+            sheet.blit(self.screen, center, self.ui_animation_time)
+        
         # Dessiner le personnage
         char_x = self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - int(self.camera_x) + MAP_PADDING
         char_y = self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - int(self.camera_y) + MAP_PADDING
+        self.animation_sheets["player"].blit(self.screen, (char_x + BLOCK_SIZE // 2, char_y + BLOCK_SIZE // 2))
+        
+    def set_bloom(self, enabled):
+        # Les lueurs par objet (tuiles animées, texte du HUD) sont retirées quand le bloom les remplace
+        self.bloom_enabled = enabled
+        self.hud_text = self.create_hud_text()
+        if self.animation_sheets is not None:
+            self.create_animation_sheets()
+            
+    def create_hud_text(self):
+        if self.bloom_enabled:
+            hud_text = get_glyph_atlas(self.font, WHITE)
+        else:
+            hud_text = get_glyph_atlas(self.font, WHITE, (0, 100, 255), 3)
+        hud_text.preload("Niveau: Score: Temps: Pas:")
+        return hud_text
+        
+    def create_animation_sheets(self):
+        self.animation_sheets = {
+            # Pulsation du portail : sin(t * 0.1), soit une période de 2π / 0.1 frames
+            "portal": AnimationSheet(self.render_portal_frame, 32, 2 * math.pi / 0.1),
+            # Rotation de l'étoile de 5° par frame ; elle se répète tous les 72°
+            "powerup": AnimationSheet(self.render_powerup_frame, 12, 72 / 5),
+            "player": AnimationSheet(self.render_player_frame, 1),
+        }
+        self.wall_tile = self.render_wall_tile()
+        
+    def render_wall_tile(self):
+        tile = pygame.Surface((BLOCK_SIZE + 3, BLOCK_SIZE + 3), pygame.SRCALPHA)
+        wall_color = (100, 100, 100)
+        
+        # Créer un effet de profondeur
+        pygame.draw.rect(tile, (50, 50, 50), (2, 2, BLOCK_SIZE, BLOCK_SIZE))
+        pygame.draw.rect(tile, wall_color, (0, 0, BLOCK_SIZE, BLOCK_SIZE))
+        
+        # Ajouter un effet de bord
+        pygame.draw.line(tile, (150, 150, 150), (0, 0), (BLOCK_SIZE, 0))
+        pygame.draw.line(tile, (150, 150, 150), (0, 0), (0, BLOCK_SIZE))
+        pygame.draw.line(tile, (50, 50, 50), (BLOCK_SIZE, 0), (BLOCK_SIZE, BLOCK_SIZE))
+        pygame.draw.line(tile, (50, 50, 50), (0, BLOCK_SIZE), (BLOCK_SIZE, BLOCK_SIZE))
+        return tile
+        
+    def render_portal_frame(self, phase):
+        extent = BLOCK_SIZE // 2 + 10
+        frame = pygame.Surface((extent * 2, extent * 2), pygame.SRCALPHA)
+        center_x = center_y = extent
+        
+        # Animation de pulsation
+        pulse = math.sin(phase * 2 * math.pi) * 0.2 + 0.8
+        radius = int(BLOCK_SIZE // 2 * pulse)
+        
+        # Dessiner plusieurs cercles concentriques
+        for i in range(3):
+            r = radius - i * 3
+            if r > 0:
+                color = (0, 255 - i * 50, 0)
+                pygame.draw.circle(frame, color, (center_x, center_y), r)
+                
+        # Ajouter un effet de lueur
+        if not self.bloom_enabled:
+            self.glow_bank.blit_glow(frame, (center_x, center_y), radius + 10,
+                                     (0, 255, 0), 100, radius)
+        return frame
+        
+    def render_powerup_frame(self, phase):
+        size = BLOCK_SIZE // 3
+        extent = size + 5
+        frame = pygame.Surface((extent * 2, extent * 2), pygame.SRCALPHA)
+        center_x = center_y = extent
+        
+        # Animation de rotation
+        angle = phase * 72
         
+        # Dessiner une étoile
+        points = []
+        for i in range(5):
+            # Point extérieur
+            a = math.radians(angle + i * 72)
+            points.append((center_x + math.cos(a) * size, center_y + math.sin(a) * size))
+            
+            # Point intérieur
+            a = math.radians(angle + i * 72 + 36)
+            points.append((center_x + math.cos(a) * (size // 2), center_y + math.sin(a) * (size // 2)))
+            
+        pygame.draw.polygon(frame, YELLOW, points)
+        
+        # Ajouter un effet de lueur
+        if not self.bloom_enabled:
+            self.glow_bank.blit_glow(frame, (center_x, center_y), size + 5,
+                                     (255, 255, 0), 100, size)
+        return frame
+        
+    def render_player_frame(self, phase):
         # Dessiner un personnage plus élaboré
-        center_x = char_x + BLOCK_SIZE // 2
-        center_y = char_y + BLOCK_SIZE // 2
         radius = BLOCK_SIZE // 3
+        extent = radius * 2
+        frame = pygame.Surface((extent * 2, extent * 2), pygame.SRCALPHA)
+        center_x = center_y = extent
         
         # Corps principal
-        pygame.draw.circle(self.screen, (255, 100, 100), (center_x, center_y), radius)
+        pygame.draw.circle(frame, (255, 100, 100), (center_x, center_y), radius)
         
         # Yeux
         eye_offset = radius // 3
         eye_size = radius // 4
-        pygame.draw.circle(self.screen, WHITE, (center_x - eye_offset, center_y - eye_offset), eye_size)
-        pygame.draw.circle(self.screen, WHITE, (center_x + eye_offset, center_y - eye_offset), eye_size)
+        pygame.draw.circle(frame, WHITE, (center_x - eye_offset, center_y - eye_offset), eye_size)
+        pygame.draw.circle(frame, WHITE, (center_x + eye_offset, center_y - eye_offset), eye_size)
         
         # Pupilles
         pupil_size = eye_size // 2
-        pygame.draw.circle(self.screen, BLACK, (center_x - eye_offset, center_y - eye_offset), pupil_size)
-        pygame.draw.circle(self.screen, BLACK, (center_x + eye_offset, center_y - eye_offset), pupil_size)
+        pygame.draw.circle(frame, BLACK, (center_x - eye_offset, center_y - eye_offset), pupil_size)
+        pygame.draw.circle(frame, BLACK, (center_x + eye_offset, center_y - eye_offset), pupil_size)
         
         # Bouche
         mouth_y = center_y + eye_offset
-        pygame.draw.arc(self.screen, BLACK, 
+        pygame.draw.arc(frame, BLACK, 
                         (center_x - radius // 2, mouth_y - radius // 2, radius, radius // 2),
                         0, math.pi, 2)
         
         # Ajouter un effet de lueur
-        glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
-        for r in range(radius, radius * 2):
-            alpha = 100 - (r - radius) * (100 // radius)
-            if alpha > 0:
-                pygame.draw.circle(glow_surface, (255, 100, 100, alpha), 
-                                (radius * 2, radius * 2), r)
-        
-        self.screen.blit(glow_surface, 
-                        (center_x - radius * 2, center_y - radius * 2))
+        if not self.bloom_enabled:
+            self.glow_bank.blit_glow(frame, (center_x, center_y), radius * 2,
+                                     (255, 100, 100), 100, radius)
+        return frame
         
     def draw_game_ui(self):
         # Créer un panneau pour les informations
@@ -1244,22 +1309,18 @@ class Game:
         self.screen.blit(panel, (10, 10))
         
         # Afficher le niveau
-        level_text = self.ui_effects.create_neon_text(f"Niveau: {self.level}", self.font, WHITE, (0, 100, 255), 3)
-        self.screen.blit(level_text, (20, 20))
+        self.hud_text.draw(self.screen, f"Niveau: {self.level}", (20, 20))
         
         # Afficher le score
-        score_text = self.ui_effects.create_neon_text(f"Score: {self.score}", self.font, WHITE, (0, 100, 255), 3)
-        self.screen.blit(score_text, (150, 20))
+        self.hud_text.draw(self.screen, f"Score: {self.score}", (150, 20))
         
         # Afficher le temps
         minutes = self.time_elapsed // 60000
         seconds = (self.time_elapsed % 60000) // 1000
-        time_text = self.ui_effects.create_neon_text(f"Temps: {minutes:02}:{seconds:02}", self.font, WHITE, (0, 100, 255), 3)
-        self.screen.blit(time_text, (300, 20))
+        self.hud_text.draw(self.screen, f"Temps: {minutes:02}:{seconds:02}", (300, 20))
         
         # Afficher les pas
-        steps_text = self.ui_effects.create_neon_text(f"Pas: {self.steps}", self.font, WHITE, (0, 100, 255), 3)
-        self.screen.blit(steps_text, (450, 20))
+        self.hud_text.draw(self.screen, f"Pas: {self.steps}", (450, 20))
         
         # Afficher le FPS
         fps_text = self.small_font.render(self.fps_display, True, (150, 150, 150))
@@ -1279,33 +1340,20 @@ class Game:
         visible_x = int(self.camera_x / (BLOCK_SIZE + BLOCK_GAP))
         visible_y = int(self.camera_y / (BLOCK_SIZE + BLOCK_GAP))
         
-        minimap = self.ui_effects.create_minimap(
-            minimap_width, minimap_height, 
+        # Dessinée dans le coin inférieur droit
+        self.ui_effects.draw_minimap(
+            self.screen, (SCREEN_WIDTH - minimap_width - 20, SCREEN_HEIGHT - minimap_height - 20),
+            minimap_width, minimap_height,
             self.character_pos, self.grid,
             (visible_x, visible_y, visible_width, visible_height)
         )
         
-        # Positionner la minimap dans le coin inférieur droit
-        self.screen.blit(minimap, (SCREEN_WIDTH - minimap_width - 20, SCREEN_HEIGHT - minimap_height - 20))
-        
     def draw_pause_menu(self):
-        # Assombrir l'écran de jeu
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Créer un panneau pour le menu de pause
-        panel_width = 300
-        panel_height = 250
-        panel_x = SCREEN_WIDTH // 2 - panel_width // 2
-        panel_y = SCREEN_HEIGHT // 2 - panel_height // 2
-        
-        panel = self.ui_effects.create_glass_panel(panel_width, panel_height, (0, 0, 0, 200), (100, 100, 255, 150), 2)
-        self.screen.blit(panel, (panel_x, panel_y))
-        
-        # Titre du menu de pause
-        title_text = self.ui_effects.create_neon_text("Pause", pygame.font.SysFont("Arial", 36), WHITE, (0, 100, 255), 5)
-        self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, panel_y + 20))
+        # Figer le jeu assombri avec le panneau une seule fois, à l'entrée dans la pause
+        if not self.freeze_frame.is_frozen("paused"):
+            self.draw_game()
+            self.freeze_frame.capture(self.screen, "paused", 150, self.draw_pause_panel)
+        self.freeze_frame.draw(self.screen)
         
         # Dessiner les boutons
         for button in self.pause_buttons:
@@ -1328,59 +1376,72 @@ class Game:
             text_y = button["rect"].centery - text_surface.get_height() // 2
             self.screen.blit(text_surface, (text_x, text_y))
             
-    def draw_high_scores(self):
-        # Dessiner le fond
-        self.screen.fill(BLACK)
-        self.parallax_background.draw(self.screen)
-        
-        # Dessiner les particules
-        self.particle_system.draw(self.screen)
-        
-        # Créer un panneau pour les scores
-        panel_width = 500
-        panel_height = 400
+    def draw_pause_panel(self, surface):
+        # Créer un panneau pour le menu de pause
+        panel_width = 300
+        panel_height = 250
         panel_x = SCREEN_WIDTH // 2 - panel_width // 2
         panel_y = SCREEN_HEIGHT // 2 - panel_height // 2
         
         panel = self.ui_effects.create_glass_panel(panel_width, panel_height, (0, 0, 0, 200), (100, 100, 255, 150), 2)
-        self.screen.blit(panel, (panel_x, panel_y))
+        surface.blit(panel, (panel_x, panel_y))
+        
+        # Titre du menu de pause
+        title_text = self.ui_effects.create_neon_text("Pause", self.heading_font, WHITE, (0, 100, 255), 5)
+        surface.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, panel_y + 20))
+        
+    def get_high_scores_panel(self):
+        """Panneau des meilleurs scores, rendu à nouveau seulement si le magasin de scores a changé."""
+        if self.high_scores_panel is not None and self.high_scores_revision == self.score_manager.revision:
+            return self.high_scores_panel
+        self.high_scores_revision = self.score_manager.revision
+        
+        panel_width = 500
+        panel_height = 400
+        panel = self.ui_effects.create_glass_panel(panel_width, panel_height, (0, 0, 0, 200), (100, 100, 255, 150), 2).copy()
         
         # Titre
-        title_text = self.ui_effects.create_neon_text("Meilleurs Scores", pygame.font.SysFont("Arial", 36), WHITE, (0, 100, 255), 5)
-        self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, panel_y + 20))
+        title_text = self.ui_effects.create_neon_text("Meilleurs Scores", self.heading_font, WHITE, (0, 100, 255), 5)
+        panel.blit(title_text, (panel_width // 2 - title_text.get_width() // 2, 20))
         
-        # Charger les scores depuis le fichier
-        scores = []
-        try:
-            with open("scores.txt", "r") as f:
-                for line in f:
-                    parts = line.strip().split(",")
-                    if len(parts) >= 2:
-                        name = parts[0]
-                        score = int(parts[1])
-                        scores.append((name, score))
-        except:
-            scores = [("Joueur 1", 5000), ("Joueur 2", 4500), ("Joueur 3", 4000)]
-            
-        # Trier les scores
-        scores.sort(key=lambda x: x[1], reverse=True)
-        
-        # Afficher les scores
-        y_offset = panel_y + 80
-        for i, (name, score) in enumerate(scores[:10]):
+        # Les dix meilleurs scores, toutes difficultés confondues
+        top_scores = self.score_manager.get_top_scores(10)
+        if not top_scores:
+            empty_text = self.font.render("Aucun score enregistré", True, WHITE)
+            panel.blit(empty_text, (panel_width // 2 - empty_text.get_width() // 2, 80))
+        
+        y_offset = 80
+        for i, entry in enumerate(top_scores):
+            day = datetime.fromtimestamp(entry["timestamp"]).strftime("%d/%m/%Y")
+            label = f"{i+1}. {entry['difficulty']} - {day}"
             # Créer un effet différent pour le top 3
             if i < 3:
                 color_schemes = [(255, 215, 0), (192, 192, 192), (205, 127, 50)]  # Or, Argent, Bronze
-                text = self.ui_effects.create_neon_text(f"{i+1}. {name}", self.font, WHITE, color_schemes[i], 3)
-                score_text = self.ui_effects.create_neon_text(f"{score}", self.font, WHITE, color_schemes[i], 3)
+                text = self.ui_effects.create_neon_text(label, self.font, WHITE, color_schemes[i], 3)
+                score_text = self.ui_effects.create_neon_text(f"{entry['score']}", self.font, WHITE, color_schemes[i], 3)
             else:
-                text = self.font.render(f"{i+1}. {name}", True, WHITE)
-                score_text = self.font.render(f"{score}", True, WHITE)
+                text = self.font.render(label, True, WHITE)
+                score_text = self.font.render(f"{entry['score']}", True, WHITE)
                 
-            self.screen.blit(text, (panel_x + 30, y_offset))
-            self.screen.blit(score_text, (panel_x + panel_width - 30 - score_text.get_width(), y_offset))
+            panel.blit(text, (30, y_offset))
+            panel.blit(score_text, (panel_width - 30 - score_text.get_width(), y_offset))
             
             y_offset += 30
+        
+        self.high_scores_panel = panel
+        return panel
+        
+    def draw_high_scores(self):
+        # Dessiner le fond
+        self.screen.fill(BLACK)
+        self.parallax_background.draw(self.screen)
+        
+        # Dessiner les particules
+        self.particle_system.draw(self.screen)
+        
+        # Panneau des scores (en cache jusqu'au prochain score enregistré)
+        panel = self.get_high_scores_panel()
+        self.screen.blit(panel, (SCREEN_WIDTH // 2 - panel.get_width() // 2, SCREEN_HEIGHT // 2 - panel.get_height() // 2))
             
         # Bouton retour
         back_button = self.ui_effects.create_gradient_button(100, 40, (41, 128, 185), (52, 152, 219))
@@ -1407,7 +1468,7 @@ class Game:
         self.screen.blit(panel, (panel_x, panel_y))
         
         # Titre
-        title_text = self.ui_effects.create_neon_text("Paramètres", pygame.font.SysFont("Arial", 36), WHITE, (0, 100, 255), 5)
+        title_text = self.ui_effects.create_neon_text("Paramètres", self.heading_font, WHITE, (0, 100, 255), 5)
         self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, panel_y + 20))
         
         # Options de paramètres (factices pour l'instant)
@@ -1544,14 +1605,12 @@ class Game:
         self.screen.blit(icon, (panel_x + 25, panel_y + panel_height // 2 - 25))
         
         # Dessiner le titre
-        title_font = pygame.font.SysFont("Arial", 24)
-        title_text = title_font.render(self.achievements_popup["title"], True, (255, 215, 0))
+        title_text = self.font.render(self.achievements_popup["title"], True, (255, 215, 0))
         title_text.set_alpha(int(255 * alpha))
         self.screen.blit(title_text, (panel_x + 90, panel_y + 20))
         
         # Dessiner la description
-        desc_font = pygame.font.SysFont("Arial", 18)
-        desc_text = desc_font.render(self.achievements_popup["description"], True, WHITE)
+        desc_text = self.description_font.render(self.achievements_popup["description"], True, WHITE)
         desc_text.set_alpha(int(255 * alpha))
         self.screen.blit(desc_text, (panel_x + 90, panel_y + 50))
         
@@ -1584,7 +1643,9 @@ class Game:
             f"Particules: {self.particle_system.get_particle_count()}",
             f"Position: {self.character_pos}",
             f"Caméra: ({int(self.camera_x)}, {int(self.camera_y)})",
-            f"État: {self.state}"
+            f"État: {self.state}",
+            self.input_queue.summary(),
+            f"Score writes failed: {self.score_manager.writer.errors}"
         ]
         
         # Créer un panneau pour les infos de débogage
@@ -1654,6 +1715,7 @@ class Game:
                 
             # Mettre à jour l'affichage
             pygame.display.flip()
+            self.input_queue.mark_presented()
             
             # Limiter la fréquence d'images
             self.clock.tick(60)
@@ -5,11 +5,21 @@ import time
 import math
 import sys
 from settings import *
-from game_logic import generate_map, draw_map, load_character_skins, load_bonus_image, check_achievements, apply_weather_effects
-from score_manager import ScoreManager
+from game_logic import MAP_PADDING, generate_map, draw_map, load_character_skins, load_bonus_image, AchievementTracker, apply_weather_effects
+from score_manager import ScoreManager, get_score_manager
 from sound_manager import SoundManager
 from modern_background_optimized import ModernBackground, EnhancedParallaxBackground
 from particle_system_optimized import ParticleSystem
+from surface_cache import get_cache_manager
+import button_keyframes
+import procedural_textures
+from font_registry import load_custom_fonts, mark_startup_complete, get_font_stats
+from freeze_frame import FreezeFrame
+from input_queue import InputQueue
+from weather import WeatherSystem
+from fog_of_war import FogOfWar, fov_radius
+from hazards import HazardSwarm, hazard_count
+from dynamic_maze import DynamicMaze, ROAD
 import menu
 
 # Initialize Pygame
@@ -20,31 +30,12 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Random Blocks Game")
 
 # Initialize managers
-score_manager = ScoreManager()
+score_manager = get_score_manager()
 sound_manager = SoundManager()
 
 # Global variables
 debug_mode = False  # Added debug_mode as a global variable
 
-# Load custom fonts
-def load_custom_fonts():
-    fonts = {}
-    try:
-        # Try to load custom fonts if available
-        fonts['title'] = pygame.font.Font(None, 92)
-        fonts['heading'] = pygame.font.Font(None, 64)
-        fonts['button'] = pygame.font.Font(None, 48)
-        fonts['info'] = pygame.font.Font(None, 36)
-        fonts['small'] = pygame.font.Font(None, 24)
-    except:
-        # Fallback to system fonts
-        fonts['title'] = pygame.font.SysFont('arial', 92)
-        fonts['heading'] = pygame.font.SysFont('arial', 64)
-        fonts['button'] = pygame.font.SysFont('arial', 48)
-        fonts['info'] = pygame.font.SysFont('arial', 36)
-        fonts['small'] = pygame.font.SysFont('arial', 24)
-    return fonts
-
 # Add compatibility methods to SoundManager
 def play_sound(self, sound_name):
     """Compatibility method to map generic sound names to specific methods"""
@@ -59,9 +50,11 @@ def play_sound(self, sound_name):
     elif sound_name == "unpause":
         self.unpause_music()
     elif sound_name == "powerup":
-        # Ajout d'un son pour les power-ups
-        self.play_victory()
-    # Other sounds are ignored silently
+        # Son préchargé dans la banque de sons (plus de décodage à chaque ramassage)
+        self.play_powerup()
+    else:
+        # Other preloaded effects (unknown names are ignored silently)
+        self.play_effect(sound_name)
 
 # Add compatibility methods to ScoreManager
 def get_score(self):
@@ -171,9 +164,10 @@ class AnimatedButton:
         self.pulse_duration = 0
         self.pulse_max = 30
         
-        # Cache pour les surfaces
-        self.surface_cache = {}
         self.last_state = None
+        
+        # Pré-rendre les images de repos
+        button_keyframes.prerender(self)
 
     def update(self):
         # Optimisation: ne mettre à jour que si nécessaire
@@ -211,100 +205,80 @@ class AnimatedButton:
     def draw(self, surface):
         self.update()
         
-        # Utiliser le cache si possible
-        cache_key = (self.state, self.rect.width, self.rect.height, self.glow_radius, self.pulse_duration)
-        if cache_key in self.surface_cache:
-            button_surface = self.surface_cache[cache_key]
-            surface.blit(button_surface, (self.rect.x - self.max_glow, self.rect.y - self.max_glow))
-            return
-            
-        # Créer une nouvelle surface pour le bouton
-        button_surface = pygame.Surface((self.rect.width + self.max_glow*2, self.rect.height + self.max_glow*2), pygame.SRCALPHA)
+        # Choisir l'image clé pré-rendue correspondant à l'animation
+        frame = button_keyframes.get_frame(self)
+        surface.blit(frame, frame.get_rect(center=self.rect.center))
+    
+    def render_frame(self, state, width, height, glow_radius, pulse_phase):
+        padding = self.pulse_max if pulse_phase is not None else self.max_glow
+        button_surface = pygame.Surface((width + padding*2, height + padding*2), pygame.SRCALPHA)
+        rect = pygame.Rect(padding, padding, width, height)
         
         # Draw glow effect if hovered
-        if self.glow_radius > 0:
-            glow_surf = pygame.Surface((self.rect.width + self.max_glow*2, self.rect.height + self.max_glow*2), pygame.SRCALPHA)
+        if glow_radius > 0:
+            glow_surf = pygame.Surface((width + self.max_glow*2, height + self.max_glow*2), pygame.SRCALPHA)
             pygame.draw.rect(
                 glow_surf, 
                 self.color_scheme["glow"], 
-                (self.max_glow, self.max_glow, self.rect.width, self.rect.height),
+                (self.max_glow, self.max_glow, width, height),
                 border_radius=15
             )
             try:
-                glow_surf = pygame.transform.gaussian_blur(glow_surf, self.glow_radius)
+                glow_surf = pygame.transform.gaussian_blur(glow_surf, glow_radius)
             except:
                 # Fallback if gaussian_blur is not available
                 pass
-            button_surface.blit(glow_surf, (0, 0))
+            button_surface.blit(glow_surf, (rect.x - self.max_glow, rect.y - self.max_glow))
         
         # Draw shadow
-        shadow_rect = pygame.Rect(
-            self.max_glow + self.shadow_offset,
-            self.max_glow + self.shadow_offset,
-            self.rect.width,
-            self.rect.height
-        )
         pygame.draw.rect(
             button_surface, 
             self.color_scheme["shadow"], 
-            shadow_rect,
+            rect.move(self.shadow_offset, self.shadow_offset),
             border_radius=15
         )
         
         # Draw button
         pygame.draw.rect(
             button_surface, 
-            self.color_scheme[self.state], 
-            (self.max_glow, self.max_glow, self.rect.width, self.rect.height),
+            self.color_scheme[state], 
+            rect,
             border_radius=15
         )
         
         # Add subtle gradient effect
-        gradient = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        for i in range(self.rect.height // 2):
-            alpha = 100 - (i * 2)
-            if alpha > 0:
-                pygame.draw.rect(
-                    gradient, 
-                    (255, 255, 255, alpha), 
-                    (0, i, self.rect.width, 2),
-                    border_radius=15
-                )
-        button_surface.blit(gradient, (self.max_glow, self.max_glow))
+        gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+        gradient.blit(procedural_textures.alpha_ramp(width, height // 2, (255, 255, 255), 100, 100 - (height // 2) * 2), (0, 0))
+        procedural_textures.apply_rounded_mask(gradient, 15)
+        button_surface.blit(gradient, rect.topleft)
         
         # Draw text with shadow for depth
         text_surface = self.fonts['button'].render(self.text, True, (0, 0, 0, 128))
-        text_rect = text_surface.get_rect(center=(self.max_glow + self.rect.width//2 + 2, self.max_glow + self.rect.height//2 + 2))
+        text_rect = text_surface.get_rect(center=(rect.centerx + 2, rect.centery + 2))
         button_surface.blit(text_surface, text_rect)
         
         text_surface = self.fonts['button'].render(self.text, True, self.color_scheme["text"])
-        text_rect = text_surface.get_rect(center=(self.max_glow + self.rect.width//2, self.max_glow + self.rect.height//2))
+        text_rect = text_surface.get_rect(center=rect.center)
         button_surface.blit(text_surface, text_rect)
         
         # Draw icon if provided
         if self.icon:
-            icon_rect = self.icon.get_rect(midleft=(self.max_glow + 20, self.max_glow + self.rect.height//2))
+            icon_rect = self.icon.get_rect(midleft=(rect.x + 20, rect.centery))
             button_surface.blit(self.icon, icon_rect)
         
         # Draw pulse effect if active
-        if self.pulse_duration > 0:
-            pulse_alpha = int(255 * (1 - abs(self.pulse_time / self.pulse_duration - 0.5) * 2))
-            pulse_surf = pygame.Surface((self.rect.width + self.pulse_max*2, self.rect.height + self.pulse_max*2), pygame.SRCALPHA)
+        if pulse_phase is not None:
+            pulse_alpha = int(255 * (1 - abs(pulse_phase - 0.5) * 2))
+            pulse_surf = pygame.Surface((width + self.pulse_max*2, height + self.pulse_max*2), pygame.SRCALPHA)
             pygame.draw.rect(
                 pulse_surf, 
                 (*self.color_scheme["hover"], pulse_alpha), 
-                (0, 0, self.rect.width + self.pulse_max*2, self.rect.height + self.pulse_max*2),
+                (0, 0, width + self.pulse_max*2, height + self.pulse_max*2),
                 border_radius=20
             )
-            button_surface.blit(pulse_surf, (self.max_glow - self.pulse_max, self.max_glow - self.pulse_max))
+            button_surface.blit(pulse_surf, (0, 0))
         
-        # Stocker dans le cache
-        if len(self.surface_cache) > 10:  # Limiter la taille du cache
-            self.surface_cache.clear()
-        self.surface_cache[cache_key] = button_surface
-        
-        # Dessiner le bouton
-        surface.blit(button_surface, (self.rect.x - self.max_glow, self.rect.y - self.max_glow))
+        return button_surface
 
     def is_hovered(self):
         mouse_pos = pygame.mouse.get_pos()
@@ -428,6 +402,13 @@ class ProgressBar:
     def update(self, new_value):
         self.current_value = min(max(0, new_value), self.max_value)
         
+    def set_value(self, new_value):
+        """Jump to a value without animation (for bars rendered once into a cached surface)."""
+        self.update(new_value)
+        self.display_value = self.current_value
+        self.last_fill_width = -1
+        self.last_text = None
+        
     def draw(self, surface):
         # Animate the displayed value
         if self.display_value != self.current_value:
@@ -611,6 +592,81 @@ class Notification:
         # Draw notification
         surface.blit(self.notification_surface, (x - self.notification_surface.get_width() // 2, y))
 
+# Retained HUD widgets: each widget keeps its own small surface and only
+# re-renders it when its value changes
+class HUDWidget:
+    def __init__(self, x, y):
+        self.position = (x, y)
+        self.value = None
+        self.surface = None
+        self.dirty = True
+        self.visible = True
+    
+    def set_value(self, value):
+        if value != self.value:
+            self.value = value
+            self.dirty = True
+    
+    def render(self):
+        """Return a new surface for the current value."""
+        raise NotImplementedError
+    
+    def draw(self, surface):
+        if not self.visible:
+            return None
+        if self.dirty:
+            self.surface = self.render()
+            self.dirty = False
+        return surface.blit(self.surface, self.position)
+
+class HUDPanel(HUDWidget):
+    def __init__(self, x, y, width, height, **panel_options):
+        super().__init__(x, y)
+        self.panel = Panel(0, 0, width, height, **panel_options)
+    
+    def render(self):
+        surface = pygame.Surface(self.panel.rect.size, pygame.SRCALPHA)
+        self.panel.draw(surface)
+        return surface
+
+class HUDLabel(HUDWidget):
+    def __init__(self, x, y, font, text_format, color=WHITE):
+        super().__init__(x, y)
+        self.font = font
+        self.text_format = text_format
+        self.color = color
+    
+    def render(self):
+        return self.font.render(self.text_format.format(self.value), True, self.color)
+
+class HUDProgressBar(HUDWidget):
+    def __init__(self, x, y, width, height, label=None):
+        super().__init__(x, y)
+        self.size = (width, height)
+        self.label = label
+        self.bars = {}  # One ProgressBar per (max value, color scheme)
+    
+    def render(self):
+        current_value, max_value, color_scheme = self.value
+        bar = self.bars.get((max_value, color_scheme))
+        if bar is None:
+            bar = ProgressBar(0, 0, *self.size, max_value, 0, color_scheme, self.label)
+            self.bars[(max_value, color_scheme)] = bar
+        bar.set_value(current_value)
+        
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        bar.draw(surface)
+        return surface
+
+class HUD:
+    def __init__(self, widgets):
+        self.widgets = widgets
+    
+    def draw(self, surface):
+        # Composite only the widget rects
+        for widget in self.widgets.values():
+            widget.draw(surface)
+
 # Game class
 class Game:
     def __init__(self):
@@ -647,12 +703,15 @@ class Game:
         # Initialize movement
         self.move_cooldown = 0
         self.default_move_cooldown = DEFAULT_MOVE_COOLDOWN
+        # Entrées horodatées : un déplacement pressé pendant le cooldown attend sa fin au lieu d'être perdu
+        self.input_queue = InputQueue()
         self.speed_boost = False
         self.speed_boost_timer = 0
         
         # Initialize weather
         self.current_weather = random.choice(list(WEATHER.keys()))
         self.achievements_unlocked = []
+        self.achievement_tracker = AchievementTracker()
         
         # Initialize notifications
         self.notifications = []
@@ -667,6 +726,21 @@ class Game:
         # Initialize particle system for visual effects
         self.particle_system = ParticleSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
         
+        # Vectorized weather system (rain, snow)
+        self.weather = WeatherSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
+        
+        # Fog of war (toggled with F), recomputed only when the player moves
+        self.fog_enabled = False
+        self.fog_of_war = FogOfWar(BLOCK_SIZE + BLOCK_GAP)
+        
+        # Moving hazards chasing the player through one shared flow field
+        self.hazards = HazardSwarm(BLOCK_SIZE + BLOCK_GAP, BLOCK_SIZE)
+        
+        # Destructible and shifting walls; pathfinding state is repaired per changed cell
+        self.maze = DynamicMaze()
+        self.facing = (1, 0)
+        self.last_wall_shift = 0
+        
         # Use menu module for particles
         self.particles = menu.particles
         self.overlay = menu.overlay
@@ -677,6 +751,13 @@ class Game:
         # Initialize pause menu buttons
         self.setup_pause_buttons()
         
+        # Retained HUD widgets
+        self.hud = self.create_hud()
+        
+        # Image figée des écrans de pause et de fin de partie
+        self.freeze_frame = FreezeFrame()
+        self.game_over_buttons = None
+        
         # Initialize game
         self.setup_game()
         
@@ -688,7 +769,9 @@ class Game:
         self.last_fps_update = 0
         self.fps_update_interval = 500  # Mettre à jour l'affichage FPS toutes les 500ms
         self.fps_display = "FPS: 0.0"
-        self.ui_elements_cache = {}
+        
+        # Toutes les polices sont chargées : plus aucune construction attendue
+        mark_startup_complete()
         
     def setup_menu_buttons(self):
         # Create menu buttons
@@ -804,8 +887,8 @@ class Game:
                 self.fps_display = f"FPS: {avg_fps:.1f}"
                 self.last_fps_update = current_time
             
-            # Traiter les événements
-            for event in pygame.event.get():
+            # Traiter les événements (un seul mouvement de souris par frame)
+            for event in self.input_queue.poll():
                 if event.type == pygame.QUIT:
                     pygame.event.clear()  # Effacer les événements en attente
                     pygame.quit()
@@ -814,6 +897,7 @@ class Game:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE and self.state == GameState.PLAYING:
                         self.state = GameState.PAUSED
+                        self.input_queue.clear()
                         sound_manager.play_sound("pause")
                     elif event.key == pygame.K_ESCAPE and self.state == GameState.PAUSED:
                         self.state = GameState.PLAYING
@@ -823,6 +907,13 @@ class Game:
                         global debug_mode
                         debug_mode = not debug_mode
                         self.add_notification(f"Debug mode: {'ON' if debug_mode else 'OFF'}", 2000, "purple")
+                    # Brouillard de guerre
+                    elif event.key == pygame.K_f and self.state == GameState.PLAYING:
+                        self.fog_enabled = not self.fog_enabled
+                        self.add_notification(f"Fog of war: {'ON' if self.fog_enabled else 'OFF'}", 2000, "blue")
+                    # Détruire le mur devant le joueur
+                    elif event.key == pygame.K_SPACE and self.state == GameState.PLAYING:
+                        self.break_wall()
 
                 if self.state == GameState.MENU:
                     # Gérer les clics de boutons du menu
@@ -845,42 +936,9 @@ class Game:
                                 sys.exit()
 
                 elif self.state == GameState.PLAYING:
-                    # Gérer les entrées du jeu
+                    # Mettre en attente les déplacements : ils sont appliqués par update_game à la fin du cooldown
                     if event.type == pygame.KEYDOWN:
-                        if self.move_cooldown <= 0:
-                            new_pos = list(self.character_pos)
-                            
-                            if event.key == pygame.K_UP or event.key == pygame.K_w:
-                                new_pos[1] -= 1
-                            elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                                new_pos[1] += 1
-                            elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                                new_pos[0] -= 1
-                            elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                                new_pos[0] += 1
-                            
-                            # Vérifier si le mouvement est valide - s'assurer qu'on ne peut pas traverser les rochers (valeur 1)
-                            if (0 <= new_pos[0] < self.cols and 
-                                0 <= new_pos[1] < self.rows and 
-                                self.grid[new_pos[1]][new_pos[0]] == 0):  # Autoriser le mouvement uniquement sur les espaces vides (0)
-                                
-                                self.character_pos = new_pos
-                                self.steps += 1
-                                self.move_cooldown = self.default_move_cooldown
-                                
-                                # Ajouter des particules de mouvement
-                                self.particle_system.add_movement_particles(
-                                    self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_x + MAP_PADDING,
-                                    self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_y + MAP_PADDING,
-                                    5  # Réduire le nombre de particules
-                                )
-                                
-                                # Vérifier les power-ups
-                                self.check_powerups()
-                                
-                                # Vérifier si on a atteint la fin
-                                if self.character_pos[0] == self.end_pos[0] and self.character_pos[1] == self.end_pos[1]:
-                                    self.level_complete()
+                        self.input_queue.push_move(event)
 
                 elif self.state == GameState.PAUSED:
                     # Gérer les clics de boutons du menu de pause
@@ -923,6 +981,7 @@ class Game:
             
             # Mettre à jour l'affichage
             pygame.display.flip()
+            self.input_queue.mark_presented()
             
             # Limiter la fréquence d'images
             self.clock.tick(60)
@@ -953,18 +1012,61 @@ class Game:
         
         # Réinitialiser le mouvement
         self.move_cooldown = 0
+        self.input_queue.clear()
         self.speed_boost = False
         self.speed_boost_timer = 0
         
         # Réinitialiser la météo
         self.current_weather = random.choice(list(WEATHER.keys()))
         self.achievements_unlocked = []
+        self.achievement_tracker = AchievementTracker()
         
         # Jouer le son de démarrage
         sound_manager.play_sound("level_start")
         
-        # Réinitialiser les caches
-        self.ui_elements_cache = {}
+    
+    def set_wall(self, cell, value):
+        """Poser ou détruire un mur et réparer localement tout ce qui dépend de la grille"""
+        self.maze.set_cell(cell, value)
+        passable = value == ROAD  # Les murs sont des tuiles (Surface) ou WALL
+        if self.hazards.grid is self.grid:
+            self.hazards.flow.set_passable(cell, passable)
+        if self.fog_of_war.grid is self.grid:
+            self.fog_of_war.set_opaque(cell, not passable)
+    
+    def break_wall(self):
+        """Détruire le mur devant le joueur, contre des points"""
+        self.maze.track(self.grid, self.end_pos)
+        target = (self.character_pos[0] + self.facing[0], self.character_pos[1] + self.facing[1])
+        if not self.maze.is_wall(target):
+            return
+        cost = DESTRUCTIBLE_WALLS["break_cost"]
+        if self.score < cost:
+            self.add_notification(f"Need {cost} points to break a wall", 2000, "red")
+            return
+        
+        self.score -= cost
+        self.set_wall(target, ROAD)
+        self.add_notification(f"Wall destroyed! -{cost} points", 2000, "purple")
+        self.particle_system.add_effect_particles(
+            target[0] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_x + MAP_PADDING + BLOCK_SIZE // 2,
+            target[1] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_y + MAP_PADDING + BLOCK_SIZE // 2,
+            10, (150, 150, 150)
+        )
+    
+    def shift_walls(self):
+        """Déplacer un mur au hasard, sans jamais couper le joueur de la sortie"""
+        excluded = {tuple(self.character_pos), tuple(self.start_pos), tuple(self.end_pos)}
+        excluded.update((x, y) for x, y, _ in self.powerups)
+        if self.hazards.grid is self.grid:
+            excluded.update((cell % self.cols, cell // self.cols) for cell in self.hazards.cells.tolist())
+        
+        removed = self.maze.random_wall()
+        added = self.maze.random_road(excluded)
+        if removed is None or added is None:
+            return
+        # Le mur garde sa tuile ; refusé en entier si le joueur perd la sortie
+        self.maze.move_wall(removed, added, self.character_pos, self.set_wall)
     
     def check_powerups(self):
         for powerup in self.powerups[:]:
@@ -995,6 +1097,7 @@ class Game:
                     
                 elif type == BONUS:
                     self.coins_collected += 1
+                    self.report_achievement_stats(coins_collected=self.coins_collected)
                     self.score += 500
                     self.add_notification("+500 points!", 2000, "purple")
                     
@@ -1008,6 +1111,12 @@ class Game:
                 self.powerups.remove(powerup)
                 sound_manager.play_sound("powerup")
     
+    def report_achievement_stats(self, **stats):
+        # Évaluer seulement les succès qui dépendent des statistiques modifiées
+        for achievement in self.achievement_tracker.update(**stats):
+            self.achievements_unlocked.append(achievement)
+            self.add_notification(f"Achievement Unlocked: {achievement}", 3000, "purple")
+    
     def level_complete(self):
         # Mettre à jour le niveau
         self.level += 1
@@ -1017,6 +1126,9 @@ class Game:
         time_bonus = remaining_time * 100
         self.score += time_bonus
         
+        # Succès de fin de niveau
+        self.report_achievement_stats(level=self.level, time_left=remaining_time, steps=self.steps)
+        
         # Ajouter un bonus de complétion de niveau
         level_bonus = self.level * 1000
         self.score += level_bonus
@@ -1041,6 +1153,7 @@ class Game:
         
         # Réinitialiser le mouvement
         self.move_cooldown = 0
+        self.input_queue.clear()
         self.speed_boost = False
         self.speed_boost_timer = 0
         
@@ -1061,8 +1174,6 @@ class Game:
                 10, (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
             )
             
-        # Réinitialiser les caches
-        self.ui_elements_cache = {}
     
     def update_menu(self):
         # Mettre à jour les boutons du menu
@@ -1087,28 +1198,72 @@ class Game:
         # Incrémenter le compteur de frames
         self.frame_counter = (self.frame_counter + 1) % 3
     
+    def move_player(self, dx, dy):
+        new_pos = [self.character_pos[0] + dx, self.character_pos[1] + dy]
+        self.facing = (dx, dy)
+        
+        # Vérifier si le mouvement est valide - s'assurer qu'on ne peut pas traverser les rochers (valeur 1)
+        if (0 <= new_pos[0] < self.cols and 
+            0 <= new_pos[1] < self.rows and 
+            self.grid[new_pos[1]][new_pos[0]] == 0):  # Autoriser le mouvement uniquement sur les espaces vides (0)
+            
+            self.character_pos = new_pos
+            self.steps += 1
+            self.move_cooldown = apply_weather_effects(self.current_weather, self.default_move_cooldown)
+            
+            # Ajouter des particules de mouvement
+            self.particle_system.add_movement_particles(
+                self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_x + MAP_PADDING,
+                self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - self.camera_y + MAP_PADDING,
+                5  # Réduire le nombre de particules
+            )
+            
+            # Vérifier les power-ups
+            self.check_powerups()
+            
+            # Vérifier si on a atteint la fin
+            if self.character_pos[0] == self.end_pos[0] and self.character_pos[1] == self.end_pos[1]:
+                self.level_complete()
+    
     def update_game(self):
+        # Appliquer le déplacement en attente dès que le cooldown est écoulé
+        if self.move_cooldown <= 0:
+            move = self.input_queue.take_move()
+            if move:
+                self.move_player(*move)
+        
         # Mettre à jour le cooldown de mouvement
         if self.move_cooldown > 0:
             self.move_cooldown -= 1
         
+        # Mettre à jour les précipitations de la météo courante
+        self.weather.set_weather(self.current_weather)
+        self.weather.update()
+        
+        # Champ de vision : recalculé seulement si le joueur a bougé
+        if self.fog_enabled:
+            self.fog_of_war.update(self.grid, self.character_pos, fov_radius(self.current_weather))
+        
+        # Murs mouvants : un mur change de place à intervalle régulier
+        if self.maze.track(self.grid, self.end_pos):
+            self.last_wall_shift = pygame.time.get_ticks()
+        elif pygame.time.get_ticks() - self.last_wall_shift > DESTRUCTIBLE_WALLS["shift_interval"]:
+            self.last_wall_shift = pygame.time.get_ticks()
+            self.shift_walls()
+        
+        # Faire avancer les dangers (champ de flux recalculé seulement si le joueur change de case)
+        self.hazards.update(self.grid, self.character_pos, hazard_count(self.level))
+        if self.hazards.collide(self.character_pos):
+            self.start_time -= HAZARDS["time_penalty"] * 1000
+            self.add_notification(f"Hazard hit! -{HAZARDS['time_penalty']} seconds", 2000, "red")
+        
         # Mettre à jour le boost de vitesse
         if self.speed_boost and pygame.time.get_ticks() > self.speed_boost_timer:
             self.speed_boost = False
             self.add_notification("Speed Boost ended", 2000, "blue")
         
-        # Appliquer les effets météo
-        self.move_cooldown = apply_weather_effects(self.current_weather, self.move_cooldown)
-        
-        # Vérifier les nouveaux succès
-        time_left = max(0, self.level_time - (pygame.time.get_ticks() - self.start_time) // 1000)
-        new_achievements = check_achievements(self.level, time_left, self.steps, self.coins_collected)
-        for achievement in new_achievements:
-            if achievement not in self.achievements_unlocked:
-                self.achievements_unlocked.append(achievement)
-                self.add_notification(f"Achievement Unlocked: {achievement}", 3000, "purple")
-        
         # Vérifier la fin de partie
+        time_left = max(0, self.level_time - (pygame.time.get_ticks() - self.start_time) // 1000)
         if time_left <= 0:
             self.state = GameState.GAME_OVER
             sound_manager.play_sound("game_over")
@@ -1126,6 +1281,9 @@ class Game:
         self.enhanced_parallax.update(self.camera_x)
 
     def draw_game(self):
+        # Le jeu est de nouveau affiché en direct : libérer l'image figée
+        self.freeze_frame.release()
+        
         # Mettre à jour la caméra
         target_camera_x = self.character_pos[0] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_WIDTH // 2
         target_camera_y = self.character_pos[1] * (BLOCK_SIZE + BLOCK_GAP) - SCREEN_HEIGHT // 2
@@ -1142,77 +1300,52 @@ class Game:
             self.character_image, self.bonus_image, self.map_background
         )
         
+        # Dessiner les dangers puis le brouillard de guerre (masque de lumière en cache)
+        map_origin = (-self.camera_x + MAP_PADDING, -self.camera_y + MAP_PADDING)
+        self.hazards.draw(self.screen, map_origin)
+        if self.fog_enabled:
+            self.fog_of_war.draw(self.screen, map_origin)
+        
         # Dessiner les effets de particules
         self.particle_system.draw(self.screen)
         
-        # Clé de cache pour les éléments d'interface utilisateur
-        ui_cache_key = (time_left := max(0, self.level_time - (pygame.time.get_ticks() - self.start_time) // 1000),
-                        self.level, self.score, self.speed_boost, 
-                        boost_time_left := (self.speed_boost_timer - pygame.time.get_ticks()) // 1000 if self.speed_boost else 0,
-                        tuple(self.achievements_unlocked))
+        # Dessiner la météo par-dessus la carte
+        self.weather.draw(self.screen)
         
-        # Utiliser le cache si disponible
-        if ui_cache_key in self.ui_elements_cache:
-            ui_surface = self.ui_elements_cache[ui_cache_key]
-            self.screen.blit(ui_surface, (0, 0))
-            return
-            
-        # Créer une nouvelle surface pour les éléments d'interface utilisateur
-        ui_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        # Dessiner le panneau d'interface utilisateur
-        ui_panel = Panel(10, 10, 250, 180, (0, 0, 0, 150), border_radius=10, border_color=(255, 255, 255, 50), border_width=2)
-        ui_panel.draw(ui_surface)
-        
-        # Dessiner les informations du jeu
-        level_text = self.fonts['info'].render(f"Level: {self.level}", True, WHITE)
-        ui_surface.blit(level_text, (30, 20))
-        
-        score_text = self.fonts['info'].render(f"Score: {self.score}", True, WHITE)
-        ui_surface.blit(score_text, (30, 60))
-        
-        timer_text = self.fonts['info'].render(f"Time: {time_left}", True, WHITE)
-        ui_surface.blit(timer_text, (30, 100))
-        
-        weather_text = self.fonts['info'].render(f"Weather: {self.current_weather.capitalize()}", True, WHITE)
-        ui_surface.blit(weather_text, (30, 140))
+        # Mettre à jour les valeurs du HUD ; seuls les widgets modifiés sont redessinés
+        time_left = max(0, self.level_time - (pygame.time.get_ticks() - self.start_time) // 1000)
+        boost_time_left = (self.speed_boost_timer - pygame.time.get_ticks()) // 1000 if self.speed_boost else 0
         
-        # Dessiner la barre de progression du temps
-        time_progress = ProgressBar(
-            270, 20, 200, 30, 
-            self.level_time, 
-            time_left, 
-            "green" if time_left > self.level_time // 2 else "red",
-            "Time"
-        )
-        time_progress.draw(ui_surface)
+        hud = self.hud.widgets
+        hud['level'].set_value(self.level)
+        hud['score'].set_value(self.score)
+        hud['time'].set_value(time_left)
+        hud['weather'].set_value(self.current_weather.capitalize())
+        hud['time_bar'].set_value((time_left, self.level_time, "green" if time_left > self.level_time // 2 else "red"))
         
-        # Dessiner l'indicateur de boost de vitesse si actif
+        hud['boost'].visible = hud['boost_bar'].visible = self.speed_boost
         if self.speed_boost:
-            boost_text = self.fonts['info'].render(f"Speed Boost: {boost_time_left}s", True, (0, 150, 255))
-            ui_surface.blit(boost_text, (270, 60))
-            
-            # Dessiner la barre de progression du boost
-            boost_progress = ProgressBar(
-                270, 100, 200, 30, 
-                SPEED_BOOST_DURATION // 1000, 
-                boost_time_left, 
-                "blue"
-            )
-            boost_progress.draw(ui_surface)
+            hud['boost'].set_value(boost_time_left)
+            hud['boost_bar'].set_value((boost_time_left, SPEED_BOOST_DURATION // 1000, "blue"))
         
-        # Dessiner les succès si présents
+        hud['achievements'].visible = bool(self.achievements_unlocked)
         if self.achievements_unlocked:
-            achievements_text = self.fonts['small'].render(f"Achievements: {', '.join(self.achievements_unlocked)}", True, (255, 215, 0))
-            ui_surface.blit(achievements_text, (270, 140))
-            
-        # Stocker dans le cache
-        if len(self.ui_elements_cache) > 10:  # Limiter la taille du cache
-            self.ui_elements_cache.clear()
-        self.ui_elements_cache[ui_cache_key] = ui_surface
+            hud['achievements'].set_value(', '.join(self.achievements_unlocked))
         
-        # Dessiner sur l'écran
-        self.screen.blit(ui_surface, (0, 0))
+        self.hud.draw(self.screen)
+    
+    def create_hud(self):
+        return HUD({
+            'panel': HUDPanel(10, 10, 250, 180, color=(0, 0, 0, 150), border_radius=10, border_color=(255, 255, 255, 50), border_width=2),
+            'level': HUDLabel(30, 20, self.fonts['info'], "Level: {}"),
+            'score': HUDLabel(30, 60, self.fonts['info'], "Score: {}"),
+            'time': HUDLabel(30, 100, self.fonts['info'], "Time: {}"),
+            'weather': HUDLabel(30, 140, self.fonts['info'], "Weather: {}"),
+            'time_bar': HUDProgressBar(270, 20, 200, 30, "Time"),
+            'boost': HUDLabel(270, 60, self.fonts['info'], "Speed Boost: {}s", (0, 150, 255)),
+            'boost_bar': HUDProgressBar(270, 100, 200, 30),
+            'achievements': HUDLabel(270, 140, self.fonts['small'], "Achievements: {}", (255, 215, 0)),
+        })
     
     def draw_menu(self):
         # Dessiner l'arrière-plan moderne au lieu de menu_background
@@ -1245,89 +1378,77 @@ class Game:
         self.screen.blit(version_text, (SCREEN_WIDTH - version_text.get_width() - 20, SCREEN_HEIGHT - version_text.get_height() - 20))
     
     def draw_pause_menu(self):
-        # D'abord dessiner le jeu en arrière-plan
-        self.draw_game()
-        
-        # Dessiner la superposition
-        overlay_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay_surface.fill((0, 0, 0, 150))
-        self.screen.blit(overlay_surface, (0, 0))
-        
-        # Dessiner le titre de pause
-        pause_text = self.fonts['heading'].render("Game Paused", True, WHITE)
-        self.screen.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, 150))
+        # Figer le jeu assombri et le titre une seule fois, à l'entrée dans la pause
+        if not self.freeze_frame.is_frozen(GameState.PAUSED):
+            self.draw_game()
+            self.freeze_frame.capture(self.screen, GameState.PAUSED, 150, self.draw_pause_title)
+        self.freeze_frame.draw(self.screen)
         
         # Dessiner les boutons
         for button in self.pause_buttons:
             button.draw(self.screen)
     
+    def draw_pause_title(self, surface):
+        # Dessiner le titre de pause
+        pause_text = self.fonts['heading'].render("Game Paused", True, WHITE)
+        surface.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, 150))
+    
     def draw_game_over(self):
-        # Dessiner l'arrière-plan avec alpha
-        overlay_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay_surface.fill((0, 0, 0, 200))
-        self.screen.blit(overlay_surface, (0, 0))
+        # Figer le jeu et le bilan de la partie une seule fois, à l'entrée dans l'écran
+        if not self.freeze_frame.is_frozen(GameState.GAME_OVER):
+            self.draw_game()
+            self.freeze_frame.capture(self.screen, GameState.GAME_OVER, 200, self.draw_game_over_summary)
+            self.game_over_buttons = (
+                AnimatedButton(SCREEN_WIDTH // 2 - 150, 500, 300, 70, "Play Again", None, "green"),
+                AnimatedButton(SCREEN_WIDTH // 2 - 150, 590, 300, 70, "Main Menu", None, "blue"),
+            )
+        self.freeze_frame.draw(self.screen)
         
+        # Dessiner les boutons
+        restart_btn, menu_btn = self.game_over_buttons
+        restart_btn.draw(self.screen)
+        menu_btn.draw(self.screen)
+        
+        # Gérer les clics de boutons
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            
+            if restart_btn.is_pressed(event):
+                self.setup_game()
+                self.state = GameState.PLAYING
+                sound_manager.play_game_theme()
+            
+            if menu_btn.is_pressed(event):
+                self.state = GameState.MENU
+                sound_manager.play_menu_theme()
+    
+    def draw_game_over_summary(self, surface):
         # Dessiner le titre de fin de partie
         game_over_text = self.fonts['title'].render("Game Over", True, (255, 50, 50))
-        self.screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 150))
+        surface.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 150))
         
         # Dessiner le score
         score_text = self.fonts['heading'].render(f"Final Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 250))
+        surface.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 250))
         
         # Dessiner le niveau atteint
         level_text = self.fonts['info'].render(f"Level Reached: {self.level}", True, WHITE)
-        self.screen.blit(level_text, (SCREEN_WIDTH // 2 - level_text.get_width() // 2, 320))
+        surface.blit(level_text, (SCREEN_WIDTH // 2 - level_text.get_width() // 2, 320))
         
         # Dessiner les pièces collectées
         coins_text = self.fonts['info'].render(f"Coins Collected: {self.coins_collected}", True, WHITE)
-        self.screen.blit(coins_text, (SCREEN_WIDTH // 2 - coins_text.get_width() // 2, 360))
+        surface.blit(coins_text, (SCREEN_WIDTH // 2 - coins_text.get_width() // 2, 360))
         
         # Dessiner les pas effectués
         steps_text = self.fonts['info'].render(f"Steps Taken: {self.steps}", True, WHITE)
-        self.screen.blit(steps_text, (SCREEN_WIDTH // 2 - steps_text.get_width() // 2, 400))
+        surface.blit(steps_text, (SCREEN_WIDTH // 2 - steps_text.get_width() // 2, 400))
         
         # Dessiner les succès
         if self.achievements_unlocked:
             achievements_text = self.fonts['info'].render(f"Achievements: {', '.join(self.achievements_unlocked)}", True, (255, 215, 0))
-            self.screen.blit(achievements_text, (SCREEN_WIDTH // 2 - achievements_text.get_width() // 2, 440))
-        
-        # Dessiner le bouton de redémarrage
-        restart_btn = AnimatedButton(
-            SCREEN_WIDTH // 2 - 150,
-            500,
-            300, 70,
-            "Play Again",
-            None,
-            "green"
-        )
-        restart_btn.draw(self.screen)
-        
-        # Dessiner le bouton de menu
-        menu_btn = AnimatedButton(
-            SCREEN_WIDTH // 2 - 150,
-            590,
-            300, 70,
-            "Main Menu",
-            None,
-            "blue"
-        )
-        menu_btn.draw(self.screen)
-        
-        # Gérer les clics de boutons
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            
-            if restart_btn.is_pressed(event):
-                self.setup_game()
-                self.state = GameState.PLAYING
-                sound_manager.play_game_theme()
-            
-            if menu_btn.is_pressed(event):
-                self.state = GameState.MENU
-                sound_manager.play_menu_theme()
+            surface.blit(achievements_text, (SCREEN_WIDTH // 2 - achievements_text.get_width() // 2, 440))
     
     def draw_notifications(self):
         # Dessiner toutes les notifications actives
@@ -1338,7 +1459,7 @@ class Game:
     
     def draw_debug_info(self):
         # Créer le panneau de débogage
-        debug_panel = Panel(SCREEN_WIDTH - 210, 10, 200, 120, (0, 0, 0, 180), border_radius=5)
+        debug_panel = Panel(SCREEN_WIDTH - 210, 10, 200, 270, (0, 0, 0, 180), border_radius=5)
         debug_panel.draw(self.screen)
         
         # Dessiner le FPS (utiliser la valeur mise en cache)
@@ -1356,6 +1477,26 @@ class Game:
         # Dessiner la position de la caméra
         camera_text = self.fonts['small'].render(f"Camera: {int(self.camera_x)},{int(self.camera_y)}", True, WHITE)
         self.screen.blit(camera_text, (SCREEN_WIDTH - 200, 110))
+        
+        # Dessiner l'état des caches de surfaces
+        cache_text = self.fonts['small'].render(get_cache_manager().summary(), True, WHITE)
+        self.screen.blit(cache_text, (SCREEN_WIDTH - 200, 140))
+        
+        # Dessiner le nombre de polices créées depuis le démarrage (doit rester à 0)
+        font_text = self.fonts['small'].render(f"Fonts after startup: {get_font_stats()['after_startup']}", True, WHITE)
+        self.screen.blit(font_text, (SCREEN_WIDTH - 200, 170))
+        
+        # Dessiner le temps passé dans les appels audio sur le thread de jeu (dernier appel et pire cas)
+        audio_text = self.fonts['small'].render(sound_manager.timer.summary(), True, WHITE)
+        self.screen.blit(audio_text, (SCREEN_WIDTH - 200, 200))
+        
+        # Dessiner la latence entre la lecture d'une entrée et l'affichage de son résultat
+        input_text = self.fonts['small'].render(self.input_queue.summary(), True, WHITE)
+        self.screen.blit(input_text, (SCREEN_WIDTH - 200, 230))
+        
+        # Dessiner le nombre d'écritures de scores échouées (thread d'écriture différée)
+        writes_text = self.fonts['small'].render(f"Score writes failed: {score_manager.writer.errors}", True, WHITE)
+        self.screen.blit(writes_text, (SCREEN_WIDTH - 200, 260))
 
 # Fonction principale
 def main():
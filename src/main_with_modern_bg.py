@@ -5,9 +5,12 @@ import os
 import sys
 from settings import *
 from game_logic import generate_map, draw_map, load_character_skins, load_bonus_image, check_achievements, apply_weather_effects
-from score_manager import ScoreManager
+from score_manager import ScoreManager, get_score_manager
 from sound_manager import SoundManager
 from modern_background import ModernBackground, EnhancedParallaxBackground
+from font_registry import load_custom_fonts
+import button_keyframes
+import procedural_textures
 import menu
 
 # Initialize Pygame
@@ -18,31 +21,12 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Random Blocks Game")
 
 # Initialize managers
-score_manager = ScoreManager()
+score_manager = get_score_manager()
 sound_manager = SoundManager()
 
 # Global variables
 debug_mode = False  # Added debug_mode as a global variable
 
-# Load custom fonts
-def load_custom_fonts():
-    fonts = {}
-    try:
-        # Try to load custom fonts if available
-        fonts['title'] = pygame.font.Font(None, 92)
-        fonts['heading'] = pygame.font.Font(None, 64)
-        fonts['button'] = pygame.font.Font(None, 48)
-        fonts['info'] = pygame.font.Font(None, 36)
-        fonts['small'] = pygame.font.Font(None, 24)
-    except:
-        # Fallback to system fonts
-        fonts['title'] = pygame.font.SysFont('arial', 92)
-        fonts['heading'] = pygame.font.SysFont('arial', 64)
-        fonts['button'] = pygame.font.SysFont('arial', 48)
-        fonts['info'] = pygame.font.SysFont('arial', 36)
-        fonts['small'] = pygame.font.SysFont('arial', 24)
-    return fonts
-
 # Add compatibility methods to SoundManager
 def play_sound(self, sound_name):
     """Compatibility method to map generic sound names to specific methods"""
@@ -165,6 +149,9 @@ class AnimatedButton:
         self.pulse_time = 0
         self.pulse_duration = 0
         self.pulse_max = 30
+        
+        # Pre-render the resting keyframes
+        button_keyframes.prerender(self)
 
     def update(self):
         # Update scale with smooth animation
@@ -193,82 +180,81 @@ class AnimatedButton:
     def draw(self, surface):
         self.update()
         
-        # Draw glow effect if hovered
-        if self.glow_radius > 0:
-            glow_surf = pygame.Surface((self.rect.width + self.max_glow*2, self.rect.height + self.max_glow*2), pygame.SRCALPHA)
+        # Choose the pre-rendered keyframe matching the animation
+        frame = button_keyframes.get_frame(self)
+        surface.blit(frame, frame.get_rect(center=self.rect.center))
+    
+    def render_frame(self, state, width, height, glow_radius, pulse_phase):
+        padding = self.pulse_max if pulse_phase is not None else self.max_glow
+        button_surface = pygame.Surface((width + padding*2, height + padding*2), pygame.SRCALPHA)
+        rect = pygame.Rect(padding, padding, width, height)
+        
+        # Draw glow effect when hovered
+        if glow_radius > 0:
+            glow_surf = pygame.Surface((width + self.max_glow*2, height + self.max_glow*2), pygame.SRCALPHA)
             pygame.draw.rect(
                 glow_surf, 
                 self.color_scheme["glow"], 
-                (self.max_glow, self.max_glow, self.rect.width, self.rect.height),
+                (self.max_glow, self.max_glow, width, height),
                 border_radius=15
             )
+            # Use try/except for gaussian_blur as it might not be available in all pygame versions
             try:
-                glow_surf = pygame.transform.gaussian_blur(glow_surf, self.glow_radius)
-            except:
+                glow_surf = pygame.transform.gaussian_blur(glow_surf, glow_radius)
+            except AttributeError:
                 # Fallback if gaussian_blur is not available
                 pass
-            surface.blit(glow_surf, (self.rect.x - self.max_glow, self.rect.y - self.max_glow))
+            button_surface.blit(glow_surf, (rect.x - self.max_glow, rect.y - self.max_glow))
         
         # Draw shadow
-        shadow_rect = pygame.Rect(
-            self.rect.x + self.shadow_offset,
-            self.rect.y + self.shadow_offset,
-            self.rect.width,
-            self.rect.height
-        )
         pygame.draw.rect(
-            surface, 
+            button_surface, 
             self.color_scheme["shadow"], 
-            shadow_rect,
+            rect.move(self.shadow_offset, self.shadow_offset),
             border_radius=15
         )
         
         # Draw button
         pygame.draw.rect(
-            surface, 
-            self.color_scheme[self.state], 
-            self.rect,
+            button_surface, 
+            self.color_scheme[state], 
+            rect,
             border_radius=15
         )
         
         # Add subtle gradient effect
-        gradient = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        for i in range(self.rect.height // 2):
-            alpha = 100 - (i * 2)
-            if alpha > 0:
-                pygame.draw.rect(
-                    gradient, 
-                    (255, 255, 255, alpha), 
-                    (0, i, self.rect.width, 2),
-                    border_radius=15
-                )
-        surface.blit(gradient, self.rect.topleft)
+        gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+        gradient.blit(procedural_textures.alpha_ramp(width, height // 2, (255, 255, 255), 100, 100 - (height // 2) * 2), (0, 0))
+        procedural_textures.apply_rounded_mask(gradient, 15)
+        button_surface.blit(gradient, rect.topleft)
         
-        # Draw text with shadow for depth
+        # Draw text with slight shadow for depth
         text_surface = self.fonts['button'].render(self.text, True, (0, 0, 0, 128))
-        text_rect = text_surface.get_rect(center=(self.rect.center[0] + 2, self.rect.center[1] + 2))
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=(rect.centerx + 2, rect.centery + 2))
+        button_surface.blit(text_surface, text_rect)
         
         text_surface = self.fonts['button'].render(self.text, True, self.color_scheme["text"])
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=rect.center)
+        button_surface.blit(text_surface, text_rect)
         
         # Draw icon if provided
         if self.icon:
-            icon_rect = self.icon.get_rect(midleft=(self.rect.x + 20, self.rect.centery))
-            surface.blit(self.icon, icon_rect)
+            icon_rect = self.icon.get_rect(midleft=(rect.x + 20, rect.centery))
+            button_surface.blit(self.icon, icon_rect)
         
         # Draw pulse effect if active
-        if self.pulse_duration > 0:
-            pulse_alpha = int(255 * (1 - abs(self.pulse_time / self.pulse_duration - 0.5) * 2))
-            pulse_surf = pygame.Surface((self.rect.width + self.pulse_max*2, self.rect.height + self.pulse_max*2), pygame.SRCALPHA)
+        if pulse_phase is not None:
+            pulse_alpha = int(255 * (1 - abs(pulse_phase - 0.5) * 2))
+            pulse_surf = pygame.Surface((width + self.pulse_max*2, height + self.pulse_max*2), pygame.SRCALPHA)
             pygame.draw.rect(
                 pulse_surf, 
                 (*self.color_scheme["hover"], pulse_alpha), 
-                (0, 0, self.rect.width + self.pulse_max*2, self.rect.height + self.pulse_max*2),
+                (0, 0, width + self.pulse_max*2, height + self.pulse_max*2),
                 border_radius=20
             )
-            surface.blit(pulse_surf, (self.rect.x - self.pulse_max, self.rect.y - self.pulse_max))
+            button_surface.blit(pulse_surf, (0, 0))
+        
+        return button_surface
 
     def is_hovered(self):
         mouse_pos = pygame.mouse.get_pos()
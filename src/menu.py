@@ -5,6 +5,10 @@ import math
 import random
 from settings import *
 from game import start_game
+from score_manager import get_score_manager
+import procedural_textures
+from font_registry import get_font
+import button_keyframes
 
 # Initialize Pygame
 pygame.init()
@@ -15,14 +19,9 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Random Blocks Game - Main Menu")
 
 # Load fonts
-try:
-    title_font = pygame.font.Font(None, 92)
-    button_font = pygame.font.Font(None, 48)
-    info_font = pygame.font.Font(None, 36)
-except:
-    title_font = pygame.font.SysFont('arial', 92)
-    button_font = pygame.font.SysFont('arial', 48)
-    info_font = pygame.font.SysFont('arial', 36)
+title_font = get_font(None, 92)
+button_font = get_font(None, 48)
+info_font = get_font(None, 36)
 
 # Create a dynamic color palette for award-winning UI
 class ColorPalette:
@@ -153,21 +152,13 @@ def load_image(path, fallback_color=colors.gradient_start):
         return surface
 
 # Create a gradient background
-menu_background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-for y in range(SCREEN_HEIGHT):
-    # Create a smooth gradient from dark blue to light blue
-    position = y / SCREEN_HEIGHT
-    color = colors.get_gradient_color(position)
-    pygame.draw.line(menu_background, color, (0, y), (SCREEN_WIDTH, y))
+# Smooth gradient from dark blue to light blue
+menu_background = procedural_textures.linear_gradient(
+    SCREEN_WIDTH, SCREEN_HEIGHT, colors.gradient_start, colors.gradient_end, srcalpha=False
+)
 
 # Add subtle pattern to background
-for _ in range(300):
-    x = random.randint(0, SCREEN_WIDTH)
-    y = random.randint(0, SCREEN_HEIGHT)
-    radius = random.randint(1, 3)
-    alpha = random.randint(10, 40)
-    color = (*colors.light, alpha)
-    pygame.draw.circle(menu_background, color, (x, y), radius)
+procedural_textures.scatter_dots(menu_background, 300, colors.light, radius_range=(1, 3), alpha_range=(10, 40))
 
 # Create overlay for depth effect
 overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
@@ -217,11 +208,7 @@ class AnimatedButton:
         # Get color scheme from palette
         self.color_scheme = colors.schemes.get(color_scheme, colors.schemes["blue"])
         
-        # Try to load font, fall back to system font if needed
-        try:
-            self.font = pygame.font.Font(None, 48)
-        except:
-            self.font = pygame.font.SysFont('arial', 48)
+        self.font = button_font
             
         self.state = "normal"  # normal, hover, press
         
@@ -239,6 +226,9 @@ class AnimatedButton:
         
         # Shadow offset
         self.shadow_offset = 4
+        
+        # Pre-render the resting keyframes
+        button_keyframes.prerender(self)
 
     def update(self):
         # Update scale with smooth animation
@@ -260,66 +250,64 @@ class AnimatedButton:
     def draw(self, surface):
         self.update()
         
+        # Choose the pre-rendered keyframe matching the animation
+        frame = button_keyframes.get_frame(self)
+        surface.blit(frame, frame.get_rect(center=self.rect.center))
+    
+    def render_frame(self, state, width, height, glow_radius, pulse_phase):
+        padding = self.max_glow
+        button_surface = pygame.Surface((width + padding*2, height + padding*2), pygame.SRCALPHA)
+        rect = pygame.Rect(padding, padding, width, height)
+        
         # Draw glow effect when hovered
-        if self.glow_radius > 0:
-            glow_surf = pygame.Surface((self.rect.width + self.max_glow*2, self.rect.height + self.max_glow*2), pygame.SRCALPHA)
+        if glow_radius > 0:
+            glow_surf = pygame.Surface((width + self.max_glow*2, height + self.max_glow*2), pygame.SRCALPHA)
             pygame.draw.rect(
                 glow_surf, 
                 self.color_scheme["glow"], 
-                (self.max_glow, self.max_glow, self.rect.width, self.rect.height),
+                (self.max_glow, self.max_glow, width, height),
                 border_radius=15
             )
             # Use try/except for gaussian_blur as it might not be available in all pygame versions
             try:
-                glow_surf = pygame.transform.gaussian_blur(glow_surf, self.glow_radius)
+                glow_surf = pygame.transform.gaussian_blur(glow_surf, glow_radius)
             except AttributeError:
                 # Fallback if gaussian_blur is not available
                 pass
-            surface.blit(glow_surf, (self.rect.x - self.max_glow, self.rect.y - self.max_glow))
+            button_surface.blit(glow_surf, (rect.x - self.max_glow, rect.y - self.max_glow))
         
         # Draw shadow
-        shadow_rect = pygame.Rect(
-            self.rect.x + self.shadow_offset,
-            self.rect.y + self.shadow_offset,
-            self.rect.width,
-            self.rect.height
-        )
         pygame.draw.rect(
-            surface, 
+            button_surface, 
             self.color_scheme["shadow"], 
-            shadow_rect,
+            rect.move(self.shadow_offset, self.shadow_offset),
             border_radius=15
         )
         
         # Draw button
         pygame.draw.rect(
-            surface, 
-            self.color_scheme[self.state], 
-            self.rect,
+            button_surface, 
+            self.color_scheme[state], 
+            rect,
             border_radius=15
         )
         
         # Add subtle gradient effect
-        gradient = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        for i in range(self.rect.height // 2):
-            alpha = 100 - (i * 2)
-            if alpha > 0:
-                pygame.draw.rect(
-                    gradient, 
-                    (255, 255, 255, alpha), 
-                    (0, i, self.rect.width, 2),
-                    border_radius=15
-                )
-        surface.blit(gradient, self.rect.topleft)
+        gradient = pygame.Surface((width, height), pygame.SRCALPHA)
+        gradient.blit(procedural_textures.alpha_ramp(width, height // 2, (255, 255, 255), 100, 100 - (height // 2) * 2), (0, 0))
+        procedural_textures.apply_rounded_mask(gradient, 15)
+        button_surface.blit(gradient, rect.topleft)
         
         # Draw text with slight shadow for depth
         text_surface = self.font.render(self.text, True, (0, 0, 0, 128))
-        text_rect = text_surface.get_rect(center=(self.rect.center[0] + 2, self.rect.center[1] + 2))
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=(rect.centerx + 2, rect.centery + 2))
+        button_surface.blit(text_surface, text_rect)
         
         text_surface = self.font.render(self.text, True, self.color_scheme["text"])
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=rect.center)
+        button_surface.blit(text_surface, text_rect)
+        
+        return button_surface
 
     def is_hovered(self):
         mouse_pos = pygame.mouse.get_pos()
@@ -418,14 +406,11 @@ def display_high_scores():
         color = (*colors.light, alpha)
         pygame.draw.circle(panel, color, (x, y), size)
     
-    # Load scores
-    try:
-        with open(SCORES_FILE, "r") as file:
-            top_score = int(file.read())
-    except FileNotFoundError:
-        top_score = 0
-    except:
-        top_score = 0
+    # Scores from the in-memory index and leaderboard (no file read); the panel is rendered once per visit
+    score_manager = get_score_manager()
+    best_scores = score_manager.get_best_scores()
+    statistics = score_manager.get_statistics()
+    top_score = best_scores["all_time"]
     
     # Render title
     title_text = title_font.render("High Scores", True, WHITE)
@@ -440,12 +425,18 @@ def display_high_scores():
     # Add decorative line
     pygame.draw.line(panel, colors.primary, (150, 200), (450, 200), 3)
     
-    # Add some fictional stats for visual appeal
+    total_minutes = int(statistics["total_time"]) // 60
+    best_today = best_scores["today"]
+    if best_today:
+        top_percent = max(1, round(100 - score_manager.get_percentile_rank(best_today)))
+        best_today_text = f"{best_today} (top {top_percent}%)"
+    else:
+        best_today_text = "-"
     stats = [
-        ("Games Played", "42"),
-        ("Total Time", "3h 27m"),
-        ("Highest Level", "8"),
-        ("Blocks Collected", "156")
+        ("Games Played", str(statistics["games_played"])),
+        ("Total Time", f"{total_minutes // 60}h {total_minutes % 60:02d}m"),
+        ("Best This Week", str(best_scores["week"])),
+        ("Best Today", best_today_text)
     ]
     
     y_pos = 250
@@ -2,6 +2,8 @@ import pygame
 import random
 import math
 import os
+from glow_bank import get_glow_bank
+import procedural_textures
 
 class ModernBackground:
     """
@@ -56,28 +58,25 @@ class ModernBackground:
         self.triangle_angle = 0  # Angle for rotating triangle
         self.orb_position = [random.randint(0, screen_width), random.randint(0, screen_height)]  # Orb position
         self.orb_trail = []  # Trail for the glowing orb
+        
+        # Shared bank of pre-rendered glow sprites
+        self.glow_bank = get_glow_bank()
     
     def create_base_layers(self):
         """Create the base layers for the background."""
         # Layer 1: Gradient background
-        gradient = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        for y in range(self.screen_height):
-            ratio = y / self.screen_height
-            r = int(self.colors['dark_blue'][0] * (1 - ratio) + self.colors['medium_blue'][0] * ratio)
-            g = int(self.colors['dark_blue'][1] * (1 - ratio) + self.colors['medium_blue'][1] * ratio)
-            b = int(self.colors['dark_blue'][2] * (1 - ratio) + self.colors['medium_blue'][2] * ratio)
-            pygame.draw.line(gradient, (r, g, b), (0, y), (self.screen_width, y))
+        gradient = procedural_textures.linear_gradient(
+            self.screen_width, self.screen_height,
+            self.colors['dark_blue'], self.colors['medium_blue']
+        )
         self.layers.append(gradient)
         
         # Layer 2: Subtle pattern
         pattern = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        for _ in range(300):
-            x = random.randint(0, self.screen_width)
-            y = random.randint(0, self.screen_height)
-            radius = random.randint(1, 3)
-            alpha = random.randint(5, 20)
-            color = (*self.colors['light_blue'][:3], alpha)
-            pygame.draw.circle(pattern, color, (x, y), radius)
+        procedural_textures.scatter_dots(
+            pattern, 300, self.colors['light_blue'],
+            radius_range=(1, 3), alpha_range=(5, 20)
+        )
         self.layers.append(pattern)
     
     def create_particles(self):
@@ -139,16 +138,7 @@ class ModernBackground:
     
     def create_vignette(self):
         """Create a vignette effect for the screen edges."""
-        vignette = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        for i in range(100):
-            alpha = int(i * 1.5)
-            pygame.draw.rect(
-                vignette,
-                (0, 0, 0, alpha),
-                (i, i, self.screen_width - 2*i, self.screen_height - 2*i),
-                1
-            )
-        return vignette
+        return procedural_textures.vignette(self.screen_width, self.screen_height, border=100, max_alpha=150)
     
     def create_grid(self):
         """Create a subtle grid effect."""
@@ -222,17 +212,8 @@ class ModernBackground:
             size = glow['size'] * (0.8 + 0.4 * pulse)
             alpha = glow['alpha'] * (0.7 + 0.3 * pulse)
             
-            glow_surface = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-            for i in range(int(size)):
-                alpha_i = int(alpha * (1 - i/size))
-                if alpha_i > 0:
-                    pygame.draw.circle(
-                        glow_surface,
-                        (*glow['color'][:3], alpha_i),
-                        (int(size), int(size)),
-                        int(size - i)
-                    )
-            surface.blit(glow_surface, (int(glow['x'] - size), int(glow['y'] - size)))
+            # Pre-rendered glow sprite: a single blit
+            self.glow_bank.blit_glow(surface, (glow['x'], glow['y']), size, glow['color'], alpha)
         
         # Draw stars
         for star in self.stars:
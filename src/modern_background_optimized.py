@@ -2,6 +2,9 @@ import pygame
 import random
 import math
 import os
+from glow_bank import get_glow_bank
+import procedural_textures
+from surface_cache import create_surface_cache
 
 class ModernBackground:
     """
@@ -56,7 +59,8 @@ class ModernBackground:
         self.orb_trail = []
         
         # Cache pour les surfaces fréquemment utilisées
-        self.surface_cache = {}
+        self.surface_cache = create_surface_cache("background.stars", 512 * 1024)
+        self.glow_bank = get_glow_bank()
         
         # Contrôle de la fréquence de mise à jour
         self.update_frequency = 2  # Mettre à jour tous les N frames
@@ -64,24 +68,17 @@ class ModernBackground:
     
     def create_base_surface(self):
         """Créer la surface de base pré-rendue pour l'arrière-plan."""
-        base_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        
         # Couche 1: Arrière-plan dégradé
-        for y in range(self.screen_height):
-            ratio = y / self.screen_height
-            r = int(self.colors['dark_blue'][0] * (1 - ratio) + self.colors['medium_blue'][0] * ratio)
-            g = int(self.colors['dark_blue'][1] * (1 - ratio) + self.colors['medium_blue'][1] * ratio)
-            b = int(self.colors['dark_blue'][2] * (1 - ratio) + self.colors['medium_blue'][2] * ratio)
-            pygame.draw.line(base_surface, (r, g, b), (0, y), (self.screen_width, y))
+        base_surface = procedural_textures.linear_gradient(
+            self.screen_width, self.screen_height,
+            self.colors['dark_blue'], self.colors['medium_blue']
+        )
         
         # Couche 2: Motif subtil
-        for _ in range(200):  # Réduire le nombre de points
-            x = random.randint(0, self.screen_width)
-            y = random.randint(0, self.screen_height)
-            radius = random.randint(1, 3)
-            alpha = random.randint(5, 20)
-            color = (*self.colors['light_blue'][:3], alpha)
-            pygame.draw.circle(base_surface, color, (x, y), radius)
+        procedural_textures.scatter_dots(
+            base_surface, 200, self.colors['light_blue'],
+            radius_range=(1, 3), alpha_range=(5, 20)
+        )
             
         return base_surface
     
@@ -143,16 +140,7 @@ class ModernBackground:
     
     def create_vignette(self):
         """Créer un effet de vignette pour les bords de l'écran."""
-        vignette = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        for i in range(0, 100, 5):  # Réduire le nombre d'itérations
-            alpha = int(i * 1.5)
-            pygame.draw.rect(
-                vignette,
-                (0, 0, 0, alpha),
-                (i, i, self.screen_width - 2*i, self.screen_height - 2*i),
-                1
-            )
-        return vignette
+        return procedural_textures.vignette(self.screen_width, self.screen_height, border=100, max_alpha=150)
     
     def create_grid(self):
         """Créer un effet de grille subtil."""
@@ -166,7 +154,8 @@ class ModernBackground:
     def get_star_surface(self, size, color, outline_color=None):
         """Obtenir une surface d'étoile du cache ou en créer une nouvelle."""
         key = (size, color, outline_color)
-        if key not in self.surface_cache:
+        surface = self.surface_cache.get(key)
+        if surface is None:
             # Créer une nouvelle surface d'étoile
             surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
             
@@ -182,15 +171,9 @@ class ModernBackground:
                 pygame.draw.polygon(surface, outline_color, points, 2)
             pygame.draw.polygon(surface, color, points)
             
-            self.surface_cache[key] = surface
-            
-            # Limiter la taille du cache
-            if len(self.surface_cache) > 50:
-                # Supprimer une entrée aléatoire
-                random_key = random.choice(list(self.surface_cache.keys()))
-                del self.surface_cache[random_key]
+            self.surface_cache.put(key, surface)
                 
-        return self.surface_cache[key]
+        return surface
     
     def update(self, camera_x=0):
         """Mettre à jour l'animation d'arrière-plan (optimisée)."""
@@ -248,18 +231,8 @@ class ModernBackground:
             size = glow['size'] * (0.8 + 0.4 * pulse)
             alpha = glow['alpha'] * (0.7 + 0.3 * pulse)
             
-            # Utiliser une surface plus petite pour l'effet de lueur
-            glow_surface = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-            for i in range(0, int(size), 5):  # Réduire le nombre d'itérations
-                alpha_i = int(alpha * (1 - i/size))
-                if alpha_i > 0:
-                    pygame.draw.circle(
-                        glow_surface,
-                        (*glow['color'][:3], alpha_i),
-                        (int(size), int(size)),
-                        int(size - i)
-                    )
-            surface.blit(glow_surface, (int(glow['x'] - size), int(glow['y'] - size)))
+            # Sprite de lueur pré-rendu : un seul blit
+            self.glow_bank.blit_glow(surface, (glow['x'], glow['y']), size, glow['color'], alpha)
         
         # Dessiner les étoiles (seulement quelques-unes)
         for star in self.stars[:10]:  # Limiter le nombre d'étoiles dessinées
@@ -0,0 +1,150 @@
+"""
+Musique sans blocage : préchargement en arrière-plan et fondu enchaîné.
+
+`pygame.mixer.music.load` ouvre et décode le fichier sur le thread de jeu au
+moment du changement d'écran. Ici les morceaux sont décodés une fois par un
+thread dédié (dès le démarrage pour ceux qu'on prévoit de jouer) et joués
+en boucle sur deux canaux réservés : changer de morceau lance un fondu
+sortant sur l'un et un fondu entrant sur l'autre, géré par le mixer.
+Un morceau demandé avant la fin de son décodage démarre dès qu'il est prêt.
+
+Les morceaux décodés restent en mémoire (environ 10 Mo par minute en
+stéréo 44,1 kHz) : à réserver aux quelques thèmes du jeu.
+"""
+import queue
+import threading
+import time
+from contextlib import contextmanager
+import pygame
+
+
+class AudioTimer:
+    """Temps passé dans les appels audio sur le thread de jeu."""
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+
+    @contextmanager
+    def measure(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.calls += 1
+            self.total_ms += elapsed
+            self.last_ms = elapsed
+            self.max_ms = max(self.max_ms, elapsed)
+
+    def summary(self):
+        return f"Audio: {self.last_ms:.2f} ms (max {self.max_ms:.2f})"
+
+
+class MusicController:
+    """
+    Thèmes musicaux joués sur les canaux `first_channel` et `first_channel + 1`.
+
+    Ces deux canaux sont réservés ; créer le contrôleur avant la banque de
+    sons et donner à celle-ci `first_channel + 2` comme premier canal.
+    """
+    def __init__(self, first_channel=0, fade_ms=1000, volume=0.5):
+        total = first_channel + 2
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        self.channels = [pygame.mixer.Channel(first_channel), pygame.mixer.Channel(first_channel + 1)]
+        self.active = 0
+        self.fade_ms = fade_ms
+        self.volume = volume
+
+        self.tracks = {}
+        self.loading = set()
+        self.load_errors = {}
+        self.current = None
+        self.lock = threading.Lock()
+        self.playback_lock = threading.Lock()
+        self.requests = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="music-loader", daemon=True)
+        self.thread.start()
+
+    def prefetch(self, name, path):
+        """Décoder un morceau en arrière-plan pour qu'il soit prêt au prochain changement d'écran."""
+        with self.lock:
+            if name in self.tracks or name in self.loading or name in self.load_errors:
+                return
+            self.loading.add(name)
+        self.requests.put((name, path))
+
+    def play(self, name, path, fade_ms=None):
+        """Passer au morceau `name` en fondu enchaîné (au plus tôt s'il est encore en cours de décodage)."""
+        with self.lock:
+            if name == self.current:
+                return
+            self.current = name
+            sound = self.tracks.get(name)
+        if sound is None:
+            self.prefetch(name, path)
+        else:
+            self._crossfade(sound, fade_ms)
+
+    def is_ready(self, name):
+        return name in self.tracks
+
+    def stop(self, fade_ms=None):
+        with self.lock:
+            self.current = None
+        fade = self.fade_ms if fade_ms is None else fade_ms
+        with self.playback_lock:
+            for channel in self.channels:
+                self._fade_out(channel, fade)
+
+    def pause(self):
+        for channel in self.channels:
+            channel.pause()
+
+    def unpause(self):
+        for channel in self.channels:
+            channel.unpause()
+
+    def set_volume(self, volume):
+        self.volume = volume
+        for channel in self.channels:
+            channel.set_volume(volume)
+
+    def _crossfade(self, sound, fade_ms=None):
+        fade = self.fade_ms if fade_ms is None else fade_ms
+        with self.playback_lock:
+            self._fade_out(self.channels[self.active], fade)
+            self.active = 1 - self.active
+            channel = self.channels[self.active]
+            channel.set_volume(self.volume)
+            channel.play(sound, loops=-1, fade_ms=fade)
+
+    @staticmethod
+    def _fade_out(channel, fade):
+        if not channel.get_busy():
+            return
+        if fade > 0:
+            channel.fadeout(fade)
+        else:
+            channel.stop()
+
+    def _run(self):
+        while True:
+            name, path = self.requests.get()
+            try:
+                sound = pygame.mixer.Sound(path)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Erreur lors du chargement de la musique {path}: {e}")
+                with self.lock:
+                    self.loading.discard(name)
+                    self.load_errors[name] = str(e)
+                continue
+            with self.lock:
+                self.tracks[name] = sound
+                self.loading.discard(name)
+                wanted = self.current == name
+            if wanted:
+                self._crossfade(sound)
@@ -1,6 +1,7 @@
 import pygame
 import random
 import math
+from surface_cache import create_surface_cache
 
 class Particle:
     def __init__(self, x, y, color=(255, 255, 255), size=3, speed=1, life=30, direction=None, alpha=255):
@@ -42,7 +43,7 @@ class ParticleSystem:
         self.width = width
         self.height = height
         self.particles = []
-        self.particle_cache = {}
+        self.particle_cache = create_surface_cache("particles.fixed", 1024 * 1024)
         
     def add_particles(self, x, y, count, color=(255, 255, 255), size_range=(1, 3), speed_range=(0.5, 2), life_range=(20, 40)):
         for _ in range(count):
@@ -99,4 +100,4 @@ class ParticleSystem:
         return self.particle_cache.get(key)
         
     def cache_surface(self, key, surface):
-        self.particle_cache[key] = surface
+        self.particle_cache.put(key, surface)
@@ -1,6 +1,7 @@
 import pygame
 import random
 import math
+from surface_cache import create_surface_cache
 
 class ParticleSystem:
     """
@@ -12,7 +13,7 @@ class ParticleSystem:
         self.screen_height = screen_height
         self.particles = []
         self.max_particles = 200  # Limite le nombre maximum de particules
-        self.batch_surfaces = {}  # Cache pour les surfaces de particules
+        self.batch_surfaces = create_surface_cache("particles.batch", 1024 * 1024)  # Cache LRU des surfaces de particules
         
     def add_movement_particles(self, x, y, count=5):
         # Limite le nombre de particules si nécessaire
@@ -80,7 +81,8 @@ class ParticleSystem:
     def _get_particle_surface(self, size, color):
         """Obtenir une surface de particule du cache ou en créer une nouvelle"""
         key = (size, color)
-        if key not in self.batch_surfaces:
+        particle_surface = self.batch_surfaces.get(key)
+        if particle_surface is None:
             particle_surface = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
             pygame.draw.circle(
                 particle_surface,
@@ -88,15 +90,9 @@ class ParticleSystem:
                 (int(size), int(size)),
                 int(size)
             )
-            self.batch_surfaces[key] = particle_surface
-            
-            # Limiter la taille du cache
-            if len(self.batch_surfaces) > 100:
-                # Supprimer une entrée aléatoire
-                random_key = random.choice(list(self.batch_surfaces.keys()))
-                del self.batch_surfaces[random_key]
+            self.batch_surfaces.put(key, particle_surface)
                 
-        return self.batch_surfaces[key]
+        return particle_surface
     
     def draw(self, surface):
         # Regrouper les particules par type pour un rendu par lots
@@ -0,0 +1,191 @@
+"""
+Textures procédurales vectorisées (dégradés, vignettes, motifs de points, bruit).
+
+Les fonctions calculent les pixels via numpy/pygame.surfarray (ou une seule ligne
+de pixels étirée en C) au lieu de dessiner ligne par ligne ou point par point en
+Python, ce qui réduit le temps de construction des arrière-plans au démarrage.
+"""
+import pygame
+import numpy
+
+def _color_ramp(color1, color2, steps):
+    """Interpoler linéairement entre deux couleurs RGB sur `steps` pas."""
+    ratio = numpy.arange(steps, dtype=numpy.float32)[:, None] / max(1, steps)
+    start = numpy.array(color1[:3], dtype=numpy.float32)
+    end = numpy.array(color2[:3], dtype=numpy.float32)
+    return (start * (1 - ratio) + end * ratio).astype(numpy.uint8)
+
+
+def linear_gradient(width, height, color1, color2, vertical=True, alpha=255, srcalpha=True):
+    """Créer une surface remplie d'un dégradé linéaire de color1 vers color2."""
+    flags = pygame.SRCALPHA if srcalpha else 0
+    if width <= 0 or height <= 0:
+        return pygame.Surface((max(0, width), max(0, height)), flags)
+
+    # Une seule ligne de pixels, étirée ensuite à la taille finale
+    steps = height if vertical else width
+    line = pygame.Surface((1, steps) if vertical else (steps, 1), flags)
+    pixels = pygame.surfarray.pixels3d(line)
+    pixels[:] = _color_ramp(color1, color2, steps).reshape(pixels.shape)
+    del pixels  # Libérer le verrou de la surface
+
+    if srcalpha:
+        alpha_pixels = pygame.surfarray.pixels_alpha(line)
+        alpha_pixels[:] = alpha
+        del alpha_pixels
+    return pygame.transform.scale(line, (width, height))
+
+
+def alpha_ramp(width, height, color, start_alpha, end_alpha=0, vertical=True):
+    """Créer une surface d'une couleur unie dont l'alpha varie linéairement (reflets, brillances)."""
+    if width <= 0 or height <= 0:
+        return pygame.Surface((max(0, width), max(0, height)), pygame.SRCALPHA)
+
+    steps = height if vertical else width
+    line = pygame.Surface((1, steps) if vertical else (steps, 1), pygame.SRCALPHA)
+    line.fill((*color[:3], 0))
+    ramp = numpy.linspace(start_alpha, end_alpha, steps, endpoint=False)
+    alpha_pixels = pygame.surfarray.pixels_alpha(line)
+    alpha_pixels[:] = numpy.clip(ramp, 0, 255).astype(numpy.uint8).reshape(alpha_pixels.shape)
+    del alpha_pixels
+    return pygame.transform.scale(line, (width, height))
+
+
+def vignette(width, height, border=100, max_alpha=150, color=(0, 0, 0)):
+    """Créer une vignette : opaque sur les bords, transparente au-delà de `border` pixels."""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.fill((*color[:3], 0))
+
+    def edge_profile(size):
+        # Alpha en fonction de la distance au bord le plus proche sur un axe
+        positions = numpy.arange(size, dtype=numpy.float32)
+        distance = numpy.minimum(positions, size - 1 - positions)
+        falloff = numpy.clip(1.0 - distance / max(1, border), 0.0, 1.0)
+        return (falloff * falloff * max_alpha).astype(numpy.uint8)
+
+    # L'alpha décroît avec la distance : le bord le plus proche l'emporte
+    alpha_pixels = pygame.surfarray.pixels_alpha(surface)
+    numpy.maximum(edge_profile(width)[:, None], edge_profile(height)[None, :], out=alpha_pixels)
+    del alpha_pixels
+    return surface
+
+
+_dot_stamps = {}
+
+def _dot_stamp(radius, color, alpha):
+    """Disque pré-rendu pour un rayon, une couleur et un alpha donnés."""
+    key = (radius, color, alpha)
+    stamp = _dot_stamps.get(key)
+    if stamp is None:
+        stamp = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(stamp, (*color, alpha), (radius, radius), radius)
+        _dot_stamps[key] = stamp
+    return stamp
+
+
+def scatter_dots(surface, count, color, radius_range=(1, 3), alpha_range=(5, 20), seed=None):
+    """
+    Dessiner `count` points semi-transparents répartis aléatoirement sur `surface`.
+
+    Les positions, rayons et alphas sont tirés en un seul appel numpy et les
+    disques sont des tampons pré-rendus appliqués en un seul Surface.blits.
+    """
+    width, height = surface.get_size()
+    if count <= 0 or width <= 0 or height <= 0:
+        return surface
+
+    rng = numpy.random.default_rng(seed)
+    xs = rng.integers(0, width, count)
+    ys = rng.integers(0, height, count)
+    radii = rng.integers(radius_range[0], radius_range[1] + 1, count)
+    alphas = rng.integers(alpha_range[0], alpha_range[1] + 1, count)
+
+    color = tuple(color[:3])
+    surface.blits(
+        [(_dot_stamp(radius, color, alpha), (x - radius, y - radius))
+         for x, y, radius, alpha in zip(xs.tolist(), ys.tolist(), radii.tolist(), alphas.tolist())],
+        doreturn=False
+    )
+    return surface
+
+
+def value_noise(width, height, cell_size=32, octaves=3, seed=None):
+    """Générer un bruit de valeur lissé (tableau float (width, height) dans [0, 1])."""
+    rng = numpy.random.default_rng(seed)
+    noise = numpy.zeros((width, height), dtype=numpy.float32)
+    amplitude = 1.0
+    total = 0.0
+
+    for _ in range(octaves):
+        cells_x = width // cell_size + 2
+        cells_y = height // cell_size + 2
+        lattice = rng.random((cells_x, cells_y), dtype=numpy.float32)
+
+        # Interpolation bilinéaire (lissée) des valeurs du réseau
+        fx = numpy.arange(width, dtype=numpy.float32) / cell_size
+        fy = numpy.arange(height, dtype=numpy.float32) / cell_size
+        ix, iy = fx.astype(numpy.int32), fy.astype(numpy.int32)
+        tx, ty = fx - ix, fy - iy
+        tx = tx * tx * (3 - 2 * tx)
+        ty = ty * ty * (3 - 2 * ty)
+
+        top = lattice[ix][:, iy] * (1 - ty) + lattice[ix][:, iy + 1] * ty
+        bottom = lattice[ix + 1][:, iy] * (1 - ty) + lattice[ix + 1][:, iy + 1] * ty
+        noise += (top * (1 - tx)[:, None] + bottom * tx[:, None]) * amplitude
+
+        total += amplitude
+        amplitude *= 0.5
+        cell_size = max(1, cell_size // 2)
+
+    return noise / total
+
+
+def noise_texture(width, height, color, max_alpha=40, cell_size=64, octaves=3, threshold=0.5, seed=None, detail=4):
+    """
+    Créer une texture de bruit colorée (nébuleuses, nuages) : seules les valeurs au-dessus du seuil sont visibles.
+
+    Le bruit est calculé à 1/`detail` de la résolution puis lissé à la taille finale.
+    """
+    small_width = max(1, width // detail)
+    small_height = max(1, height // detail)
+    noise = value_noise(small_width, small_height, max(1, cell_size // detail), octaves, seed)
+    density = numpy.clip((noise - threshold) / max(1e-6, 1.0 - threshold), 0.0, 1.0)
+
+    small = pygame.Surface((small_width, small_height), pygame.SRCALPHA)
+    small.fill((*color[:3], 0))
+    alpha_pixels = pygame.surfarray.pixels_alpha(small)
+    alpha_pixels[:] = (density * max_alpha).astype(numpy.uint8)
+    del alpha_pixels
+    return pygame.transform.smoothscale(small, (width, height))
+
+
+def grid_texture(grid, palette, width, height):
+    """
+    Cuire une grille de cases (liste de lignes) en surface de `width` x `height`.
+
+    La grille est rendue à 1 pixel par case via surfarray puis mise à l'échelle ;
+    `palette` associe une valeur de case à une couleur RGB(A), les autres
+    valeurs restent transparentes.
+    """
+    cells = numpy.asarray(grid, dtype=numpy.int32).T  # Axes (x, y) comme surfarray
+    rgba = numpy.zeros((*cells.shape, 4), dtype=numpy.uint8)
+    for value, color in palette.items():
+        rgba[cells == value] = (*color[:3], color[3] if len(color) > 3 else 255)
+
+    small = pygame.Surface(cells.shape, pygame.SRCALPHA)
+    pixels = pygame.surfarray.pixels3d(small)
+    pixels[:] = rgba[..., :3]
+    del pixels
+    alpha_pixels = pygame.surfarray.pixels_alpha(small)
+    alpha_pixels[:] = rgba[..., 3]
+    del alpha_pixels
+    return pygame.transform.scale(small, (width, height))
+
+
+def apply_rounded_mask(surface, border_radius):
+    """Appliquer des coins arrondis à une surface SRCALPHA (en place)."""
+    width, height = surface.get_size()
+    mask = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(mask, (255, 255, 255), (0, 0, width, height), border_radius=border_radius)
+    surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+    return surface
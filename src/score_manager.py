@@ -1,98 +1,460 @@
+import bisect
+import heapq
+import itertools
 import json
 import os
+import sqlite3
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
+from settings import SCORE_BACKEND, LEADERBOARD_SYNC
+from leaderboard_sync import LeaderboardSync
+from write_behind import WriteBehindWorker
+
+# Best-of-period windows, in days before today (today itself is day 0)
+PERIOD_DAYS = {"today": 0, "week": 7, "month": 30}
+INDEX_VERSION = 1
+# Entries kept per leaderboard list (all-time and per day)
+TOP_SIZE = 100
+# Where the first versions of the game kept their scores (Windows only; "c:app" is
+# relative to the current directory of drive C, exactly as those versions wrote it)
+LEGACY_SCORES_DIR = os.path.join("c:", "app", "random_blocks")
+
+
+def default_scores_dir():
+    """Per-user data directory: %APPDATA%\\random_blocks on Windows, $XDG_DATA_HOME/random_blocks elsewhere"""
+    if os.name == "nt":
+        # Keep using the old location if scores were already saved there
+        if os.path.isdir(LEGACY_SCORES_DIR):
+            return LEGACY_SCORES_DIR
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "random_blocks")
+
+
+def _day_number(timestamp):
+    """Local calendar day of a timestamp, as a date ordinal"""
+    return datetime.fromtimestamp(timestamp).date().toordinal()
+
+
+class ScoreIndex:
+    """
+    Aggregates maintained incrementally as scores are appended to the log.
+
+    Per difficulty (and for all difficulties together, under None) it keeps the
+    all-time best and the best score of each of the last PERIOD_DAYS["month"] + 1
+    days, so every best-of-period query reads a bounded number of buckets no
+    matter how many scores have been stored.
+    """
+    def __init__(self, data=None):
+        data = data or {}
+        self.log_offset = data.get("log_offset", 0)
+        self.statistics = dict(data.get("statistics", {"games_played": 0, "total_time": 0}))
+        self.best = {}
+        for difficulty, best in data.get("best", {}).items():
+            self.best[difficulty or None] = {
+                "all_time": best["all_time"],
+                "daily": {int(day): score for day, score in best["daily"].items()},
+            }
+
+    def add(self, score, timestamp, difficulty, time_played):
+        self.statistics["games_played"] += 1
+        self.statistics["total_time"] += time_played
+        day = _day_number(timestamp)
+        oldest_day = _day_number(time.time()) - PERIOD_DAYS["month"]
+        for key in (None, difficulty):
+            best = self.best.setdefault(key, {"all_time": score, "daily": {}})
+            best["all_time"] = max(best["all_time"], score)
+            if day >= oldest_day:
+                best["daily"][day] = max(best["daily"].get(day, score), score)
+            # Buckets older than the longest period can never be queried again
+            for stale_day in [d for d in best["daily"] if d < oldest_day]:
+                del best["daily"][stale_day]
+
+    def best_scores(self, difficulty=None, now=None):
+        today = _day_number(now if now is not None else time.time())
+        best = self.best.get(difficulty)
+        result = {period: 0 for period in PERIOD_DAYS}
+        result["all_time"] = 0
+        if best is None:
+            return result
+        daily = best["daily"]
+        for period, days in PERIOD_DAYS.items():
+            result[period] = max((daily.get(today - offset, 0) for offset in range(days + 1)), default=0)
+        result["all_time"] = best["all_time"]
+        return result
+
+    def to_json(self):
+        return {
+            "version": INDEX_VERSION,
+            "log_offset": self.log_offset,
+            "statistics": self.statistics,
+            "best": {
+                difficulty or "": {"all_time": best["all_time"], "daily": {str(day): score for day, score in best["daily"].items()}}
+                for difficulty, best in self.best.items()
+            },
+        }
+
+
+class Leaderboard:
+    """
+    Sorted score structures maintained incrementally, for top-N and percentile queries.
+
+    Per difficulty (and for all difficulties together, under None) it keeps
+    every score value in a sorted list (percentile rank by bisection), the
+    TOP_SIZE best entries of all time and the TOP_SIZE best entries of each of
+    the last PERIOD_DAYS["month"] + 1 days. A period's top-N merges at most a
+    month of already sorted daily lists.
+    """
+    def __init__(self, entries=()):
+        self.scores = {}
+        self.top = {}
+        self.daily_top = {}
+        self._sequence = itertools.count()
+        for entry in entries:
+            self.add(entry, sort=False)
+        for scores in self.scores.values():
+            scores.sort()
+
+    def add(self, entry, sort=True):
+        # Items are (-score, timestamp, sequence, entry): ascending order is best first
+        item = (-entry["score"], entry["timestamp"], next(self._sequence), entry)
+        day = _day_number(entry["timestamp"])
+        oldest_day = _day_number(time.time()) - PERIOD_DAYS["month"]
+        for key in (None, entry["difficulty"]):
+            scores = self.scores.setdefault(key, [])
+            if sort:
+                bisect.insort(scores, entry["score"])
+            else:
+                scores.append(entry["score"])
+            self._insert(self.top.setdefault(key, []), item)
+            if day >= oldest_day:
+                daily = self.daily_top.setdefault(key, {})
+                self._insert(daily.setdefault(day, []), item)
+                for stale_day in [d for d in daily if d < oldest_day]:
+                    del daily[stale_day]
+
+    @staticmethod
+    def _insert(items, item):
+        if len(items) >= TOP_SIZE and item >= items[-1]:
+            return
+        bisect.insort(items, item)
+        if len(items) > TOP_SIZE:
+            items.pop()
+
+    def top_scores(self, n=10, difficulty=None, period="all_time", now=None):
+        if period == "all_time":
+            items = self.top.get(difficulty, [])[:n]
+        else:
+            today = _day_number(now if now is not None else time.time())
+            daily = self.daily_top.get(difficulty, {})
+            days = [daily[today - offset] for offset in range(PERIOD_DAYS[period] + 1) if today - offset in daily]
+            items = itertools.islice(heapq.merge(*days), n)
+        return [item[3] for item in items]
+
+    def percentile_rank(self, score, difficulty=None):
+        scores = self.scores.get(difficulty)
+        if not scores:
+            return 100.0
+        return 100.0 * bisect.bisect_left(scores, score) / len(scores)
+
 
 class ScoreManager:
-    def __init__(self):
-        self.scores_dir = os.path.join("c:", "app", "random_blocks")
+    """
+    Score storage: an append-only log (one JSON line per game) plus an aggregate index.
+
+    Best scores and statistics are read from the index in memory, so neither
+    depends on how many scores are stored. Saving updates that index right
+    away and hands the disk write to a background worker, which appends
+    batches to the log and atomically replaces the index file with its own
+    copy matching what is on disk. A legacy scores.json is imported once.
+    """
+    def __init__(self, scores_dir=None):
+        self.scores_dir = scores_dir or default_scores_dir()
         self.scores_file = os.path.join(self.scores_dir, "scores.json")
+        self.log_file = os.path.join(self.scores_dir, "scores.log")
+        self.index_file = os.path.join(self.scores_dir, "scores_index.json")
         self.ensure_scores_file()
+        self.index = self.load_index()
+        self.persisted_index = ScoreIndex(self.index.to_json())
+        self.writer = WriteBehindWorker(self.write_entries, name="score-writer")
+        self.leaderboard = None
+        self.revision = 0
+        self.sync = None
 
     def ensure_scores_file(self):
-        """Initialize scores file if it doesn't exist"""
-        if not os.path.exists(self.scores_dir):
-            os.makedirs(self.scores_dir)
-        
-        if not os.path.exists(self.scores_file):
-            default_data = {
-                "scores": [],
-                "statistics": {
-                    "games_played": 0,
-                    "total_time": 0
-                }
-            }
-            with open(self.scores_file, 'w') as f:
-                json.dump(default_data, f)
+        """Initialize the score log if it doesn't exist, importing the legacy scores.json once"""
+        os.makedirs(self.scores_dir, exist_ok=True)
 
-    def save_score(self, score, difficulty, time_played):
-        """Save a new score with timestamp"""
+        if not os.path.exists(self.log_file):
+            legacy_scores = []
+            try:
+                with open(self.scores_file, 'r') as f:
+                    legacy_scores = json.load(f).get("scores", [])
+            except (FileNotFoundError, json.JSONDecodeError):
+                pass
+            with open(self.log_file, 'w') as f:
+                for entry in legacy_scores:
+                    f.write(json.dumps(entry) + "\n")
+
+    def load_index(self):
+        """Load the aggregate index, replaying log lines it has not seen yet (or the whole log if it is missing)"""
         try:
-            with open(self.scores_file, 'r') as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {"scores": [], "statistics": {"games_played": 0, "total_time": 0}}
+            with open(self.index_file, 'r') as f:
+                index = ScoreIndex(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+            index = ScoreIndex()
 
+        if os.path.getsize(self.log_file) < index.log_offset:
+            # Log truncated or replaced behind our back: rebuild from scratch
+            index = ScoreIndex()
+        if os.path.getsize(self.log_file) > index.log_offset:
+            with open(self.log_file, 'rb') as f:
+                f.seek(index.log_offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Partial last line of an interrupted write
+                    index.log_offset += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    index.add(entry["score"], entry["timestamp"], entry["difficulty"], entry["time_played"])
+            if os.path.getsize(self.log_file) > index.log_offset:
+                # Drop the partial line so the next append starts on a fresh line
+                with open(self.log_file, 'r+b') as f:
+                    f.truncate(index.log_offset)
+            self.write_index(index)
+        return index
+
+    def write_index(self, index):
+        """Atomically replace the index file"""
+        temp_file = self.index_file + ".tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(index.to_json(), f)
+        os.replace(temp_file, self.index_file)
+
+    def save_score(self, score, difficulty, time_played):
+        """Save a new score with timestamp (returns immediately, the disk write happens in the background)"""
         score_entry = {
             "score": score,
             "timestamp": time.time(),
             "difficulty": difficulty,
             "time_played": time_played
         }
-        
-        data["scores"].append(score_entry)
-        data["statistics"]["games_played"] += 1
-        data["statistics"]["total_time"] += time_played
+        self.index.add(score, score_entry["timestamp"], difficulty, time_played)
+        if self.leaderboard is not None:
+            self.leaderboard.add(score_entry)
+        # Lets high-score screens know their cached rendering is stale
+        self.revision += 1
+        self.writer.submit(score_entry)
+        if self.sync is not None:
+            self.sync.submit(score_entry)
 
-        with open(self.scores_file, 'w') as f:
-            json.dump(data, f)
+    def write_entries(self, entries):
+        """Append a batch of scores to the log, then update the index file (runs on the writer thread)"""
+        data = "".join(json.dumps(entry) + "\n" for entry in entries).encode()
+        with open(self.log_file, 'ab') as f:
+            f.write(data)
 
-    def get_best_scores(self):
-        """Get best scores for different time periods"""
-        try:
-            with open(self.scores_file, 'r') as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {
-                "today": 0,
-                "week": 0,
-                "month": 0,
-                "all_time": 0
-            }
+        for entry in entries:
+            self.persisted_index.add(entry["score"], entry["timestamp"], entry["difficulty"], entry["time_played"])
+        self.persisted_index.log_offset += len(data)
+        self.write_index(self.persisted_index)
 
-        now = datetime.now()
-        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_ago = today - timedelta(days=7)
-        month_ago = today - timedelta(days=30)
-
-        today_scores = []
-        week_scores = []
-        month_scores = []
-        all_scores = []
-
-        for score in data["scores"]:
-            score_time = datetime.fromtimestamp(score["timestamp"])
-            all_scores.append(score["score"])
-            
-            if score_time >= today:
-                today_scores.append(score["score"])
-            if score_time >= week_ago:
-                week_scores.append(score["score"])
-            if score_time >= month_ago:
-                month_scores.append(score["score"])
+    def flush(self):
+        """Wait until every saved score is on disk"""
+        self.writer.flush()
 
-        return {
-            "today": max(today_scores) if today_scores else 0,
-            "week": max(week_scores) if week_scores else 0,
-            "month": max(month_scores) if month_scores else 0,
-            "all_time": max(all_scores) if all_scores else 0
-        }
+    def close(self):
+        """Write pending scores and stop the writer thread"""
+        self.writer.close()
+
+    def get_best_scores(self, difficulty=None):
+        """Get best scores for different time periods (all difficulties unless one is given)"""
+        return self.index.best_scores(difficulty)
 
     def get_statistics(self):
         """Get gameplay statistics"""
+        return dict(self.index.statistics)
+
+    def load_entries(self):
+        """Every stored score, read from the log"""
+        entries = []
+        with open(self.log_file, 'r') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+        return entries
+
+    def get_leaderboard(self):
+        """Leaderboard structures, built from the stored scores on first use"""
+        if self.leaderboard is None:
+            # Pending scores must be on disk before reading the history back
+            self.flush()
+            self.leaderboard = Leaderboard(self.load_entries())
+        return self.leaderboard
+
+    def get_top_scores(self, n=10, difficulty=None, period="all_time"):
+        """Best n score entries for a difficulty (all unless given) and period ("today", "week", "month", "all_time")"""
+        return self.get_leaderboard().top_scores(n, difficulty, period)
+
+    def get_percentile_rank(self, score, difficulty=None):
+        """Percentage of stored scores (for a difficulty, all unless given) strictly below score"""
+        return self.get_leaderboard().percentile_rank(score, difficulty)
+
+
+class SQLiteScoreManager(ScoreManager):
+    """
+    Score storage in a SQLite database (WAL journal), same API as ScoreManager.
+
+    Scores are indexed on timestamp, difficulty and score. Each insert also
+    updates, in the same transaction, the statistics row and a per-day best
+    table, so loading the in-memory index reads at most a month of daily rows
+    instead of scanning the scores of the period. Inserts are batched by the
+    background writer. The scores of the log backend (or of a legacy
+    scores.json) are imported once.
+    """
+    def __init__(self, scores_dir=None):
+        self.scores_dir = scores_dir or default_scores_dir()
+        self.scores_file = os.path.join(self.scores_dir, "scores.json")
+        self.log_file = os.path.join(self.scores_dir, "scores.log")
+        self.db_file = os.path.join(self.scores_dir, "scores.db")
+        os.makedirs(self.scores_dir, exist_ok=True)
+        # Write connection: used here to build the index, then only by the writer thread until close()
+        self.connection = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.ensure_scores_file()
+        self.index = self.load_index()
+        # Game-thread reads (load_entries) get their own connection; WAL lets them run beside a write
+        self.read_connection = sqlite3.connect(self.db_file)
+        self.writer = WriteBehindWorker(self.write_entries, name="score-writer")
+        self.leaderboard = None
+        self.revision = 0
+        self.sync = None
+
+    def ensure_scores_file(self):
+        """Create the schema if needed and import existing scores on first use"""
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS scores (
+                id INTEGER PRIMARY KEY,
+                score INTEGER NOT NULL,
+                timestamp REAL NOT NULL,
+                difficulty TEXT NOT NULL,
+                time_played REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_scores_timestamp ON scores (timestamp);
+            CREATE INDEX IF NOT EXISTS idx_scores_difficulty ON scores (difficulty, score);
+            CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score);
+            CREATE TABLE IF NOT EXISTS best_by_day (
+                day INTEGER NOT NULL,
+                difficulty TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                PRIMARY KEY (day, difficulty)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS statistics (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                games_played INTEGER NOT NULL,
+                total_time REAL NOT NULL
+            );
+        """)
+        with self.connection:
+            created = self.connection.execute(
+                "INSERT OR IGNORE INTO statistics VALUES (1, 0, 0)").rowcount
+            if created:
+                self.insert_scores(self.load_existing_scores())
+
+    def load_existing_scores(self):
+        """Scores stored by the log backend, or else by a legacy scores.json"""
+        if os.path.exists(self.log_file):
+            return ScoreManager.load_entries(self)
         try:
             with open(self.scores_file, 'r') as f:
-                data = json.load(f)
-                return data["statistics"]
+                return json.load(f).get("scores", [])
         except (FileNotFoundError, json.JSONDecodeError):
-            return {"games_played": 0, "total_time": 0}
+            return []
+
+    def insert_scores(self, entries):
+        """Insert scores and update the aggregates (call inside a transaction)"""
+        rows = [(e["score"], e["timestamp"], e["difficulty"], e["time_played"]) for e in entries]
+        if not rows:
+            return
+        self.connection.executemany(
+            "INSERT INTO scores (score, timestamp, difficulty, time_played) VALUES (?, ?, ?, ?)", rows)
+
+        best_by_day = {}
+        for score, timestamp, difficulty, _ in rows:
+            key = (_day_number(timestamp), difficulty)
+            best_by_day[key] = max(best_by_day.get(key, score), score)
+        self.connection.executemany(
+            "INSERT INTO best_by_day (day, difficulty, score) VALUES (?, ?, ?) "
+            "ON CONFLICT (day, difficulty) DO UPDATE SET score = MAX(score, excluded.score)",
+            [(day, difficulty, score) for (day, difficulty), score in best_by_day.items()])
+        self.connection.execute(
+            "UPDATE statistics SET games_played = games_played + ?, total_time = total_time + ?",
+            (len(rows), sum(row[3] for row in rows)))
+
+    def load_index(self):
+        """Build the in-memory index from the statistics row, the per-difficulty maxima and the last month of daily bests"""
+        index = ScoreIndex()
+        games_played, total_time = self.connection.execute(
+            "SELECT games_played, total_time FROM statistics").fetchone()
+        index.statistics = {"games_played": games_played, "total_time": total_time}
+
+        difficulties = [row[0] for row in self.connection.execute("SELECT DISTINCT difficulty FROM best_by_day")]
+        for difficulty in [None] + difficulties:
+            where, params = ("", ()) if difficulty is None else (" WHERE difficulty = ?", (difficulty,))
+            all_time = self.connection.execute("SELECT MAX(score) FROM scores" + where, params).fetchone()[0]
+            if all_time is not None:
+                index.best[difficulty] = {"all_time": all_time, "daily": {}}
+
+        oldest_day = _day_number(time.time()) - PERIOD_DAYS["month"]
+        for day, difficulty, score in self.connection.execute(
+                "SELECT day, difficulty, score FROM best_by_day WHERE day >= ?", (oldest_day,)):
+            for key in (None, difficulty):
+                daily = index.best[key]["daily"]
+                daily[day] = max(daily.get(day, score), score)
+        return index
+
+    def load_entries(self):
+        """Every stored score, read from the database"""
+        rows = self.read_connection.execute("SELECT score, timestamp, difficulty, time_played FROM scores")
+        return [{"score": score, "timestamp": timestamp, "difficulty": difficulty, "time_played": time_played}
+                for score, timestamp, difficulty, time_played in rows]
+
+    def write_entries(self, entries):
+        """Insert a batch of scores in one transaction (runs on the writer thread)"""
+        with self.connection:
+            self.insert_scores(entries)
+
+    def close(self):
+        """Write pending scores, stop the writer thread and close the database"""
+        self.writer.close()
+        self.read_connection.close()
+        self.connection.close()
+
+
+def create_score_manager(scores_dir=None, backend=None):
+    """Score manager for the configured backend (settings.SCORE_BACKEND)"""
+    backend = backend or SCORE_BACKEND
+    if backend == "sqlite":
+        return SQLiteScoreManager(scores_dir)
+    return ScoreManager(scores_dir)
+
+
+_score_manager = None
+
+
+def get_score_manager():
+    """Shared score manager (a single writer per score directory)"""
+    global _score_manager
+    if _score_manager is None:
+        _score_manager = create_score_manager()
+        if LEADERBOARD_SYNC["enabled"]:
+            _score_manager.sync = LeaderboardSync(
+                LEADERBOARD_SYNC["url"], os.path.join(_score_manager.scores_dir, "sync_outbox.jsonl"),
+                batch_size=LEADERBOARD_SYNC["batch_size"], max_backoff=LEADERBOARD_SYNC["max_backoff"])
+    return _score_manager
@@ -1,6 +1,7 @@
 import pygame
 import os
 from parallax_background import ParallaxBackground
+from font_registry import get_font
 
 # Initialize parallax background
 parallax_background = None
@@ -37,8 +38,8 @@ BUTTON_TEXT_COLOR = (67, 154, 255)
 
 # Font settings
 pygame.font.init()
-font = pygame.font.Font(None, 36)
-large_font = pygame.font.Font(None, 72)
+font = get_font(None, 36)
+large_font = get_font(None, 72)
 
 # Game variables
 BLOCK_SIZE = 40
@@ -100,6 +101,25 @@ WEATHER = {
     "snow": {"visibility_reduction": 0.3, "texture": "snow_flakes.png"}
 }
 
+# Fog of war: field of view radius in tiles (reduced by weather visibility_reduction)
+FOV_RADIUS = 6
+
+# Moving hazards chasing the player (speed in cells per frame, penalty in seconds)
+HAZARDS = {"per_level": 1, "max": 8, "speed": 0.05, "spawn_distance": 5, "time_penalty": 3}
+
+# Destructible and shifting walls (break cost in points, shift interval in milliseconds)
+DESTRUCTIBLE_WALLS = {"break_cost": 100, "shift_interval": 6000}
+
+# Full-screen bloom (toggled with B): off by default, per-object glow is cheaper
+# below about 200 glowing objects (see benchmarks.py bloom)
+BLOOM_ENABLED = False
+
+# Score storage backend: "log" (append-only log + aggregate index) or "sqlite"
+SCORE_BACKEND = "log"
+
+# Optional online leaderboard sync (batch size in scores, backoff in seconds)
+LEADERBOARD_SYNC = {"enabled": False, "url": "http://127.0.0.1:8765/scores", "batch_size": 50, "max_backoff": 60}
+
 # Achievement system
 ACHIEVEMENTS = {
     "quick_finish": {"condition": "time_left > 10", "reward": 500},
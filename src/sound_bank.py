@@ -0,0 +1,96 @@
+"""
+Banque de sons : effets décodés une fois, joués sur des canaux réservés.
+
+Chaque effet appartient à une catégorie (déplacement, interface, objets,
+jingles) qui dispose d'un nombre fixe de voix, c'est-à-dire de canaux du
+mixer qui lui sont réservés. Quand toutes les voix d'une catégorie sont
+occupées, la plus ancienne est volée : un effet répété (pas, pièces) ne peut
+ni épuiser les canaux ni couper les sons des autres catégories, et jouer un
+effet ne touche jamais le disque.
+"""
+import itertools
+import pygame
+
+# Nombre de voix (canaux réservés) par catégorie d'effets
+VOICE_LIMITS = {"move": 2, "ui": 2, "pickup": 3, "jingle": 1}
+
+
+class SoundBank:
+    """
+    Effets sonores préchargés, par nom.
+
+    Les canaux `first_channel` à `first_channel + somme des voix - 1` sont
+    réservés à la banque (`pygame.mixer.set_reserved`) : les `Sound.play()`
+    du reste du jeu ne les prennent pas. Le mixer doit être initialisé.
+    """
+    def __init__(self, voice_limits=None, first_channel=0):
+        self.voice_limits = dict(VOICE_LIMITS if voice_limits is None else voice_limits)
+        self.sounds = {}
+        self.missing = []
+
+        total = first_channel + sum(self.voice_limits.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+
+        self.channels = {}
+        self.started = {}
+        first = first_channel
+        for category, limit in self.voice_limits.items():
+            self.channels[category] = [pygame.mixer.Channel(first + i) for i in range(limit)]
+            self.started[category] = [0] * limit
+            first += limit
+        self._clock = itertools.count(1)
+
+        # Compteurs pour le débogage
+        self.plays = 0
+        self.steals = 0
+
+    def load(self, name, path, category):
+        """Décoder un fichier une fois pour toutes ; un fichier absent ou illisible est ignoré seul."""
+        try:
+            self.add(name, pygame.mixer.Sound(path), category)
+            return True
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Erreur lors du chargement du son {path}: {e}")
+            self.missing.append(name)
+            return False
+
+    def add(self, name, sound, category):
+        """Ajouter un son déjà en mémoire."""
+        if category not in self.channels:
+            raise ValueError(f"Catégorie de son inconnue : {category}")
+        self.sounds[name] = (sound, category)
+        if name in self.missing:
+            self.missing.remove(name)
+
+    def has(self, name):
+        return name in self.sounds
+
+    def play(self, name, volume=1.0):
+        """Jouer un effet sur une voix libre de sa catégorie, ou voler la plus ancienne ; retourne le canal."""
+        entry = self.sounds.get(name)
+        if entry is None:
+            return None
+        sound, category = entry
+        voices = self.channels[category]
+        started = self.started[category]
+        for index, channel in enumerate(voices):
+            if not channel.get_busy():
+                break
+        else:
+            index = started.index(min(started))
+            self.steals += 1
+        channel = voices[index]
+        channel.set_volume(volume)
+        channel.play(sound)
+        started[index] = next(self._clock)
+        self.plays += 1
+        return channel
+
+    def stop(self, category=None):
+        """Couper les effets d'une catégorie (ou tous)."""
+        for name, voices in self.channels.items():
+            if category is None or name == category:
+                for channel in voices:
+                    channel.stop()
@@ -1,5 +1,25 @@
 import pygame
 import os
+from sound_bank import SoundBank
+from music_controller import MusicController, AudioTimer
+from sound_synth import add_fallback_effects
+
+# Sound effects preloaded into the sound bank: name -> (file in the sounds directory, category)
+SOUND_EFFECTS = {
+    "move": ("move.wav", "move"),
+    "button": ("button.wav", "ui"),
+    "menu": ("menu.wav", "ui"),
+    "pause": ("pause.wav", "ui"),
+    "unpause": ("unpause.wav", "ui"),
+    "powerup": ("powerup.wav", "pickup"),
+    "coin": ("coin.wav", "pickup"),
+}
+
+# Music themes, decoded in the background at startup: name -> file in the music directory
+MUSIC_THEMES = {
+    "menu": "menu_theme.mp3",
+    "game": "game_theme.mp3",
+}
 
 class SoundManager:
     def __init__(self):
@@ -11,45 +31,82 @@ class SoundManager:
             print("Avertissement: Impossible d'initialiser l'audio. Le jeu fonctionnera sans son.")
         
         self.music_dir = os.path.join("assets", "music")
+        self.sounds_dir = os.path.join("assets", "sounds")
         self.current_track = None
         self.volume = 0.5
+        # Time spent in audio calls on the game thread (shown in the debug overlay)
+        self.timer = AudioTimer()
         
         # Ensure music directory exists
         if not os.path.exists(self.music_dir):
             os.makedirs(self.music_dir, exist_ok=True)
+        
+        self.music = None
+        self.sound_bank = None
+        if self.audio_enabled:
+            # Music channels first: the sound bank reserves the channels after them
+            self.music = MusicController(first_channel=0, volume=self.volume)
+            for name, filename in MUSIC_THEMES.items():
+                path = os.path.join(self.music_dir, filename)
+                if os.path.exists(path):
+                    self.music.prefetch(name, path)
+            self.load_effects()
 
-    def play_menu_theme(self):
-        """Play menu background music"""
-        if not self.audio_enabled:
+    def load_effects(self):
+        """Decode every sound effect once (missing files are replaced by synthesized ones)"""
+        self.sound_bank = SoundBank(first_channel=2)
+        victory_sound = os.path.join(self.music_dir, "victory.mp3")
+        if os.path.exists(victory_sound):
+            self.sound_bank.load("victory", victory_sound, "jingle")
+        else:
+            self.sound_bank.missing.append("victory")
+        for name, (filename, category) in SOUND_EFFECTS.items():
+            path = os.path.join(self.sounds_dir, filename)
+            if os.path.exists(path):
+                self.sound_bank.load(name, path, category)
+            else:
+                self.sound_bank.missing.append(name)
+
+        categories = {name: category for name, (_, category) in SOUND_EFFECTS.items()}
+        categories["victory"] = "jingle"
+        add_fallback_effects(self.sound_bank, categories)
+
+    def play_effect(self, name, volume=1.0):
+        """Play a preloaded sound effect (no-op if it is not available)"""
+        if self.sound_bank is not None:
+            with self.timer.measure():
+                self.sound_bank.play(name, volume)
+
+    def play_theme(self, name):
+        """Crossfade to a music theme (starts as soon as it is decoded if it is still loading)"""
+        if not self.audio_enabled or self.current_track == name:
             return
             
-        menu_theme = os.path.join(self.music_dir, "menu_theme.mp3")
-        if os.path.exists(menu_theme) and self.current_track != "menu":
-            pygame.mixer.music.load(menu_theme)
-            pygame.mixer.music.play(-1)  # Loop indefinitely
-            self.current_track = "menu"
+        with self.timer.measure():
+            self.music.play(name, os.path.join(self.music_dir, MUSIC_THEMES[name]))
+            self.current_track = name
+
+    def play_menu_theme(self):
+        """Play menu background music"""
+        self.play_theme("menu")
 
     def play_game_theme(self):
         """Play game background music"""
+        self.play_theme("game")
+
+    def play_victory(self):
+        """Play victory sound"""
         if not self.audio_enabled:
             return
             
-        game_theme = os.path.join(self.music_dir, "game_theme.mp3")
-        if os.path.exists(game_theme) and self.current_track != "game":
-            pygame.mixer.music.load(game_theme)
-            pygame.mixer.music.play(-1)  # Loop indefinitely
-            self.current_track = "game"
+        self.play_effect("victory")
 
-    def play_victory(self):
-        """Play victory sound"""
+    def play_powerup(self):
+        """Play power-up pickup sound (victory jingle if there is no dedicated effect)"""
         if not self.audio_enabled:
             return
             
-        victory_sound = os.path.join(self.music_dir, "victory.mp3")
-        if os.path.exists(victory_sound):
-            victory_channel = pygame.mixer.Channel(1)  # Use separate channel for sound effects
-            victory_sound = pygame.mixer.Sound(victory_sound)
-            victory_channel.play(victory_sound)
+        self.play_effect("powerup" if self.sound_bank.has("powerup") else "victory")
 
     def set_volume(self, volume):
         """Set music volume (0.0 to 1.0)"""
@@ -57,14 +114,16 @@ class SoundManager:
             return
             
         self.volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.volume)
+        with self.timer.measure():
+            self.music.set_volume(self.volume)
 
     def stop_music(self):
-        """Stop current music"""
+        """Stop current music (fades out)"""
         if not self.audio_enabled:
             return
             
-        pygame.mixer.music.stop()
+        with self.timer.measure():
+            self.music.stop()
         self.current_track = None
 
     def pause_music(self):
@@ -72,11 +131,13 @@ class SoundManager:
         if not self.audio_enabled:
             return
             
-        pygame.mixer.music.pause()
+        with self.timer.measure():
+            self.music.pause()
 
     def unpause_music(self):
         """Unpause current music"""
         if not self.audio_enabled:
             return
             
-        pygame.mixer.music.unpause()
+        with self.timer.measure():
+            self.music.unpause()
@@ -0,0 +1,147 @@
+"""
+Effets sonores de secours synthétisés avec NumPy.
+
+Quand un fichier d'effet manque, la banque de sons reçoit à sa place un son
+généré (bips, carillons, glissandos) converti au format du mixer par
+`pygame.sndarray`. Chaque effet généré est aussi écrit en WAV dans un dossier
+de cache : les lancements suivants le relisent au lieu de le recalculer. Le
+nom du fichier porte la fréquence d'échantillonnage et la version des
+recettes, si bien qu'un changement de l'une ou de l'autre régénère le cache.
+"""
+import os
+import wave
+import numpy
+import pygame
+
+SYNTH_VERSION = 1
+# À côté du module, quel que soit le dossier de lancement du jeu
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "sounds", "generated")
+
+# Notes utilisées par les carillons (Hz)
+C5, E5, G5, B5, C6, E6 = 523.25, 659.25, 783.99, 987.77, 1046.50, 1318.51
+
+
+def _envelope(count, rate, attack=0.005, decay=None):
+    """Attaque linéaire puis extinction exponentielle (ou fin linéaire si `decay` est None)."""
+    t = numpy.arange(count) / rate
+    envelope = numpy.minimum(1.0, t / attack) if attack > 0 else numpy.ones(count)
+    if decay is None:
+        envelope *= numpy.linspace(1.0, 0.0, count)
+    else:
+        envelope *= numpy.exp(-t / decay)
+    return envelope
+
+
+def _oscillator(frequency, rate, shape="sine"):
+    """Onde de fréquence constante ou variable (tableau de fréquences par échantillon)."""
+    phase = 2 * numpy.pi * numpy.cumsum(frequency) / rate
+    if shape == "square":
+        return numpy.sign(numpy.sin(phase))
+    if shape == "triangle":
+        return 2 / numpy.pi * numpy.arcsin(numpy.sin(phase))
+    return numpy.sin(phase)
+
+
+def blip(rate, frequency, duration, shape="square", volume=0.3):
+    count = int(rate * duration)
+    return volume * _oscillator(numpy.full(count, frequency), rate, shape) * _envelope(count, rate, 0.002, duration / 4)
+
+
+def sweep(rate, start, end, duration, shape="triangle", volume=0.35, vibrato=0.0):
+    count = int(rate * duration)
+    frequency = numpy.geomspace(start, end, count)
+    if vibrato:
+        frequency *= 1 + vibrato * numpy.sin(2 * numpy.pi * 30 * numpy.arange(count) / rate)
+    return volume * _oscillator(frequency, rate, shape) * _envelope(count, rate, 0.005)
+
+
+def chime(rate, notes, note_length, ring=0.4, volume=0.3):
+    """Notes successives avec harmoniques, qui résonnent en se chevauchant."""
+    step = int(rate * note_length)
+    count = step * (len(notes) - 1) + int(rate * ring * 3)
+    samples = numpy.zeros(count)
+    for i, note in enumerate(notes):
+        length = count - i * step
+        tone = sum(_oscillator(numpy.full(length, note * harmonic), rate) / harmonic for harmonic in (1, 2, 3))
+        samples[i * step:] += tone * _envelope(length, rate, 0.003, ring)
+    return volume * samples / numpy.abs(samples).max()
+
+
+# Recettes des effets, par nom : fonction de la fréquence d'échantillonnage
+RECIPES = {
+    "move": lambda rate: blip(rate, 660, 0.04, volume=0.2),
+    "button": lambda rate: blip(rate, 880, 0.03, shape="sine"),
+    "menu": lambda rate: numpy.concatenate((blip(rate, 520, 0.03), blip(rate, 780, 0.04))),
+    "pause": lambda rate: sweep(rate, 600, 300, 0.15),
+    "unpause": lambda rate: sweep(rate, 300, 600, 0.15),
+    "powerup": lambda rate: sweep(rate, 400, 1200, 0.25, shape="square", volume=0.2, vibrato=0.03),
+    "coin": lambda rate: chime(rate, (B5, E6), 0.08, ring=0.15),
+    "victory": lambda rate: chime(rate, (C5, E5, G5, C6), 0.12),
+}
+RECIPES["win"] = RECIPES["victory"]
+
+
+def synthesize(name, rate):
+    """Échantillons mono flottants (-1 à 1) de l'effet `name`."""
+    return numpy.clip(RECIPES[name](rate), -1.0, 1.0).astype(numpy.float32)
+
+
+def to_sound(samples):
+    """Convertir des échantillons mono flottants au format du mixer (pygame.sndarray)."""
+    _, size, channels = pygame.mixer.get_init()
+    if abs(size) == 32:
+        data = samples  # Flottants 32 bits
+    else:
+        bits = abs(size)
+        peak = 2 ** (bits - 1) - 1
+        data = numpy.round(samples * peak)
+        if size > 0:
+            data = (data + peak + 1).astype(f"uint{bits}")  # Format non signé
+        else:
+            data = data.astype(f"int{bits}")
+    if channels > 1:
+        data = numpy.repeat(data[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(numpy.ascontiguousarray(data))
+
+
+def _write_wav(path, samples, rate):
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(numpy.round(samples * 32767).astype("<i2").tobytes())
+
+
+def load_effect(name, cache_dir=CACHE_DIR):
+    """Effet `name` : relu depuis le cache WAV, ou synthétisé (et mis en cache) au premier lancement."""
+    rate = pygame.mixer.get_init()[0]
+    path = os.path.join(cache_dir, f"{name}_{rate}_v{SYNTH_VERSION}.wav")
+    if os.path.exists(path):
+        try:
+            return pygame.mixer.Sound(path)
+        except pygame.error:
+            pass  # Fichier de cache abîmé : le régénérer
+    samples = synthesize(name, rate)
+    # Fichier temporaire puis renommage : un arrêt en pleine écriture ne laisse pas de WAV tronqué
+    temp_file = path + ".tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_wav(temp_file, samples, rate)
+        os.replace(temp_file, path)
+    except OSError as e:
+        print(f"Impossible de mettre en cache le son {name}: {e}")
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+    return to_sound(samples)
+
+
+def add_fallback_effects(bank, categories, cache_dir=CACHE_DIR):
+    """Compléter la banque : chaque effet manquant qui a une recette reçoit un son généré ; retourne leurs noms."""
+    added = []
+    for name in list(bank.missing):
+        if name in RECIPES and name in categories:
+            bank.add(name, load_effect(name, cache_dir), categories[name])
+            added.append(name)
+    return added
@@ -0,0 +1,179 @@
+"""
+Caches de surfaces bornés en mémoire (LRU par taille en octets).
+
+Chaque cache compte la mémoire de ses surfaces (largeur x hauteur x octets par
+pixel) et évince les entrées les moins récemment utilisées quand sa limite est
+dépassée. Tous les caches sont enregistrés auprès d'un gestionnaire commun qui
+applique en plus une limite mémoire globale et expose les statistiques
+(hits / misses / évictions) pour l'affichage de debug.
+"""
+import weakref
+from collections import OrderedDict
+
+# Limite mémoire globale de tous les caches de surfaces réunis
+DEFAULT_MAX_TOTAL_BYTES = 96 * 1024 * 1024
+
+
+def surface_bytes(surface):
+    """Mémoire occupée par les pixels d'une surface, en octets."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class SurfaceCache:
+    """
+    Cache LRU de surfaces borné par sa taille en octets.
+
+    S'utilise comme un dictionnaire (`in`, `[]`, `len`) ; `get` et `put`
+    sont les accès normaux et mettent à jour les compteurs.
+    """
+    def __init__(self, name, max_bytes, manager=None):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.manager = manager
+        # clé -> [surface, taille en octets, tick du dernier accès]
+        self.entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Obtenir une surface du cache (la marque comme la plus récemment utilisée)."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.entries.move_to_end(key)
+        if self.manager is not None:
+            entry[2] = self.manager.next_tick()
+        return entry[0]
+
+    def put(self, key, surface):
+        """Ajouter une surface au cache, puis évincer si une limite est dépassée."""
+        if key in self.entries:
+            self._remove(key)
+
+        size = surface_bytes(surface)
+        if size > self.max_bytes:
+            # Trop grande pour ce cache : ne pas vider tout le reste pour elle
+            return surface
+
+        tick = self.manager.next_tick() if self.manager is not None else 0
+        self.entries[key] = [surface, size, tick]
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes:
+            self.evict_oldest()
+        if self.manager is not None:
+            self.manager.enforce_limit()
+        return surface
+
+    def evict_oldest(self):
+        """Évincer l'entrée la moins récemment utilisée."""
+        key = next(iter(self.entries))
+        self._remove(key)
+        self.evictions += 1
+
+    def oldest_tick(self):
+        """Tick du dernier accès à l'entrée la plus ancienne (None si vide)."""
+        if not self.entries:
+            return None
+        return next(iter(self.entries.values()))[2]
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self.current_bytes -= entry[1]
+
+    def clear(self):
+        self.entries.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'name': self.name,
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    # Interface dictionnaire pour le code existant
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __getitem__(self, key):
+        surface = self.get(key)
+        if surface is None:
+            raise KeyError(key)
+        return surface
+
+    def __setitem__(self, key, surface):
+        self.put(key, surface)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SurfaceCacheManager:
+    """Registre des caches de surfaces avec une limite mémoire globale."""
+    def __init__(self, max_total_bytes=DEFAULT_MAX_TOTAL_BYTES):
+        self.max_total_bytes = max_total_bytes
+        self.caches = weakref.WeakSet()
+        self.tick = 0
+
+    def next_tick(self):
+        self.tick += 1
+        return self.tick
+
+    def create_cache(self, name, max_bytes):
+        cache = SurfaceCache(name, max_bytes, self)
+        self.caches.add(cache)
+        return cache
+
+    def total_bytes(self):
+        return sum(cache.current_bytes for cache in self.caches)
+
+    def enforce_limit(self):
+        """Évincer l'entrée globalement la plus ancienne tant que la limite globale est dépassée."""
+        total = self.total_bytes()
+        while total > self.max_total_bytes:
+            candidates = [cache for cache in self.caches if cache.entries]
+            if not candidates:
+                break
+            oldest = min(candidates, key=lambda cache: cache.oldest_tick())
+            before = oldest.current_bytes
+            oldest.evict_oldest()
+            total -= before - oldest.current_bytes
+
+    def stats(self):
+        """Statistiques de chaque cache, triées par mémoire occupée."""
+        return sorted((cache.stats() for cache in self.caches), key=lambda s: s['bytes'], reverse=True)
+
+    def summary(self):
+        """Résumé d'une ligne pour l'affichage de debug."""
+        caches = list(self.caches)
+        hits = sum(cache.hits for cache in caches)
+        lookups = hits + sum(cache.misses for cache in caches)
+        hit_rate = hits / lookups * 100 if lookups else 0.0
+        return f"Cache: {self.total_bytes() / (1024 * 1024):.1f} MB, {hit_rate:.0f}% hits"
+
+
+# Gestionnaire partagé par tous les caches de l'interface
+_shared_manager = None
+
+def get_cache_manager():
+    """Obtenir le gestionnaire de caches partagé (créé à la première utilisation)."""
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = SurfaceCacheManager()
+    return _shared_manager
+
+
+def create_surface_cache(name, max_bytes):
+    """Créer un cache de surfaces enregistré auprès du gestionnaire partagé."""
+    return get_cache_manager().create_cache(name, max_bytes)
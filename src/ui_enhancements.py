@@ -1,6 +1,8 @@
 import pygame
 import math
 import random
+import procedural_textures
+from surface_cache import create_surface_cache
 
 class UIEffects:
     """
@@ -29,8 +31,13 @@ class UIEffects:
             'light_gray': (200, 200, 200),
         }
         
-        # Cache pour les surfaces
-        self.surface_cache = {}
+        # Cache pour les surfaces (LRU borné en mémoire)
+        self.surface_cache = create_surface_cache("ui_enhancements.ui_effects", 16 * 1024 * 1024)
+        
+        # Mini-carte cuite pour la grille du niveau en cours
+        self.minimap_base = None
+        self.minimap_grid = None
+        self.minimap_key = None
         
     def update(self):
         """Mettre à jour les animations"""
@@ -38,27 +45,10 @@ class UIEffects:
         
     def create_gradient_button(self, width, height, color1, color2, border_radius=15, vertical=True):
         """Créer un bouton avec un dégradé de couleur"""
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        
-        if vertical:
-            for y in range(height):
-                ratio = y / height
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
-        else:
-            for x in range(width):
-                ratio = x / width
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                pygame.draw.line(surface, (r, g, b), (x, 0), (x, height))
+        surface = procedural_textures.linear_gradient(width, height, color1, color2, vertical=vertical)
                 
         # Appliquer le rayon de bordure
-        mask = pygame.Surface((width, height), pygame.SRCALPHA)
-        pygame.draw.rect(mask, (255, 255, 255), (0, 0, width, height), border_radius=border_radius)
-        surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        procedural_textures.apply_rounded_mask(surface, border_radius)
         
         return surface
     
@@ -66,8 +56,9 @@ class UIEffects:
         """Créer un panneau avec effet de verre"""
         # Vérifier si cette surface est dans le cache
         cache_key = (width, height, color, border_color, border_width, border_radius)
-        if cache_key in self.surface_cache:
-            return self.surface_cache[cache_key]
+        cached = self.surface_cache.get(cache_key)
+        if cached is not None:
+            return cached
             
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
@@ -244,12 +235,8 @@ class UIEffects:
             pygame.draw.rect(surface, fill_color, (0, fill_y, fill_width, fill_height), border_radius=height//2)
             
             # Effet de brillance
-            highlight_height = fill_height // 3
-            highlight = pygame.Surface((fill_width, highlight_height), pygame.SRCALPHA)
-            for y in range(highlight_height):
-                alpha = 100 - int(y * 100 / highlight_height)
-                if alpha > 0:
-                    pygame.draw.line(highlight, (*highlight_color[:3], alpha), (0, y), (fill_width, y))
+            highlight_height = int(fill_height // 3)
+            highlight = procedural_textures.alpha_ramp(fill_width, highlight_height, highlight_color, 100)
             
             # Appliquer le rayon de bordure à la surbrillance
             if fill_width > height//2:
@@ -313,21 +300,70 @@ class UIEffects:
         
         return surface
     
-    def create_minimap(self, width, height, player_pos, grid, start_pos, end_pos, color_scheme="blue"):
-        """Créer une mini-carte stylisée"""
+    def draw_minimap(self, target, position, width, height, player_pos, grid, start_pos, end_pos, color_scheme="blue"):
+        """Dessiner une mini-carte stylisée sur `target` en `position`"""
+        # Le fond et la grille sont cuits une fois par niveau et blittés tels quels ;
+        # le joueur est dessiné directement sur la cible, sans copie de la mini-carte
+        left, top = position
+        target.blit(self.get_minimap_base(width, height, grid, start_pos, end_pos, color_scheme), position)
+        
+        rows = len(grid)
+        cols = len(grid[0]) if rows > 0 else 0
+        
+        if rows > 0 and cols > 0:
+            cell_width = (width - 10) / cols
+            cell_height = (height - 10) / rows
+            player_color = (255, 255, 255)
+            
+            # Dessiner la position du joueur avec animation de pulsation
+            player_x = int(left + 5 + player_pos[0] * cell_width + cell_width / 2)
+            player_y = int(top + 5 + player_pos[1] * cell_height + cell_height / 2)
+            
+            # Animation de pulsation
+            pulse = 0.2 * math.sin(math.radians(self.time * 10)) + 1.0
+            player_size = int(min(cell_width, cell_height) / 2 * pulse)
+            
+            previous_clip = target.get_clip()
+            target.set_clip(pygame.Rect(left, top, width, height).clip(previous_clip))
+            pygame.draw.circle(target, player_color, (player_x, player_y), player_size)
+            
+            # Ajouter un halo autour du joueur (anneau semi-transparent pré-rendu)
+            halo_size = player_size + 2
+            target.blit(self.get_minimap_halo(halo_size), (player_x - halo_size - 1, player_y - halo_size - 1))
+            target.set_clip(previous_clip)
+    
+    def get_minimap_halo(self, radius):
+        """Anneau semi-transparent autour du joueur, rendu une fois par rayon"""
+        cache_key = ("minimap_halo", radius)
+        halo = self.surface_cache.get(cache_key)
+        if halo is None:
+            size = radius * 2 + 2
+            halo = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(halo, (255, 255, 255, 50), (radius + 1, radius + 1), radius, 1)
+            self.surface_cache.put(cache_key, halo)
+        return halo
+    
+    def invalidate_minimap(self):
+        """La grille a changé sur place (mur détruit ou déplacé) : recuire la mini-carte"""
+        self.minimap_grid = None
+    
+    def get_minimap_base(self, width, height, grid, start_pos, end_pos, color_scheme="blue"):
+        """Partie statique de la mini-carte, recalculée seulement quand la grille ou le style change"""
+        key = (width, height, tuple(start_pos), tuple(end_pos), color_scheme)
+        if grid is self.minimap_grid and key == self.minimap_key:
+            return self.minimap_base
+        
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
         # Couleurs selon le schéma
         if color_scheme == "blue":
             bg_color = (41, 128, 185, 100)
             wall_color = (52, 152, 219)
-            player_color = (255, 255, 255)
             start_color = (46, 204, 113)
             end_color = (231, 76, 60)
         else:
             bg_color = (100, 100, 100, 100)
             wall_color = (150, 150, 150)
-            player_color = (255, 255, 255)
             start_color = (0, 255, 0)
             end_color = (255, 0, 0)
         
@@ -335,23 +371,13 @@ class UIEffects:
         pygame.draw.rect(surface, bg_color, (0, 0, width, height), border_radius=8)
         
         # Effet de brillance en haut
-        highlight = pygame.Surface((width, height // 4), pygame.SRCALPHA)
-        for y in range(height // 4):
-            alpha = 30 - int(y * 30 / (height // 4))
-            if alpha > 0:
-                pygame.draw.line(highlight, (255, 255, 255, alpha), (0, y), (width, y))
-        
-        # Appliquer le rayon de bordure à la surbrillance
-        mask = pygame.Surface((width, height // 4), pygame.SRCALPHA)
-        pygame.draw.rect(mask, (255, 255, 255), (0, 0, width, height // 4), border_radius=8)
-        highlight.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        
+        highlight = procedural_textures.alpha_ramp(width, height // 4, (255, 255, 255), 30)
+        procedural_textures.apply_rounded_mask(highlight, 8)
         surface.blit(highlight, (0, 0))
         
         # Bordure
         pygame.draw.rect(surface, (255, 255, 255, 100), (0, 0, width, height), width=1, border_radius=8)
         
-        # Dessiner la grille
         rows = len(grid)
         cols = len(grid[0]) if rows > 0 else 0
         
@@ -359,13 +385,10 @@ class UIEffects:
             cell_width = (width - 10) / cols
             cell_height = (height - 10) / rows
             
-            for y in range(rows):
-                for x in range(cols):
-                    cell_x = 5 + x * cell_width
-                    cell_y = 5 + y * cell_height
-                    
-                    if grid[y][x] == 1:  # Mur
-                        pygame.draw.rect(surface, wall_color, (cell_x, cell_y, cell_width, cell_height))
+            # Murs à 1 pixel par case, mis à l'échelle ; dans la grille de game_logic,
+            # les murs sont des tuiles (Surface) ou la valeur 1
+            walls = [[1 if isinstance(cell, pygame.Surface) or cell == 1 else 0 for cell in row] for row in grid]
+            surface.blit(procedural_textures.grid_texture(walls, {1: wall_color}, width - 10, height - 10), (5, 5))
             
             # Dessiner la position de départ
             start_x = 5 + start_pos[0] * cell_width + cell_width / 2
@@ -376,21 +399,10 @@ class UIEffects:
             end_x = 5 + end_pos[0] * cell_width + cell_width / 2
             end_y = 5 + end_pos[1] * cell_height + cell_height / 2
             pygame.draw.circle(surface, end_color, (int(end_x), int(end_y)), int(min(cell_width, cell_height) / 2))
-            
-            # Dessiner la position du joueur avec animation de pulsation
-            player_x = 5 + player_pos[0] * cell_width + cell_width / 2
-            player_y = 5 + player_pos[1] * cell_height + cell_height / 2
-            
-            # Animation de pulsation
-            pulse = 0.2 * math.sin(math.radians(self.time * 10)) + 1.0
-            player_size = int(min(cell_width, cell_height) / 2 * pulse)
-            
-            pygame.draw.circle(surface, player_color, (int(player_x), int(player_y)), player_size)
-            
-            # Ajouter un halo autour du joueur
-            halo_size = player_size + 2
-            pygame.draw.circle(surface, (255, 255, 255, 50), (int(player_x), int(player_y)), halo_size, 1)
         
+        self.minimap_base = surface
+        self.minimap_grid = grid
+        self.minimap_key = key
         return surface
     
     def create_notification(self, text, font, color_scheme="blue", width=300):
@@ -489,8 +501,6 @@ class UIEffects:
     
     def create_animated_background(self, width, height, color_scheme="blue"):
         """Créer un arrière-plan animé pour les menus"""
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        
         # Couleurs selon le schéma
         if color_scheme == "blue":
             bg_color1 = (41, 128, 185)
@@ -505,13 +515,12 @@ class UIEffects:
             bg_color1 = (50, 50, 50)
             bg_color2 = (80, 80, 80)
         
-        # Dégradé de fond
-        for y in range(height):
-            ratio = y / height
-            r = int(bg_color1[0] * (1 - ratio) + bg_color2[0] * ratio)
-            g = int(bg_color1[1] * (1 - ratio) + bg_color2[1] * ratio)
-            b = int(bg_color1[2] * (1 - ratio) + bg_color2[2] * ratio)
-            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+        # Dégradé de fond (statique, généré une seule fois)
+        cache_key = ("animated_background", width, height, color_scheme)
+        background = self.surface_cache.get(cache_key)
+        if background is None:
+            background = self.surface_cache.put(cache_key, procedural_textures.linear_gradient(width, height, bg_color1, bg_color2))
+        surface = background.copy()
         
         # Ajouter des particules animées
         for i in range(50):
@@ -0,0 +1,74 @@
+"""
+Écriture différée : les accès disque quittent le thread de rendu.
+
+Le jeu dépose ses écritures dans une file bornée et reprend aussitôt ; un
+thread dédié les regroupe par lots et les confie à la fonction d'écriture
+(une seule ouverture de fichier par lot). Les écritures en attente sont
+vidées à la fermeture du programme.
+"""
+import atexit
+import queue
+import threading
+
+_STOP = object()
+
+
+class WriteBehindWorker:
+    """
+    Thread d'écriture alimenté par une file bornée.
+
+    `write_batch(items)` est appelée depuis le thread avec jusqu'à `max_batch`
+    éléments ; si la file est pleine (disque saturé), `submit` attend qu'une
+    place se libère plutôt que de perdre l'écriture.
+    """
+    def __init__(self, write_batch, max_pending=256, max_batch=64, name="write-behind"):
+        self.write_batch = write_batch
+        self.max_batch = max_batch
+        self.queue = queue.Queue(max_pending)
+        self.batches = 0
+        self.errors = 0
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def submit(self, item):
+        """Ajouter une écriture et rendre la main immédiatement."""
+        if self.closed:
+            raise RuntimeError("écriture soumise après la fermeture")
+        self.queue.put(item)
+
+    def flush(self):
+        """Attendre que toutes les écritures soumises soient sur disque."""
+        self.queue.join()
+
+    def close(self):
+        """Vider la file puis arrêter le thread (appelée aussi à la sortie du programme)."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(_STOP)
+        self.thread.join()
+        atexit.unregister(self.close)
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            items = [item for item in batch if item is not _STOP]
+            try:
+                if items:
+                    self.write_batch(items)
+                    self.batches += 1
+            except Exception as e:
+                self.errors += 1
+                print(f"Erreur d'écriture différée : {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+            if len(items) < len(batch):
+                return
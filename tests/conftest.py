@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Les modules du jeu sont à plat dans src/ et s'importent par leur nom
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Pas de fenêtre ni de carte son pendant les tests
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
@@ -0,0 +1,82 @@
+import random
+
+import pygame
+
+from dynamic_maze import DynamicMaze, ROAD, WALL
+
+
+def tile():
+    return pygame.Surface((4, 4))
+
+
+def test_moved_wall_keeps_its_tile():
+    wall = tile()
+    grid = [
+        [0, 0, 0],
+        [0, wall, 0],
+        [0, 0, 0],
+    ]
+    maze = DynamicMaze()
+    maze.track(grid, (2, 2))
+    assert maze.move_wall((1, 1), (0, 2), (0, 0))
+    assert grid[1][1] == ROAD
+    assert grid[2][0] is wall
+    assert maze.is_wall((0, 2))
+    assert maze.exit_distance((0, 0)) == 4
+
+
+def corridor():
+    # Un seul passage entre le joueur (0, 0) et la sortie (4, 0)
+    return [
+        [0, 0, 0, 0, 0],
+        [WALL, WALL, WALL, WALL, 0],
+        [0, 0, 0, 0, 0],
+    ]
+
+
+def test_rejected_shift_leaves_the_grid_unchanged():
+    wall = tile()
+    grid = [
+        [0, 0, 0, 0, 0],
+        [WALL, WALL, WALL, WALL, 0],
+        [wall, WALL, WALL, WALL, WALL],
+    ]
+    before = [row[:] for row in grid]
+    maze = DynamicMaze()
+    maze.track(grid, (4, 0))
+    distances = maze.exit_field.distance.copy()
+    # Le mur du coin ne mène nulle part ; posé dans le couloir, il couperait le joueur de la sortie
+    assert not maze.move_wall((0, 2), (2, 0), (0, 0))
+    assert grid[2][0] is wall
+    assert grid == before
+    assert maze.exit_field.distance.tolist() == distances.tolist()
+    assert maze.can_reach_exit((0, 0))
+
+
+def test_random_wall_and_road():
+    grid = corridor()
+    maze = DynamicMaze()
+    maze.track(grid, (4, 0))
+    rng = random.Random(3)
+    walls = {maze.random_wall(rng) for _ in range(50)}
+    assert walls == {(0, 1), (1, 1), (2, 1), (3, 1)}
+    excluded = {(x, y) for y in range(3) for x in range(5) if (x, y) != (2, 2)}
+    assert maze.random_road(excluded, rng) == (2, 2)
+    excluded.add((2, 2))
+    assert maze.random_road(excluded, rng) is None
+
+
+def test_can_reach_exit_follows_set_cell():
+    grid = corridor()
+    maze = DynamicMaze()
+    maze.track(grid, (4, 0))
+    assert maze.exit_distance((0, 2)) == 6
+    maze.set_cell((4, 1), WALL)
+    assert not maze.can_reach_exit((0, 2))
+    assert maze.can_reach_exit((0, 0))
+    # Nouveau passage par la gauche
+    maze.set_cell((0, 1), ROAD)
+    assert maze.exit_distance((0, 2)) == 6
+    assert maze.exit_distance((1, 2)) == 7
+    # Même grille : le champ n'est pas recréé
+    assert not maze.track(grid, (4, 0))
@@ -0,0 +1,104 @@
+import random
+from collections import deque
+
+from flow_field import FlowField, UNREACHABLE
+
+
+def reference_distances(grid, target):
+    """BFS de référence, case par case, sur la grille en listes."""
+    rows, cols = len(grid), len(grid[0])
+    distance = {target: 0}
+    queue = deque([target])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if 0 <= nx < cols and 0 <= ny < rows and grid[ny][nx] == 0 and (nx, ny) not in distance:
+                distance[(nx, ny)] = distance[(x, y)] + 1
+                queue.append((nx, ny))
+    return [distance.get((x, y), UNREACHABLE) for y in range(rows) for x in range(cols)]
+
+
+def random_grid(rng, rows, cols, density=0.3):
+    return [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+
+
+def test_incremental_repair_matches_a_full_bfs():
+    rng = random.Random(7)
+    for _ in range(5):
+        grid = random_grid(rng, 12, 15)
+        target = (0, 0)
+        grid[0][0] = 0
+        field = FlowField(grid)
+        field.set_target(target)
+        for _ in range(200):
+            x, y = rng.randrange(15), rng.randrange(12)
+            if (x, y) == target:
+                continue
+            grid[y][x] = 1 - grid[y][x]
+            field.set_passable((x, y), grid[y][x] == 0)
+            assert field.distance.tolist() == reference_distances(grid, target)
+
+
+def test_repair_only_touches_changed_cells():
+    grid = [[0] * 10 for _ in range(10)]
+    field = FlowField(grid)
+    field.set_target((0, 0))
+    # Mur posé dans un coin éloigné : une seule case change
+    grid[9][9] = 1
+    assert field.set_passable((9, 9), False) == 1
+    assert field.set_passable((9, 9), False) == 0
+    assert field.recomputes == 1
+
+
+def test_distances_match_a_reference_bfs():
+    rng = random.Random(3)
+    for _ in range(10):
+        grid = random_grid(rng, rng.randrange(2, 20), rng.randrange(2, 20), density=0.35)
+        target = (rng.randrange(len(grid[0])), rng.randrange(len(grid)))
+        grid[target[1]][target[0]] = 0
+        field = FlowField(grid)
+        field.set_target(target)
+        assert field.distance.tolist() == reference_distances(grid, target)
+
+
+def test_next_cell_steps_downhill():
+    rng = random.Random(5)
+    grid = random_grid(rng, 15, 15)
+    grid[7][7] = 0
+    field = FlowField(grid)
+    field.set_target((7, 7))
+    distance, next_cell = field.distance.tolist(), field.next_cell.tolist()
+    for cell, cell_distance in enumerate(distance):
+        if cell_distance > 0:
+            step = next_cell[cell]
+            assert step in field.neighbors[cell].tolist()
+            assert distance[step] == cell_distance - 1
+        elif cell_distance == 0:
+            assert next_cell[cell] == cell
+        else:
+            # Case inatteignable (mur) : rejoint le champ par une voisine atteignable, sinon ne bouge pas
+            step = next_cell[cell]
+            reachable = [n for n in field.neighbors[cell].tolist() if n >= 0 and distance[n] != UNREACHABLE]
+            if reachable:
+                assert distance[step] == min(distance[n] for n in reachable)
+            else:
+                assert step == cell
+
+
+def test_unreachable_cells_and_walls():
+    wall = object()  # Les murs du jeu sont des tuiles : toute valeur autre que 0
+    grid = [
+        [0, 0, wall, 0],
+        [0, 0, wall, 0],
+        [wall, wall, wall, 0],
+    ]
+    field = FlowField(grid)
+    field.set_target((0, 0))
+    assert field.distance.tolist() == [0, 1, UNREACHABLE, UNREACHABLE,
+                                       1, 2, UNREACHABLE, UNREACHABLE,
+                                       UNREACHABLE, UNREACHABLE, UNREACHABLE, UNREACHABLE]
+    # Même case cible : pas de nouveau parcours
+    assert not field.set_target((0, 0))
+    assert field.set_target((3, 0))
+    assert field.distance[field.cell_index((3, 2))] == 2
+    assert field.distance[field.cell_index((0, 0))] == UNREACHABLE
@@ -0,0 +1,90 @@
+import pygame
+
+from fog_of_war import FogOfWar, compute_fov, opaque_cells
+
+
+def open_room(rows, cols):
+    return [[False] * cols for _ in range(rows)]
+
+
+def within(a, b, radius):
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 <= radius * radius
+
+
+def test_open_room_sees_exactly_the_radius_disc():
+    room = open_room(15, 15)
+    radius = 5
+    visible = compute_fov(room, (7, 7), radius)
+    for y in range(15):
+        for x in range(15):
+            assert visible[y, x] == within((x, y), (7, 7), radius), (x, y)
+
+
+def test_open_room_visibility_is_symmetric():
+    room = open_room(9, 11)
+    radius = 4
+    cells = [(x, y) for y in range(9) for x in range(11)]
+    fov = {cell: compute_fov(room, cell, radius) for cell in cells}
+    for a in cells:
+        for b in cells:
+            assert fov[a][b[1], b[0]] == fov[b][a[1], a[0]], (a, b)
+
+
+def test_walls_block_sight_lines():
+    room = open_room(9, 9)
+    for y in range(9):
+        room[y][5] = True  # Mur plein sur toute la hauteur
+    visible = compute_fov(room, (2, 4), 8)
+    # Le mur lui-même est vu, rien derrière lui
+    assert all(visible[y, 5] for y in range(2, 7))
+    assert not visible[:, 6:].any()
+    assert visible[4, 0] and visible[0, 2]
+
+
+def test_pillar_casts_a_shadow():
+    room = open_room(9, 9)
+    room[4][4] = True
+    visible = compute_fov(room, (2, 4), 8)
+    assert visible[4, 4]
+    assert not visible[4, 5] and not visible[4, 7]
+    assert visible[0, 7] and visible[8, 7]
+
+
+def test_radius_limits_the_view():
+    room = open_room(21, 21)
+    for radius in (1, 3, 6):
+        visible = compute_fov(room, (10, 10), radius)
+        assert visible[10, 10 + radius] and not visible[10, 10 + radius + 1]
+        assert not visible[10 + radius, 10 + radius]
+
+
+def test_set_opaque_invalidates_the_view():
+    grid = [[0] * 7 for _ in range(3)]
+    fog = FogOfWar(cell_step=4)
+    assert fog.update(grid, (0, 1), 8)
+    assert fog.is_visible(6, 1)
+    # Même position et même rayon : pas de recalcul
+    assert not fog.update(grid, (0, 1), 8)
+
+    grid[0][3] = grid[1][3] = grid[2][3] = pygame.Surface((1, 1))
+    for y in range(3):
+        fog.set_opaque((3, y), True)
+    assert fog.opaque == opaque_cells(grid)
+    assert fog.update(grid, (0, 1), 8)
+    assert fog.is_visible(3, 1)
+    assert not fog.is_visible(6, 1)
+    # Déjà vue : reste explorée (voile plus léger)
+    assert fog.explored[1, 6]
+
+    fog.set_opaque((3, 1), False)
+    assert fog.update(grid, (0, 1), 8)
+    assert fog.is_visible(6, 1)
+
+
+def test_new_grid_resets_explored_cells():
+    fog = FogOfWar(cell_step=4)
+    fog.update([[0] * 5 for _ in range(5)], (2, 2), 3)
+    assert fog.explored.any()
+    grid = [[0] * 5 for _ in range(5)]
+    fog.update(grid, (0, 0), 1)
+    assert not fog.explored[4, 4]
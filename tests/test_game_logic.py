@@ -0,0 +1,92 @@
+import pytest
+
+from game_logic import AchievementTracker, compile_achievement_condition, compile_achievements
+
+
+@pytest.mark.parametrize("condition, value, expected", [
+    ("steps < 20", 19, True),
+    ("steps < 20", 20, False),
+    ("time_left > 10", 11, True),
+    ("time_left > 10", 10, False),
+    ("coins_collected >= 5", 5, True),
+    ("level == 3", 3, True),
+    ("level != 3", 3, False),
+    ("time_left <= 2.5", 2.5, True),
+    ("  level>1  ", 2, True),
+])
+def test_compile_condition(condition, value, expected):
+    _, predicate = compile_achievement_condition(condition)
+    assert predicate(value) is expected
+
+
+def test_compile_condition_returns_stat():
+    assert compile_achievement_condition("coins_collected > 5")[0] == "coins_collected"
+
+
+@pytest.mark.parametrize("condition", [
+    "score > 10",                 # Stat inconnue
+    "steps < twenty",             # Seuil non numérique
+    "steps << 20",                # Comparaison inconnue
+    "__import__('os').system('')",
+    "steps < 20 or True",
+    "",
+])
+def test_compile_condition_rejects_invalid(condition):
+    with pytest.raises(ValueError):
+        compile_achievement_condition(condition)
+
+
+def test_compile_achievements_skips_invalid_rules(capsys):
+    rules = compile_achievements({
+        "good": {"condition": "steps < 20"},
+        "bad": {"condition": "steps < twenty"},
+    })
+    assert [rule[0] for rule in rules] == ["good"]
+    assert "Error compiling achievement condition" in capsys.readouterr().out
+
+
+def make_tracker():
+    return AchievementTracker(compile_achievements({
+        "quick_finish": {"condition": "time_left > 10"},
+        "speed_runner": {"condition": "steps < 20"},
+        "coin_collector": {"condition": "coins_collected > 5"},
+    }))
+
+
+def test_tracker_only_evaluates_reported_stats():
+    tracker = make_tracker()
+    # Les pièces sont signalées à chaque ramassage : "steps < 20" n'est pas évalué
+    assert tracker.update(coins_collected=1) == []
+    assert tracker.unlocked == []
+
+
+def test_tracker_unlocks_at_level_finish():
+    tracker = make_tracker()
+    assert tracker.update(level=2, time_left=12, steps=15) == ["quick_finish", "speed_runner"]
+    assert tracker.unlocked == ["quick_finish", "speed_runner"]
+
+
+def test_tracker_does_not_unlock_slow_level():
+    tracker = make_tracker()
+    assert tracker.update(level=2, time_left=4, steps=35) == []
+
+
+def test_tracker_unlocks_each_achievement_once():
+    tracker = make_tracker()
+    assert tracker.update(coins_collected=6) == ["coin_collector"]
+    assert tracker.update(coins_collected=7) == []
+    assert tracker.unlocked == ["coin_collector"]
+
+
+def test_tracker_skips_unchanged_values():
+    tracker = make_tracker()
+    tracker.update(coins_collected=3)
+    # Même valeur : aucune règle n'est réévaluée, même si les règles changent entre-temps
+    tracker.active["coins_collected"] = [("always", "coins_collected", lambda value: True)]
+    assert tracker.update(coins_collected=3) == []
+    assert tracker.update(coins_collected=4) == ["always"]
+
+
+def test_tracker_defaults_to_settings_rules():
+    tracker = AchievementTracker()
+    assert "speed_runner" in tracker.update(level=2, time_left=0, steps=5)
@@ -0,0 +1,84 @@
+import random
+
+import numpy
+
+from flow_field import UNREACHABLE
+from hazards import HazardSwarm, hazard_count
+from settings import HAZARDS
+
+
+def open_grid(rows, cols):
+    return [[0] * cols for _ in range(rows)]
+
+
+def swarm(speed=1.0):
+    return HazardSwarm(cell_step=10, sprite_size=8, speed=speed)
+
+
+def test_chasers_step_downhill_until_they_reach_the_player():
+    random.seed(2)
+    grid = open_grid(12, 12)
+    for y in range(1, 11):
+        grid[y][6] = 1  # Mur à contourner
+    hazards = swarm()
+    player = (0, 0)
+    hazards.reset(grid, 4, player)
+    distance = hazards.flow.distance
+    start = distance[hazards.cells].copy()
+    assert (start >= HAZARDS["spawn_distance"]).all()
+
+    for tick in range(1, int(start.max()) + 1):
+        hazards.update(grid, player, 4)
+        # Un pas par tick à vitesse 1 : la distance baisse de un jusqu'au joueur
+        assert distance[hazards.cells].tolist() == numpy.maximum(start - tick, 0).tolist()
+    assert (hazards.cells == hazards.flow.cell_index(player)).all()
+    assert sorted(hazards.collide(player)) == [0, 1, 2, 3]
+    assert (hazards.flow.distance[hazards.cells] >= HAZARDS["spawn_distance"]).all()
+
+
+def test_slow_chasers_move_once_per_whole_cell():
+    random.seed(4)
+    grid = open_grid(10, 10)
+    hazards = swarm(speed=0.25)
+    hazards.reset(grid, 2, (0, 0))
+    start = hazards.cells.copy()
+    for _ in range(3):
+        hazards.update(grid, (0, 0), 2)
+    assert (hazards.cells == start).all()
+    hazards.update(grid, (0, 0), 2)
+    assert (hazards.flow.distance[hazards.cells] == hazards.flow.distance[start] - 1).all()
+    assert (hazards.previous == start).all()
+
+
+def test_chasers_never_spawn_on_unreachable_cells():
+    random.seed(6)
+    grid = open_grid(10, 10)
+    # Pièce fermée dans un coin : inatteignable depuis le joueur
+    for i in range(4):
+        grid[3][i] = 1
+        grid[i][3] = 1
+    hazards = swarm()
+    hazards.reset(grid, 8, (9, 9))
+    assert hazards.flow.distance[hazards.flow.cell_index((0, 0))] == UNREACHABLE
+    for _ in range(20):
+        hazards.respawn(numpy.arange(8))
+        assert (hazards.flow.distance[hazards.cells] != UNREACHABLE).all()
+
+
+def test_unreachable_player_leaves_chasers_in_place():
+    random.seed(8)
+    grid = open_grid(10, 10)
+    hazards = swarm()
+    hazards.reset(grid, 3, (9, 9))
+    start = hazards.cells.copy()
+    # Le joueur est enfermé : plus aucune case ne mène à lui
+    for cell in ((8, 9), (9, 8)):
+        grid[cell[1]][cell[0]] = 1
+        hazards.flow.set_passable(cell, False)
+    hazards.update(grid, (9, 9), 3)
+    assert (hazards.cells == start).all()
+
+
+def test_hazard_count_is_capped():
+    assert hazard_count(1) == HAZARDS["per_level"]
+    assert hazard_count(1000) == HAZARDS["max"]
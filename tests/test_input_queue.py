@@ -0,0 +1,61 @@
+import pygame
+
+from input_queue import InputQueue
+
+
+def motion(x, y):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y))
+
+
+def click(x, y):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(x, y))
+
+
+def key(code):
+    return pygame.event.Event(pygame.KEYDOWN, key=code)
+
+
+def test_poll_keeps_one_motion_at_its_place():
+    queue = InputQueue()
+    events = [motion(1, 1), click(1, 1), motion(2, 2), motion(3, 3), key(pygame.K_x)]
+    frame = queue.poll(events)
+    assert [event.type for event in frame] == [pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.KEYDOWN]
+    assert frame[1].pos == (3, 3)
+    assert queue.mouse_pos == (3, 3)
+    assert queue.coalesced == 2
+
+
+def test_poll_without_motion():
+    queue = InputQueue()
+    assert queue.poll([key(pygame.K_x)])[0].type == pygame.KEYDOWN
+    assert queue.mouse_pos is None
+
+
+def test_latest_move_wins_and_is_taken_once():
+    queue = InputQueue()
+    queue.poll([])
+    assert queue.push_move(key(pygame.K_UP))
+    assert queue.push_move(key(pygame.K_d))
+    assert not queue.push_move(key(pygame.K_x))
+    assert queue.replaced == 1
+    assert queue.take_move() == (1, 0)
+    assert queue.take_move() is None
+
+
+def test_clear_drops_the_pending_move():
+    queue = InputQueue()
+    queue.push_move(key(pygame.K_LEFT))
+    queue.clear()
+    assert queue.take_move() is None
+
+
+def test_latency_is_recorded_once_presented():
+    queue = InputQueue()
+    assert queue.summary() == "Input p50/95/99: -"
+    queue.poll([click(0, 0)])
+    queue.push_move(key(pygame.K_DOWN))
+    queue.take_move()
+    queue.mark_presented()
+    assert len(queue.latencies) == 2
+    assert queue.percentiles(50)[0] >= 0
+    assert queue.summary().endswith(" ms")
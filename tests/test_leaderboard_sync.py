@@ -0,0 +1,134 @@
+import json
+import time
+
+import pytest
+
+import leaderboard_sync
+from leaderboard_sync import LeaderboardSync, StubLeaderboardServer
+
+
+@pytest.fixture(autouse=True)
+def no_atexit(monkeypatch):
+    # Les clients sont fermés par les tests, pas à la sortie de pytest
+    monkeypatch.setattr(leaderboard_sync.atexit, "register", lambda func: None)
+    monkeypatch.setattr(leaderboard_sync.atexit, "unregister", lambda func: None)
+
+
+@pytest.fixture
+def server():
+    stub = StubLeaderboardServer().start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def open_sync(tmp_path):
+    """Créer des clients LeaderboardSync ; ceux encore ouverts sont fermés à la fin du test."""
+    clients = []
+
+    def factory(url, outbox_file=None, **options):
+        options.setdefault("base_backoff", 0.01)
+        options.setdefault("timeout", 2.0)
+        client = LeaderboardSync(url, outbox_file or str(tmp_path / "outbox.jsonl"), **options)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+def entry(score):
+    return {"score": score, "difficulty": "Normal", "time_played": 60}
+
+
+def read_outbox(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_batches_share_one_keep_alive_connection(tmp_path, server, open_sync):
+    # File déjà remplie au démarrage : 120 scores en lots de 50
+    outbox = tmp_path / "outbox.jsonl"
+    with open(outbox, "w") as f:
+        for i in range(120):
+            f.write(json.dumps(dict(entry(i), id=f"score-{i}")) + "\n")
+    client = open_sync(server.url, batch_size=50)
+    assert client.wait_until_sent(5)
+    assert len(server.scores) == 120
+    assert server.requests == 3
+    assert server.connections == 1
+    assert client.uploaded == 120
+
+
+def test_failed_requests_are_retried(server, open_sync):
+    server.fail_next = 2
+    client = open_sync(server.url)
+    client.submit(entry(100))
+    assert client.wait_until_sent(5)
+    assert server.requests == 3
+    assert [score["score"] for score in server.scores.values()] == [100]
+    assert client.uploaded == 1
+    assert client.failures == 0
+
+
+def test_resent_batch_is_not_counted_twice(server, open_sync):
+    client = open_sync(server.url)
+    client.submit(entry(100))
+    client.submit(entry(200))
+    assert client.wait_until_sent(5)
+
+    # Réponse perdue : le même lot (mêmes identifiants) repart
+    batch = list(server.scores.values())
+    assert client._post(batch) == 200
+    assert len(server.scores) == 2
+    assert len({score["id"] for score in batch}) == 2
+
+
+def test_outbox_is_resumed_by_a_new_client(tmp_path, open_sync):
+    # Serveur injoignable : les scores restent dans la boîte d'envoi
+    down = StubLeaderboardServer()
+    url = down.url
+    down.server.server_close()
+    client = open_sync(url, base_backoff=10.0)
+    client.submit(entry(100))
+    client.submit(entry(200))
+    assert not client.wait_until_sent(0.2)
+    client.close()
+    saved = read_outbox(tmp_path / "outbox.jsonl")
+    assert [score["score"] for score in saved] == [100, 200]
+
+    server = StubLeaderboardServer().start()
+    try:
+        resumed = open_sync(server.url)
+        assert resumed.wait_until_sent(5)
+        assert sorted(server.scores) == sorted(score["id"] for score in saved)
+        resumed.close()
+        assert read_outbox(tmp_path / "outbox.jsonl") == []
+    finally:
+        server.stop()
+
+
+def test_close_does_not_wait_for_a_slow_server(tmp_path, open_sync):
+    server = StubLeaderboardServer(delay=2.0).start()
+    try:
+        client = open_sync(server.url, timeout=5.0)
+        client.submit(entry(100))
+        time.sleep(0.1)  # La requête est partie, la réponse tarde
+        started = time.perf_counter()
+        client.close(timeout=0.2)
+        assert time.perf_counter() - started < 1.0
+        assert [score["score"] for score in read_outbox(tmp_path / "outbox.jsonl")] == [100]
+    finally:
+        server.stop()
+
+
+def test_outbox_write_errors_are_counted(tmp_path, server, open_sync, capsys):
+    # Dossier absent : chaque écriture de la boîte d'envoi échoue
+    client = open_sync(server.url, outbox_file=str(tmp_path / "missing" / "outbox.jsonl"))
+    client.submit(entry(100))
+    assert client.wait_until_sent(5)
+    assert client.thread.is_alive()
+    assert client.uploaded == 1
+    assert client.errors >= 1
+    assert "boîte d'envoi" in capsys.readouterr().out
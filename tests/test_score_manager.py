@@ -0,0 +1,355 @@
+import json
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from score_manager import PERIOD_DAYS, TOP_SIZE, Leaderboard, ScoreIndex, ScoreManager, SQLiteScoreManager, create_score_manager, default_scores_dir
+
+
+@pytest.fixture
+def open_manager(tmp_path):
+    """Ouvrir des ScoreManager sur tmp_path ; ceux encore ouverts sont fermés à la fin du test."""
+    managers = []
+
+    def factory():
+        manager = ScoreManager(str(tmp_path))
+        managers.append(manager)
+        return manager
+
+    yield factory
+    for manager in managers:
+        manager.close()
+
+
+def entry(score, timestamp=None, difficulty="Normal", time_played=60):
+    return {"score": score, "timestamp": time.time() if timestamp is None else timestamp,
+            "difficulty": difficulty, "time_played": time_played}
+
+
+def read_index(tmp_path):
+    with open(tmp_path / "scores_index.json") as f:
+        return json.load(f)
+
+
+def test_legacy_json_is_imported_once(tmp_path, open_manager):
+    with open(tmp_path / "scores.json", "w") as f:
+        json.dump({"scores": [entry(100), entry(300)]}, f)
+    manager = open_manager()
+    assert manager.get_statistics()["games_played"] == 2
+    assert manager.get_best_scores()["all_time"] == 300
+    manager.close()
+
+    # Le fichier historique n'est plus relu une fois le journal créé
+    with open(tmp_path / "scores.json", "w") as f:
+        json.dump({"scores": [entry(900)]}, f)
+    assert open_manager().get_best_scores()["all_time"] == 300
+
+
+def test_saved_scores_reach_log_and_index(tmp_path, open_manager):
+    manager = open_manager()
+    for score in (10, 50, 30):
+        manager.save_score(score, "Normal", 20)
+    manager.flush()
+
+    assert [e["score"] for e in manager.load_entries()] == [10, 50, 30]
+    index = read_index(tmp_path)
+    assert index["log_offset"] == os.path.getsize(tmp_path / "scores.log")
+    assert index["statistics"] == {"games_played": 3, "total_time": 60}
+
+
+def test_save_updates_memory_and_revision_before_disk(open_manager):
+    manager = open_manager()
+    manager.save_score(70, "Hard", 10)
+    # Réponse immédiate, sans attendre le thread d'écriture
+    assert manager.revision == 1
+    assert manager.get_best_scores("Hard")["today"] == 70
+    assert manager.get_best_scores()["all_time"] == 70
+
+
+def test_index_is_rebuilt_from_log_when_missing(tmp_path, open_manager):
+    manager = open_manager()
+    manager.save_score(40, "Easy", 5)
+    manager.save_score(80, "Hard", 5)
+    manager.close()
+    os.remove(tmp_path / "scores_index.json")
+
+    manager = open_manager()
+    assert manager.get_statistics()["games_played"] == 2
+    assert manager.get_best_scores("Easy")["all_time"] == 40
+    assert manager.get_best_scores()["all_time"] == 80
+
+
+def test_unindexed_log_tail_is_replayed(tmp_path, open_manager):
+    open_manager().close()
+    # Lignes écrites après la dernière mise à jour de l'index
+    with open(tmp_path / "scores.log", "a") as f:
+        f.write(json.dumps(entry(500)) + "\n")
+        f.write(json.dumps(entry(200)) + "\n")
+
+    manager = open_manager()
+    assert manager.get_statistics()["games_played"] == 2
+    assert manager.get_best_scores()["all_time"] == 500
+    assert read_index(tmp_path)["log_offset"] == os.path.getsize(tmp_path / "scores.log")
+
+
+def test_torn_last_line_is_truncated(tmp_path, open_manager):
+    manager = open_manager()
+    manager.save_score(100, "Normal", 5)
+    manager.close()
+    complete_size = os.path.getsize(tmp_path / "scores.log")
+    # Écriture interrompue au milieu d'une ligne
+    with open(tmp_path / "scores.log", "a") as f:
+        f.write('{"score": 999, "timest')
+
+    manager = open_manager()
+    assert manager.get_statistics()["games_played"] == 1
+    assert manager.get_best_scores()["all_time"] == 100
+    assert os.path.getsize(tmp_path / "scores.log") == complete_size
+
+    # L'ajout suivant commence sur une ligne neuve
+    manager.save_score(150, "Normal", 5)
+    manager.flush()
+    assert [e["score"] for e in manager.load_entries()] == [100, 150]
+
+
+def test_corrupt_line_is_skipped(tmp_path, open_manager):
+    open_manager().close()
+    with open(tmp_path / "scores.log", "a") as f:
+        f.write("not json\n")
+        f.write(json.dumps(entry(60)) + "\n")
+
+    manager = open_manager()
+    assert manager.get_statistics()["games_played"] == 1
+    assert read_index(tmp_path)["log_offset"] == os.path.getsize(tmp_path / "scores.log")
+
+
+def test_log_shorter_than_index_offset_rebuilds_index(tmp_path, open_manager):
+    manager = open_manager()
+    manager.save_score(100, "Normal", 5)
+    manager.save_score(200, "Normal", 5)
+    manager.close()
+    # Journal remplacé par un plus court : l'index ne correspond plus
+    with open(tmp_path / "scores.log", "w") as f:
+        f.write(json.dumps(entry(30)) + "\n")
+
+    manager = open_manager()
+    assert manager.get_statistics()["games_played"] == 1
+    assert manager.get_best_scores()["all_time"] == 30
+
+
+def test_index_best_scores_by_period():
+    now = time.time()
+    index = ScoreIndex()
+    index.add(100, now - 60 * 86400, "Normal", 1)  # Hors du mois : seulement le record absolu
+    index.add(40, now - 20 * 86400, "Normal", 1)
+    index.add(30, now - 3 * 86400, "Normal", 1)
+    index.add(10, now, "Hard", 1)
+
+    assert index.best_scores(now=now) == {"today": 10, "week": 30, "month": 40, "all_time": 100}
+    assert index.best_scores("Normal", now=now) == {"today": 0, "week": 30, "month": 40, "all_time": 100}
+    assert index.best_scores("Easy", now=now) == {"today": 0, "week": 0, "month": 0, "all_time": 0}
+
+
+def test_index_round_trips_through_json():
+    index = ScoreIndex()
+    index.add(70, time.time(), "Normal", 12)
+    index.log_offset = 123
+    copy = ScoreIndex(json.loads(json.dumps(index.to_json())))
+
+    assert copy.log_offset == 123
+    assert copy.statistics == index.statistics
+    assert copy.best_scores() == index.best_scores()
+    assert copy.best_scores("Normal") == index.best_scores("Normal")
+    # La copie ne partage pas ses statistiques avec l'original
+    copy.add(5, time.time(), "Normal", 1)
+    assert index.statistics["games_played"] == 1
+
+
+def test_default_scores_dir_is_per_user(monkeypatch, tmp_path):
+    monkeypatch.setattr(os, "name", "posix")
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    assert default_scores_dir() == os.path.join(str(tmp_path), "random_blocks")
+    monkeypatch.delenv("XDG_DATA_HOME")
+    assert default_scores_dir().startswith(os.path.expanduser("~"))
+    assert "c:" not in default_scores_dir()
+
+
+def test_create_score_manager_selects_backend(tmp_path):
+    for backend, cls in (("sqlite", SQLiteScoreManager), ("log", ScoreManager)):
+        manager = create_score_manager(str(tmp_path / backend), backend)
+        try:
+            assert type(manager) is cls
+        finally:
+            manager.close()
+
+
+def open_sqlite(tmp_path):
+    return SQLiteScoreManager(str(tmp_path))
+
+
+def test_sqlite_imports_legacy_json_once(tmp_path):
+    with open(tmp_path / "scores.json", "w") as f:
+        json.dump({"scores": [entry(100, difficulty="Easy"), entry(300, time_played=30)]}, f)
+    manager = open_sqlite(tmp_path)
+    try:
+        assert manager.get_statistics() == {"games_played": 2, "total_time": 90}
+        assert manager.get_best_scores("Easy")["today"] == 100
+        assert manager.get_best_scores()["all_time"] == 300
+    finally:
+        manager.close()
+
+    # Réouverture : pas de second import
+    manager = open_sqlite(tmp_path)
+    try:
+        assert manager.get_statistics()["games_played"] == 2
+        assert len(manager.load_entries()) == 2
+    finally:
+        manager.close()
+
+
+def test_sqlite_prefers_the_log_over_legacy_json(tmp_path, open_manager):
+    with open(tmp_path / "scores.json", "w") as f:
+        json.dump({"scores": [entry(999)]}, f)
+    log_manager = open_manager()  # Importe scores.json dans le journal
+    log_manager.save_score(50, "Hard", 10)
+    log_manager.close()
+
+    manager = open_sqlite(tmp_path)
+    try:
+        assert sorted(e["score"] for e in manager.load_entries()) == [50, 999]
+        assert manager.get_best_scores() == log_manager.get_best_scores()
+        assert manager.get_best_scores("Hard") == log_manager.get_best_scores("Hard")
+        assert manager.get_statistics() == log_manager.get_statistics()
+    finally:
+        manager.close()
+
+
+def test_sqlite_scores_survive_reopening(tmp_path):
+    manager = open_sqlite(tmp_path)
+    try:
+        manager.save_score(120, "Normal", 15)
+        manager.save_score(80, "Hard", 15)
+        assert manager.get_best_scores()["today"] == 120
+    finally:
+        manager.close()
+
+    manager = open_sqlite(tmp_path)
+    try:
+        assert manager.get_statistics() == {"games_played": 2, "total_time": 30}
+        assert manager.get_best_scores("Hard") == {"today": 80, "week": 80, "month": 80, "all_time": 80}
+    finally:
+        manager.close()
+
+
+def test_sqlite_index_keeps_only_the_last_month_of_days(tmp_path):
+    now = time.time()
+    with open(tmp_path / "scores.json", "w") as f:
+        json.dump({"scores": [entry(500, now - 90 * 86400), entry(70, now - 10 * 86400)]}, f)
+    manager = open_sqlite(tmp_path)
+    try:
+        assert manager.get_best_scores() == {"today": 0, "week": 0, "month": 70, "all_time": 500}
+    finally:
+        manager.close()
+
+
+def test_sqlite_reads_do_not_share_the_writer_connection(tmp_path):
+    manager = open_sqlite(tmp_path)
+    try:
+        assert manager.read_connection is not manager.connection
+        # Lectures du thread de jeu pendant que le thread d'écriture insère
+        for i in range(200):
+            manager.save_score(i, "Normal", 1)
+            if i % 20 == 0:
+                assert len(manager.load_entries()) <= i + 1
+        leaderboard = manager.get_leaderboard()
+        assert leaderboard.top_scores(1)[0]["score"] == 199
+        assert len(manager.load_entries()) == 200
+    finally:
+        manager.close()
+
+
+def midnight(days_ago):
+    """Début (heure locale) du jour `days_ago` jours avant aujourd'hui."""
+    return datetime.combine(date.today() - timedelta(days=days_ago), datetime.min.time()).timestamp()
+
+
+def reference_top(entries, n, difficulty=None, period="all_time"):
+    """Top n par tri complet : meilleur score d'abord, puis le plus ancien, puis l'ordre d'ajout."""
+    today = date.today().toordinal()
+    selected = [e for e in entries
+                if (difficulty is None or e["difficulty"] == difficulty)
+                and (period == "all_time"
+                     or today - datetime.fromtimestamp(e["timestamp"]).date().toordinal() <= PERIOD_DAYS[period])]
+    return sorted(selected, key=lambda e: (-e["score"], e["timestamp"]))[:n]
+
+
+def reference_percentile(entries, score, difficulty=None):
+    scores = [e["score"] for e in entries if difficulty is None or e["difficulty"] == difficulty]
+    return 100.0 * sum(1 for s in scores if s < score) / len(scores) if scores else 100.0
+
+
+def test_leaderboard_matches_a_sorted_reference():
+    rng = random.Random(11)
+    now = time.time()
+    # Peu de valeurs distinctes : beaucoup d'égalités
+    entries = [entry(rng.randrange(0, 40) * 10, now - rng.uniform(0, 45 * 86400),
+                     rng.choice(["Easy", "Normal", "Hard"])) for _ in range(600)]
+    bulk = Leaderboard(entries)
+    incremental = Leaderboard()
+    for e in entries:
+        incremental.add(e)
+
+    for leaderboard in (bulk, incremental):
+        for difficulty in (None, "Easy", "Normal", "Hard"):
+            for period in ("today", "week", "month", "all_time"):
+                for n in (1, 10, TOP_SIZE):
+                    assert leaderboard.top_scores(n, difficulty, period) == reference_top(entries, n, difficulty, period)
+            for score in (0, 5, 150, 390, 400):
+                assert leaderboard.percentile_rank(score, difficulty) == pytest.approx(
+                    reference_percentile(entries, score, difficulty))
+
+
+def test_leaderboard_ties_keep_the_oldest_first():
+    now = time.time()
+    first, second, third = entry(50, now - 30), entry(50, now - 20), entry(50, now - 20)
+    leaderboard = Leaderboard([third, first])
+    leaderboard.add(second)
+    # Même score : le plus ancien d'abord, puis l'ordre d'ajout
+    assert leaderboard.top_scores(3) == [first, third, second]
+    assert leaderboard.top_scores(3, period="today") == [first, third, second]
+    assert leaderboard.percentile_rank(50) == 0.0
+
+
+def test_leaderboard_empty_periods():
+    leaderboard = Leaderboard([entry(300, midnight(40), "Hard")])
+    assert leaderboard.top_scores(5, "Hard", "today") == []
+    assert leaderboard.top_scores(5, "Hard", "month") == []
+    assert leaderboard.top_scores(5, "Easy") == []
+    assert [e["score"] for e in leaderboard.top_scores(5, "Hard")] == [300]
+    assert Leaderboard().top_scores(5, period="week") == []
+    assert Leaderboard().percentile_rank(100) == 100.0
+
+
+def test_leaderboard_period_boundaries():
+    week_start = entry(200, midnight(PERIOD_DAYS["week"]))
+    before_week = entry(300, midnight(PERIOD_DAYS["week"]) - 1)
+    month_start = entry(400, midnight(PERIOD_DAYS["month"]))
+    before_month = entry(500, midnight(PERIOD_DAYS["month"]) - 1)
+    today = entry(100, midnight(0))
+    leaderboard = Leaderboard([week_start, before_week, month_start, before_month, today])
+    assert leaderboard.top_scores(10, period="today") == [today]
+    assert leaderboard.top_scores(10, period="week") == [week_start, today]
+    assert leaderboard.top_scores(10, period="month") == [month_start, before_week, week_start, today]
+    assert leaderboard.top_scores(10)[0] == before_month
+
+
+def test_percentile_of_best_and_worst_scores():
+    entries = [entry(score) for score in (10, 20, 30, 40, 50)]
+    leaderboard = Leaderboard(entries)
+    assert leaderboard.percentile_rank(10) == 0.0
+    assert leaderboard.percentile_rank(50) == 80.0
+    assert leaderboard.percentile_rank(51) == 100.0
+    assert leaderboard.percentile_rank(0) == 0.0
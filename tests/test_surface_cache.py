@@ -0,0 +1,77 @@
+import gc
+
+import pygame
+
+from surface_cache import SurfaceCache, SurfaceCacheManager, surface_bytes
+
+
+def surface(width, height=10):
+    # 4 octets par pixel : 10 x 10 = 400 octets
+    return pygame.Surface((width, height), pygame.SRCALPHA)
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = SurfaceCache("test", 1000)
+    cache.put("a", surface(10))
+    cache.put("b", surface(10))
+    assert cache.get("a") is not None  # "b" devient la plus ancienne
+    cache.put("c", surface(10))
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_byte_total_after_replacement_and_eviction():
+    cache = SurfaceCache("test", 2000)
+    cache.put("a", surface(10))
+    assert cache.current_bytes == 400
+    cache.put("a", surface(20))  # Remplacée : l'ancienne taille est retirée
+    assert cache.current_bytes == 800 and len(cache) == 1
+    cache.put("b", surface(30))
+    assert cache.current_bytes == 2000
+    cache.put("c", surface(10))
+    assert list(cache.entries) == ["b", "c"]
+    assert cache.current_bytes == sum(surface_bytes(entry[0]) for entry in cache.entries.values()) == 1600
+    cache.clear()
+    assert cache.current_bytes == 0 and len(cache) == 0
+
+
+def test_oversized_surface_is_not_cached():
+    cache = SurfaceCache("test", 1000)
+    cache.put("a", surface(10))
+    big = surface(100)
+    assert cache.put("big", big) is big
+    assert "big" not in cache and "a" in cache
+    assert cache.current_bytes == 400
+
+
+def test_global_cap_evicts_the_least_recently_used_cache():
+    manager = SurfaceCacheManager(max_total_bytes=1200)
+    icons = manager.create_cache("icons", 1000)
+    panels = manager.create_cache("panels", 2000)
+    icons.put("a", surface(10))
+    icons.put("b", surface(10))
+    panels.put("c", surface(10))
+    icons.get("b")
+    panels.get("c")
+    # "a" est l'entrée la plus ancienne de tous les caches
+    panels.put("d", surface(10))
+    assert list(icons.entries) == ["b"] and list(panels.entries) == ["c", "d"]
+    assert manager.total_bytes() == 1200
+    # Puis "b" (icons), moins récemment utilisée que "c" et "d"
+    panels.put("e", surface(10))
+    assert len(icons) == 0 and list(panels.entries) == ["c", "d", "e"]
+    assert manager.total_bytes() <= manager.max_total_bytes
+
+
+def test_manager_forgets_deleted_caches():
+    manager = SurfaceCacheManager()
+    cache = manager.create_cache("temporary", 1000)
+    cache.put("a", surface(10))
+    assert manager.total_bytes() == 400
+    assert [stats["name"] for stats in manager.stats()] == ["temporary"]
+    del cache
+    gc.collect()
+    assert manager.total_bytes() == 0
+    assert manager.stats() == []
@@ -0,0 +1,64 @@
+import pygame
+
+from ui_enhancements import UIEffects
+
+
+def tile():
+    surface = pygame.Surface((8, 8))
+    surface.fill((90, 60, 30))
+    return surface
+
+
+def cell_color(minimap, grid, x, y, size):
+    # Centre de la case (x, y) dans la zone de grille (marge de 5 pixels)
+    cell_width = (size - 10) / len(grid[0])
+    cell_height = (size - 10) / len(grid)
+    return tuple(minimap.get_at((int(5 + (x + 0.5) * cell_width), int(5 + (y + 0.5) * cell_height))))[:3]
+
+
+def test_minimap_bakes_tile_walls_like_int_walls():
+    # Grille de game_logic.generate_map : murs en tuiles Surface, quelques 1, routes à 0
+    wall = tile()
+    grid = [
+        [0, wall, 0, 0],
+        [0, wall, 1, 0],
+        [0, 0, 0, 0],
+    ]
+    size = 90
+    effects = UIEffects(800, 600)
+    base = effects.get_minimap_base(size, size, grid, (0, 2), (3, 0))
+    wall_color = (52, 152, 219)
+    assert cell_color(base, grid, 1, 0, size) == wall_color
+    assert cell_color(base, grid, 1, 1, size) == wall_color
+    assert cell_color(base, grid, 2, 1, size) == wall_color
+    assert cell_color(base, grid, 2, 2, size) != wall_color
+
+
+def test_draw_minimap_draws_on_the_target_without_copying_the_base():
+    grid = [[0, tile(), 0], [0, 0, 0], [0, 0, 0]]
+    size = 70
+    effects = UIEffects(800, 600)
+    screen = pygame.Surface((200, 200))
+    screen.fill((1, 2, 3))
+    effects.draw_minimap(screen, (100, 50), size, size, (2, 2), grid, (0, 0), (2, 0))
+    base = effects.minimap_base
+    # Base blittée en (100, 50) : le mur de la case (1, 0) est à l'écran, hors de la base rien ne change
+    assert cell_color(screen.subsurface((100, 50, size, size)), grid, 1, 0, size) == (52, 152, 219)
+    assert tuple(screen.get_at((99, 49)))[:3] == (1, 2, 3)
+    assert tuple(screen.get_at((170, 120)))[:3] == (1, 2, 3)
+    # Point du joueur sur la case (2, 2), dessiné sur l'écran et pas dans la base mise en cache
+    assert cell_color(screen.subsurface((100, 50, size, size)), grid, 2, 2, size) == (255, 255, 255)
+    assert cell_color(base, grid, 2, 2, size) != (255, 255, 255)
+    effects.draw_minimap(screen, (100, 50), size, size, (0, 1), grid, (0, 0), (2, 0))
+    assert effects.minimap_base is base
+    assert screen.get_clip() == screen.get_rect()
+
+
+
+def test_minimap_base_is_reused_until_invalidated():
+    grid = [[0, tile()], [0, 0]]
+    effects = UIEffects(800, 600)
+    base = effects.get_minimap_base(60, 60, grid, (0, 0), (1, 1))
+    assert effects.get_minimap_base(60, 60, grid, (0, 0), (1, 1)) is base
+    effects.invalidate_minimap()
+    assert effects.get_minimap_base(60, 60, grid, (0, 0), (1, 1)) is not base
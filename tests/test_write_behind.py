@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+
+import write_behind
+from score_manager import ScoreManager
+from write_behind import WriteBehindWorker
+
+
+class FakeAtexit:
+    """Remplace le module atexit : garde les fonctions enregistrées sans les appeler."""
+    def __init__(self):
+        self.callbacks = []
+
+    def register(self, func):
+        self.callbacks.append(func)
+
+    def unregister(self, func):
+        self.callbacks = [callback for callback in self.callbacks if callback != func]
+
+    def run(self):
+        for callback in list(self.callbacks):
+            callback()
+
+
+@pytest.fixture
+def fake_atexit(monkeypatch):
+    fake = FakeAtexit()
+    monkeypatch.setattr(write_behind, "atexit", fake)
+    return fake
+
+
+def test_flush_waits_for_submitted_items(fake_atexit):
+    written = []
+    worker = WriteBehindWorker(written.extend)
+    try:
+        for i in range(100):
+            worker.submit(i)
+        worker.flush()
+        assert written == list(range(100))
+        assert worker.batches >= 1
+    finally:
+        worker.close()
+
+
+def test_items_are_written_in_batches(fake_atexit):
+    release = threading.Event()
+    batches = []
+
+    def write_batch(items):
+        release.wait(5)
+        batches.append(list(items))
+
+    worker = WriteBehindWorker(write_batch, max_batch=10)
+    try:
+        for i in range(25):
+            worker.submit(i)
+        release.set()
+        worker.flush()
+        # Le premier lot part seul, les suivants regroupent la file accumulée
+        assert [item for batch in batches for item in batch] == list(range(25))
+        assert all(len(batch) <= 10 for batch in batches)
+        assert len(batches) < 25
+    finally:
+        worker.close()
+
+
+def test_close_drains_pending_writes(fake_atexit):
+    release = threading.Event()
+    written = []
+
+    def write_batch(items):
+        release.wait(5)
+        written.extend(items)
+
+    worker = WriteBehindWorker(write_batch)
+    for i in range(20):
+        worker.submit(i)
+    release.set()
+    worker.close()
+    assert written == list(range(20))
+    assert not worker.thread.is_alive()
+    with pytest.raises(RuntimeError):
+        worker.submit(99)
+
+
+def test_pending_writes_are_flushed_at_exit(fake_atexit):
+    written = []
+    worker = WriteBehindWorker(written.extend)
+    assert worker.close in fake_atexit.callbacks
+    worker.submit("a")
+    worker.submit("b")
+
+    # Fin du programme sans close() explicite
+    fake_atexit.run()
+    assert written == ["a", "b"]
+    assert not worker.thread.is_alive()
+
+
+def test_close_unregisters_the_exit_hook(fake_atexit):
+    worker = WriteBehindWorker(lambda items: None)
+    worker.close()
+    worker.close()  # Sans effet une seconde fois
+    assert fake_atexit.callbacks == []
+
+
+def test_errors_are_counted_and_the_worker_keeps_going(fake_atexit, capsys):
+    written = []
+
+    def write_batch(items):
+        if "bad" in items:
+            raise OSError("disque plein")
+        written.extend(items)
+
+    worker = WriteBehindWorker(write_batch)
+    try:
+        worker.submit("bad")
+        worker.flush()
+        worker.submit("good")
+        worker.flush()
+        assert worker.errors == 1
+        assert written == ["good"]
+        assert "disque plein" in capsys.readouterr().out
+    finally:
+        worker.close()
+
+
+def test_score_manager_close_persists_pending_scores(tmp_path, fake_atexit):
+    manager = ScoreManager(str(tmp_path))
+    for score in (10, 30, 20):
+        manager.save_score(score, "Normal", 5)
+    manager.close()
+
+    reopened = ScoreManager(str(tmp_path))
+    try:
+        assert reopened.get_statistics() == {"games_played": 3, "total_time": 15}
+        assert reopened.get_best_scores()["all_time"] == 30
+        assert reopened.writer.errors == 0
+    finally:
+        reopened.close()